@@ -1,7 +1,15 @@
+import logging
+import signal
+import time
+
 from sora.config.config import Config
 from sora.config.styling import parse_style_sheet
+from sora.config.watcher import StyleWatcher
+from sora.utils.worker import submit
+from sora.widgets.bind import Variable
+from sora.window import Window
 
-from gi.repository import Gtk, Gdk
+from gi.repository import GLib, Gtk, Gdk
 
 
 class App:
@@ -9,37 +17,174 @@ class App:
     The main application.
     """
 
+    __css_provider: Gtk.CssProvider | None = None
+    __style_watcher: StyleWatcher | None = None
+    __style_generation: int = 0
+
     def __init__(
         self,
         config: Config,
+        style_cache: bool = True,
+        watch_styles: bool = True,
     ):
         """
         Creates a new App.
 
         :param config: The config to use.
+        :param style_cache: Whether to use the cache for compiled SCSS.
+        :param watch_styles: Whether to reload the styles when the style sheet changes.
         """
 
         self.config = config
+        self.style_cache = style_cache
 
         self.__load_styles()
 
+        if watch_styles:
+            self.__style_watcher = StyleWatcher(
+                self.config.path.parent, self.__on_styles_changed
+            )
+
         for window in config.windows:
             window.show()
 
+        GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGHUP, self.__on_sighup)
+
     def __load_styles(self):
         """
-        Loads the styles.
+        Loads the styles. Pending compiles of older style sheets are dropped.
+        """
+
+        self.__style_generation += 1
+        self.__apply_styles(
+            parse_style_sheet(self.config.path.parent, self.style_cache)
+        )
+
+    def __apply_styles(self, css: str | None) -> bool:
+        """
+        Replaces the previously loaded styles.
+        The new provider is added before the old one is removed, so that both changes are applied at once.
+        When the CSS cannot be parsed, the previous styles are kept.
+
+        :param css: The CSS to apply.
+        :return: Whether the styles were replaced.
         """
 
-        if css := parse_style_sheet(self.config.path):
+        css_provider = None
+
+        if css:
             css_provider = Gtk.CssProvider()
-            css_provider.load_from_data(css.encode())
-            context = Gtk.StyleContext()
-            screen = Gdk.Screen.get_default()
-            context.add_provider_for_screen(
+            try:
+                css_provider.load_from_data(css.encode())
+            except GLib.Error as e:
+                logging.error(f"Failed to load styles, keeping the previous ones: {e}")
+                return False
+
+        screen = Gdk.Screen.get_default()
+        old_provider = self.__css_provider
+
+        if css_provider:
+            Gtk.StyleContext.add_provider_for_screen(
                 screen, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
             )
 
+        self.__css_provider = css_provider
+
+        if old_provider:
+            Gtk.StyleContext.remove_provider_for_screen(screen, old_provider)
+
+        return True
+
+    def __on_styles_changed(self):
+        """
+        Compiles the changed style sheet on the worker pool and applies it.
+        Compiles can finish out of order, so results of older compiles are dropped.
+        """
+
+        self.__style_generation += 1
+        generation = self.__style_generation
+
+        def compile():
+            start = time.perf_counter()
+            css = parse_style_sheet(self.config.path.parent, self.style_cache)
+            return (css, time.perf_counter() - start)
+
+        def apply(result: tuple[str | None, float]):
+            (css, compile_time) = result
+
+            if generation != self.__style_generation:
+                logging.debug("Dropping styles of an outdated compile.")
+                return
+
+            start = time.perf_counter()
+            if not self.__apply_styles(css):
+                return
+            apply_time = time.perf_counter() - start
+
+            logging.info(
+                f"Reloaded styles (compiled in {compile_time * 1000:.1f}ms, "
+                f"applied in {apply_time * 1000:.1f}ms)."
+            )
+
+        submit(compile, apply)
+
+    def __on_sighup(self):
+        """
+        Reloads the config when SIGHUP is received.
+        """
+
+        self.reload()
+        return GLib.SOURCE_CONTINUE
+
+    def reload(self):
+        """
+        Reloads the config and the styles.
+        Windows are matched by name and only recreated when their definition has changed.
+        Running polling and listening variables are reused by the new config where possible.
+        """
+
+        old_windows: dict[str, Window] = {
+            window.get_name(): window for window in self.config.windows
+        }
+        old_definitions = {
+            name: window.definition() for name, window in old_windows.items()
+        }
+
+        Variable.begin_reload()
+
+        try:
+            self.config.reload()
+        except Exception as e:
+            Variable.end_reload(stop_unused=False)
+            logging.error(f"Failed to reload config: {e}")
+            return
+
+        windows: list[Window] = []
+        for window in self.config.windows:
+            name = window.get_name()
+            old = old_windows.pop(name, None)
+
+            if old and old_definitions[name] == window.definition():
+                window.destroy()
+                windows.append(old)
+                continue
+
+            if old:
+                old.destroy()
+
+            window.show()
+            windows.append(window)
+            logging.info(f"Recreated window '{name}'.")
+
+        for old in old_windows.values():
+            old.destroy()
+
+        self.config.windows = windows
+        Variable.end_reload()
+
+        self.__load_styles()
+        logging.info("Reloaded config.")
+
     def run(self):
         """
         Runs the application.
@@ -17,15 +17,23 @@ def run(options: Namespace):
 
     from sora.app import App
     from sora.config.config import Config
+    from sora.config.styling import clear_style_cache
 
     logging.basicConfig()
     logging.getLogger().setLevel(logging.DEBUG)
 
+    if options.clear_style_cache:
+        clear_style_cache()
+
     config_path = Path(options.config)
     config = Config(config_path)
 
     try:
-        app = App(config)
+        app = App(
+            config,
+            style_cache=options.style_cache,
+            watch_styles=options.watch_styles,
+        )
 
         app.run()
     except KeyboardInterrupt:
@@ -50,4 +58,24 @@ def subcommand(subparsers):
         default=get_config_path(),
     )
 
+    cmd.add_argument(
+        "--style-cache",
+        help="Cache the compiled SCSS style sheet. (default: enabled)",
+        action=BooleanOptionalAction,
+        default=True,
+    )
+
+    cmd.add_argument(
+        "--watch-styles",
+        help="Reload the styles when the style sheet changes. (default: enabled)",
+        action=BooleanOptionalAction,
+        default=True,
+    )
+
+    cmd.add_argument(
+        "--clear-style-cache",
+        help="Clear the cached SCSS style sheets before starting.",
+        action="store_true",
+    )
+
     cmd.set_defaults(func=run)
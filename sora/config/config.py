@@ -1,5 +1,6 @@
 import sys
 from pathlib import Path
+from types import ModuleType
 import importlib
 
 from sora.window import Window
@@ -40,15 +41,72 @@ class Config:
 
         name = self.path.stem
 
-        sys.path.insert(0, self.path.parent.as_posix())
+        if self.path.parent.as_posix() not in sys.path:
+            sys.path.insert(0, self.path.parent.as_posix())
 
-        # TODO: implement reloading
         config = importlib.import_module(name)
+        self.__apply(config)
+
+    def reload(self):
+        """
+        Reloads the config python module and all modules imported from the config directory.
+        """
+
+        if not self.path.exists():
+            raise ConfigError(f"{self.path} does not exists")
+
+        if self.path.stem not in sys.modules:
+            return self.load()
+
+        # Reloading the modules one by one would keep names imported from modules that are
+        # reloaded later (e.g. "from helpers import f"), so all of them are imported fresh instead.
+        modules = {
+            name: module
+            for name, module in list(sys.modules.items())
+            if self.__is_config_module(module)
+        }
+        for name in modules:
+            del sys.modules[name]
+
+        importlib.invalidate_caches()
+
+        try:
+            config = importlib.import_module(self.path.stem)
+        except BaseException:
+            # Keep the previous modules, so that the running config stays intact.
+            for name, module in list(sys.modules.items()):
+                if self.__is_config_module(module):
+                    del sys.modules[name]
+
+            sys.modules.update(modules)
+            raise
+
+        self.__apply(config)
+
+    def __is_config_module(self, module: ModuleType) -> bool:
+        """
+        Checks whether a module was loaded from the config directory.
+
+        :param module: The module to check.
+        :return: Whether the module is located in the config directory.
+        """
+
+        file = getattr(module, "__file__", None)
+        if not file:
+            return False
+
+        return Path(file).resolve().is_relative_to(self.path.parent.resolve())
+
+    def __apply(self, config: ModuleType):
+        """
+        Sets the config keys from the config python module.
+
+        :param config: The config python module.
+        """
 
         for key in self.__annotations__.keys():
             try:
                 value = vars(config)[key]
                 setattr(self, key, value)
             except KeyError:
-                if getattr(self, key, None) is None:
-                    raise ConfigError(f"Required key '{key}' not set.")
+                raise ConfigError(f"Required key '{key}' not set.")
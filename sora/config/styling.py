@@ -1,18 +1,42 @@
+import hashlib
+import logging
 from pathlib import Path
+import tempfile
 import sass
 import re
 import os
 
+from sora.config.utils import get_cache_path
 
-def parse_scss(scss: str):
+IMPORT_PATTERN = re.compile(r"@(?:import|use|forward)\s+([^;]+);")
+"""
+Matches SCSS import rules.
+"""
+
+IMPORT_NAME_PATTERN = re.compile(r"[\"']([^\"']+)[\"']")
+"""
+Matches the quoted names of an import rule.
+"""
+
+MAX_CACHED_STYLE_SHEETS = 16
+"""
+The maximum number of compiled style sheets kept in the cache. The least recently used are removed first.
+"""
+
+
+def parse_scss(scss: str, include_paths: list[Path] | None = None):
     """
     Parses a SCSS string to CSS.
 
     :param scss: The SCSS string to parse.
+    :param include_paths: The paths to resolve imports from.
     :return: The parsed CSS string.
     """
 
-    return sass.compile(string=scss)
+    return sass.compile(
+        string=scss,
+        include_paths=[path.as_posix() for path in include_paths or []],
+    )
 
 
 def __replace_env(content: str) -> str:
@@ -26,12 +50,169 @@ def __replace_env(content: str) -> str:
     return re.sub("env\((.+)\)", lambda v: os.getenv(v.group(1)), content)
 
 
-def parse_style_sheet(path: Path):
+def __resolve_import(name: str, directory: Path) -> Path | None:
+    """
+    Resolves the file of an imported SCSS partial.
+
+    :param name: The imported name (e.g. "colors" or "widgets/bar").
+    :param directory: The directory of the importing file.
+    :return: The path of the partial or None.
+    """
+
+    path = directory.joinpath(name)
+    candidates = [path, path.with_name(f"_{path.name}")]
+
+    if path.suffix not in [".scss", ".sass", ".css"]:
+        candidates = [
+            path.with_name(f"{prefix}{path.name}{suffix}")
+            for suffix in [".scss", ".sass", ".css"]
+            for prefix in ["_", ""]
+        ] + [path.joinpath("_index.scss"), path.joinpath("index.scss")]
+
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+
+    return None
+
+
+def find_imports(scss: str, directory: Path) -> list[Path]:
+    """
+    Finds all partials imported by a SCSS string, including nested imports.
+
+    :param scss: The SCSS string.
+    :param directory: The directory to resolve imports from.
+    :return: The paths of the imported partials.
+    """
+
+    found: list[Path] = []
+    pending = [(scss, directory)]
+
+    while pending:
+        (content, parent) = pending.pop()
+
+        for rule in IMPORT_PATTERN.findall(content):
+            for name in IMPORT_NAME_PATTERN.findall(rule):
+                path = __resolve_import(name, parent)
+                if not path or path in found:
+                    continue
+
+                found.append(path)
+                pending.append((path.read_text(encoding="utf-8"), path.parent))
+
+    return found
+
+
+def __cache_key(scss: str, partials: list[Path]) -> str:
+    """
+    Computes the cache key of a SCSS string from its content and the content of all imported partials.
+
+    :param scss: The SCSS string with the replaced environment variables.
+    :param partials: The imported partials.
+    :return: The cache key.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(sass.__version__.encode())
+    digest.update(scss.encode())
+
+    for partial in sorted(partials):
+        digest.update(partial.as_posix().encode())
+        digest.update(partial.read_bytes())
+
+    return digest.hexdigest()
+
+
+def __compile_cached(scss: str, directory: Path) -> str:
+    """
+    Parses a SCSS string to CSS using the on-disk cache.
+
+    :param scss: The SCSS string with the replaced environment variables.
+    :param directory: The directory to resolve imports from.
+    :return: The parsed CSS string.
+    """
+
+    cache_file = get_cache_path().joinpath(
+        f"{__cache_key(scss, find_imports(scss, directory))}.css"
+    )
+
+    if cache_file.exists():
+        try:
+            css = cache_file.read_text(encoding="utf-8")
+            # Mark the entry as recently used, so that it is evicted last.
+            os.utime(cache_file)
+            logging.debug(f"Using cached style sheet {cache_file}")
+            return css
+        except (OSError, UnicodeDecodeError) as e:
+            logging.warning(f"Ignoring unreadable cached style sheet {cache_file}: {e}")
+
+    css = parse_scss(scss, [directory])
+
+    file = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=cache_file.parent,
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            file.write(css)
+
+        os.replace(file.name, cache_file)
+        __evict_cache(cache_file.parent)
+    except OSError as e:
+        logging.warning(f"Failed to cache style sheet: {e}")
+        if file:
+            Path(file.name).unlink(missing_ok=True)
+
+    return css
+
+
+def __evict_cache(cache_path: Path):
+    """
+    Removes the least recently used style sheets that exceed MAX_CACHED_STYLE_SHEETS.
+
+    :param cache_path: The cache directory.
+    """
+
+    files = []
+    for file in cache_path.glob("*.css"):
+        try:
+            files.append((file.stat().st_mtime, file))
+        except OSError:
+            pass
+
+    files.sort(reverse=True)
+
+    for _, file in files[MAX_CACHED_STYLE_SHEETS:]:
+        try:
+            file.unlink(missing_ok=True)
+        except OSError as e:
+            logging.warning(f"Failed to evict cached style sheet {file}: {e}")
+
+
+def clear_style_cache():
+    """
+    Removes all cached style sheets.
+    """
+
+    cache_path = get_cache_path()
+    if not cache_path.exists():
+        return
+
+    for file in cache_path.glob("*.css"):
+        file.unlink(missing_ok=True)
+
+
+def parse_style_sheet(path: Path, use_cache: bool = True):
     """
     Parses the style sheet at the given path.
     Either CSS or SCSS.
 
     :param path: The path to the style sheet.
+    :param use_cache: Whether to use the cache for compiled SCSS.
     :return: The parsed style sheet.
     """
 
@@ -53,6 +234,10 @@ def parse_style_sheet(path: Path):
             scss = file.read()
 
         scss = __replace_env(scss)
-        return parse_scss(scss)
+
+        if use_cache:
+            return __compile_cached(scss, path)
+
+        return parse_scss(scss, [path])
 
     return None
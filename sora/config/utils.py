@@ -9,3 +9,12 @@ def get_config_path():
 
     user_config = Path(os.getenv("XDG_CONFIG_HOME", "~/.config")).expanduser()
     return user_config.joinpath("sora")
+
+
+def get_cache_path():
+    """
+    Gets the path to the cache directory.
+    """
+
+    user_cache = Path(os.getenv("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    return user_cache.joinpath("sora")
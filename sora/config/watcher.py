@@ -0,0 +1,113 @@
+import logging
+from pathlib import Path
+from typing import Callable
+
+from gi.repository import GLib, Gio
+
+from sora.config.styling import find_imports
+
+DEBOUNCE_MS = 200
+"""
+The time in milliseconds to wait for further changes before the callback is called.
+"""
+
+STYLE_FILES = ["style.css", "style.scss"]
+"""
+The style sheet file names in the config directory.
+"""
+
+
+class StyleWatcher:
+    """
+    Watches the style sheet and all imported partials for changes.
+    """
+
+    def __init__(self, path: Path, on_change: Callable[[], None]):
+        """
+        Creates a new StyleWatcher and starts watching.
+
+        :param path: The config directory.
+        :param on_change: The function to call after the style sheet has changed.
+        """
+
+        self.path = path
+        self.__on_change = on_change
+        self.__files: set[Path] = set()
+        self.__monitors: dict[Path, Gio.FileMonitor] = {}
+        self.__timeout_id: int | None = None
+
+        self.__update_files()
+
+    def __update_files(self):
+        """
+        Collects the files to watch and monitors their directories.
+        """
+
+        files = {self.path.joinpath(name) for name in STYLE_FILES}
+
+        scss_file = self.path.joinpath("style.scss")
+        if scss_file.exists():
+            try:
+                scss = scss_file.read_text(encoding="utf-8")
+                files.update(find_imports(scss, self.path))
+            except OSError as e:
+                logging.warning(f"Failed to find imported style sheets: {e}")
+
+        self.__files = {file.resolve() for file in files}
+
+        directories = {file.parent for file in self.__files}
+        for directory in list(self.__monitors.keys()):
+            if directory not in directories:
+                self.__monitors.pop(directory).cancel()
+
+        for directory in directories - self.__monitors.keys():
+            monitor = Gio.File.new_for_path(directory.as_posix()).monitor_directory(
+                Gio.FileMonitorFlags.WATCH_MOVES, None
+            )
+            monitor.connect("changed", self.__on_file_changed)
+            self.__monitors[directory] = monitor
+
+    def __on_file_changed(
+        self,
+        _monitor: Gio.FileMonitor,
+        file: Gio.File,
+        other_file: Gio.File | None,
+        _event: Gio.FileMonitorEvent,
+    ):
+        """
+        Called when a file in a watched directory has changed.
+        Restarts the debounce timeout when the file is a watched file.
+        """
+
+        paths = [f.get_path() for f in [file, other_file] if f and f.get_path()]
+        if not any(Path(path).resolve() in self.__files for path in paths):
+            return
+
+        if self.__timeout_id:
+            GLib.source_remove(self.__timeout_id)
+
+        self.__timeout_id = GLib.timeout_add(DEBOUNCE_MS, self.__on_timeout)
+
+    def __on_timeout(self):
+        """
+        Called when no further changes have happened during the debounce time.
+        """
+
+        self.__timeout_id = None
+        self.__update_files()
+        self.__on_change()
+        return GLib.SOURCE_REMOVE
+
+    def stop(self):
+        """
+        Stops watching.
+        """
+
+        if self.__timeout_id:
+            GLib.source_remove(self.__timeout_id)
+            self.__timeout_id = None
+
+        for monitor in self.__monitors.values():
+            monitor.cancel()
+
+        self.__monitors.clear()
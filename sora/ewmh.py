@@ -0,0 +1,286 @@
+import struct
+from typing import Callable
+
+import gi
+
+gi.require_version("GdkX11", "3.0")
+
+from gi.repository import Gdk, GdkX11, Gtk
+
+from sora.widgets.bind import Variable
+
+MAX_PROPERTY_LENGTH = 64 * 1024
+"""
+The maximum number of bytes read from a property.
+"""
+
+__handlers: dict[tuple[Gdk.Window, str], list[Callable[[], None]]] = {}
+__installed = False
+
+
+def parse_cardinals(data: bytes, format: int) -> list[int]:
+    """
+    Parses the data of a property of 32 bit values (e.g. CARDINAL or WINDOW).
+    Gdk returns 32 bit values as longs, like Xlib.
+
+    :param data: The data of the property.
+    :param format: The format of the property.
+    :return: The values.
+    """
+
+    if format != 32:
+        return []
+
+    size = struct.calcsize("l")
+    count = len(data) // size
+    return list(struct.unpack(f"{count}l", data[: count * size]))
+
+
+def parse_strings(data: bytes) -> list[str]:
+    """
+    Parses the data of a property of null separated strings (e.g. _NET_DESKTOP_NAMES).
+
+    :param data: The data of the property.
+    :return: The strings.
+    """
+
+    if not data:
+        return []
+
+    return data.rstrip(b"\0").decode("utf-8", errors="replace").split("\0")
+
+
+def get_property(window: Gdk.Window, name: str, type: str) -> tuple[bytes, int] | None:
+    """
+    Reads a property of a window.
+
+    :param window: The window.
+    :param name: The name of the property.
+    :param type: The type of the property.
+    :return: The data and format of the property or None if it is not set.
+    """
+
+    found, _, format, data = Gdk.property_get(
+        window,
+        Gdk.atom_intern(name, False),
+        Gdk.atom_intern(type, False),
+        0,
+        MAX_PROPERTY_LENGTH,
+        False,
+    )
+
+    if not found:
+        return None
+
+    return bytes(data), format
+
+
+def watch_property(window: Gdk.Window, name: str, callback: Callable[[], None]):
+    """
+    Calls the callback whenever a property of a window changes.
+
+    :param window: The window.
+    :param name: The name of the property.
+    :param callback: The function to call when the property has changed.
+    """
+
+    __install_handler()
+    window.set_events(window.get_events() | Gdk.EventMask.PROPERTY_CHANGE_MASK)
+    __handlers.setdefault((window, name), []).append(callback)
+
+
+def unwatch_property(window: Gdk.Window, name: str, callback: Callable[[], None]):
+    """
+    Stops calling the callback when a property of a window changes.
+
+    :param window: The window.
+    :param name: The name of the property.
+    :param callback: The callback passed to watch_property.
+    """
+
+    callbacks = __handlers.get((window, name), [])
+    if callback in callbacks:
+        callbacks.remove(callback)
+
+    if not callbacks:
+        __handlers.pop((window, name), None)
+
+
+def __install_handler():
+    """
+    Installs the Gdk event handler, which passes all events on to Gtk.
+    """
+
+    global __installed
+
+    if __installed:
+        return
+
+    Gdk.event_handler_set(__on_event)
+    __installed = True
+
+
+def __on_event(event: Gdk.Event):
+    """
+    Calls the callbacks of a changed property and passes the event on to Gtk.
+
+    :param event: The event.
+    """
+
+    if event.type == Gdk.EventType.PROPERTY_NOTIFY:
+        key = (event.property.window, event.property.atom.name())
+        for callback in list(__handlers.get(key, [])):
+            callback()
+
+    Gtk.main_do_event(event)
+
+
+class EWMH:
+    """
+    Exposes the EWMH properties of the root window as variables.
+    The variables are updated when the window manager changes the properties, without polling.
+    """
+
+    def __init__(self):
+        """
+        Reads the properties and starts watching them.
+        """
+
+        self.__root = Gdk.get_default_root_window()
+        self.__active: Gdk.Window | None = None
+
+        self.current_desktop: Variable[int | None] = Variable(None)
+        """
+        The index of the current desktop (_NET_CURRENT_DESKTOP).
+        """
+
+        self.desktop_names: Variable[list[str]] = Variable([])
+        """
+        The names of the desktops (_NET_DESKTOP_NAMES).
+        """
+
+        self.active_window: Variable[int | None] = Variable(None)
+        """
+        The X11 id of the active window (_NET_ACTIVE_WINDOW).
+        """
+
+        self.active_window_title: Variable[str] = Variable("")
+        """
+        The title of the active window (_NET_WM_NAME).
+        """
+
+        for name, read in self.__root_properties():
+            self.__watch(self.__root, name, read)
+
+    def close(self):
+        """
+        Stops watching the properties.
+        """
+
+        for name, read in self.__root_properties():
+            unwatch_property(self.__root, name, read)
+
+        self.__unwatch_title()
+
+    def __root_properties(self) -> list[tuple[str, Callable[[], None]]]:
+        """
+        Gets the watched properties of the root window and the functions to read them with.
+
+        :return: The names and read functions.
+        """
+
+        return [
+            ("_NET_CURRENT_DESKTOP", self.__read_current_desktop),
+            ("_NET_DESKTOP_NAMES", self.__read_desktop_names),
+            ("_NET_ACTIVE_WINDOW", self.__read_active_window),
+        ]
+
+    def __watch(self, window: Gdk.Window, name: str, read: Callable[[], None]):
+        """
+        Reads a property and reads it again whenever it changes.
+
+        :param window: The window.
+        :param name: The name of the property.
+        :param read: The function to read the property with.
+        """
+
+        watch_property(window, name, read)
+        read()
+
+    def __read_current_desktop(self):
+        """
+        Reads _NET_CURRENT_DESKTOP.
+        """
+
+        property = get_property(self.__root, "_NET_CURRENT_DESKTOP", "CARDINAL")
+        values = parse_cardinals(*property) if property else []
+        self.current_desktop.value = values[0] if values else None
+
+    def __read_desktop_names(self):
+        """
+        Reads _NET_DESKTOP_NAMES.
+        """
+
+        property = get_property(self.__root, "_NET_DESKTOP_NAMES", "UTF8_STRING")
+        self.desktop_names.value = parse_strings(property[0]) if property else []
+
+    def __read_active_window(self):
+        """
+        Reads _NET_ACTIVE_WINDOW and watches the title of the active window.
+        """
+
+        property = get_property(self.__root, "_NET_ACTIVE_WINDOW", "WINDOW")
+        values = parse_cardinals(*property) if property else []
+        xid = values[0] if values and values[0] else None
+
+        if xid == self.active_window.value and self.__active:
+            return
+
+        self.__unwatch_title()
+        self.active_window.value = xid
+
+        if xid:
+            self.__active = GdkX11.X11Window.foreign_new_for_display(
+                self.__root.get_display(), xid
+            )
+
+        if self.__active:
+            self.__watch(self.__active, "_NET_WM_NAME", self.__read_title)
+        else:
+            self.active_window_title.value = ""
+
+    def __read_title(self):
+        """
+        Reads _NET_WM_NAME of the active window.
+        """
+
+        property = get_property(self.__active, "_NET_WM_NAME", "UTF8_STRING")
+        names = parse_strings(property[0]) if property else []
+        self.active_window_title.value = names[0] if names else ""
+
+    def __unwatch_title(self):
+        """
+        Stops watching the title of the previous active window.
+        """
+
+        if self.__active:
+            unwatch_property(self.__active, "_NET_WM_NAME", self.__read_title)
+            self.__active = None
+
+
+__ewmh: EWMH | None = None
+
+
+def get_ewmh() -> EWMH:
+    """
+    Gets the shared EWMH property watcher. The watcher is created on first use.
+
+    :return: The watcher.
+    """
+
+    global __ewmh
+
+    if not __ewmh:
+        __ewmh = EWMH()
+
+    return __ewmh
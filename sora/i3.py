@@ -0,0 +1,525 @@
+import json
+import logging
+import os
+import struct
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Callable
+
+from gi.repository import GLib, Gio
+
+from sora.widgets.bind import Variable
+
+MAGIC = b"i3-ipc"
+"""
+The magic string every message starts with.
+"""
+
+HEADER = struct.Struct(f"={len(MAGIC)}sII")
+"""
+The message header: magic string, payload length and message type in native byte order.
+"""
+
+EVENT_BIT = 1 << 31
+"""
+The bit that is set in the type of event messages.
+"""
+
+CHUNK_SIZE = 64 * 1024
+"""
+The maximum number of bytes read from the socket per wakeup.
+"""
+
+RECONNECT_DELAY = 1
+"""
+The time in seconds to wait before reconnecting after the connection was lost (e.g. on an i3 restart).
+"""
+
+
+class MessageType(IntEnum):
+    """
+    The types of messages sent to i3.
+    """
+
+    RUN_COMMAND = 0
+    GET_WORKSPACES = 1
+    SUBSCRIBE = 2
+    GET_TREE = 4
+
+
+class EventType(IntEnum):
+    """
+    The types of events sent by i3 (without the event bit).
+    """
+
+    WORKSPACE = 0
+    MODE = 2
+    WINDOW = 3
+    SHUTDOWN = 6
+
+
+@dataclass
+class Workspace:
+    """
+    A workspace of i3 or sway.
+
+    :param id: The id of the workspace container.
+    :param num: The number of the workspace (-1 for named workspaces without a number).
+    :param name: The name of the workspace.
+    :param focused: Whether the workspace is focused.
+    :param visible: Whether the workspace is visible on an output.
+    :param urgent: Whether a window on the workspace is urgent.
+    :param output: The output the workspace is on.
+    """
+
+    id: int
+    num: int
+    name: str
+    focused: bool
+    visible: bool
+    urgent: bool
+    output: str
+
+    @staticmethod
+    def from_json(data: dict):
+        """
+        Creates a workspace from a workspace reply or the container of a workspace event.
+
+        :param data: The JSON object.
+        :return: The workspace.
+        """
+
+        return Workspace(
+            id=data["id"],
+            num=data.get("num", -1),
+            name=data.get("name", ""),
+            focused=data.get("focused", False),
+            visible=data.get("visible", False),
+            urgent=data.get("urgent", False),
+            output=data.get("output", ""),
+        )
+
+
+def pack(type: int, payload: str = "") -> bytes:
+    """
+    Packs a message.
+
+    :param type: The type of the message.
+    :param payload: The payload of the message.
+    :return: The message.
+    """
+
+    data = payload.encode()
+    return HEADER.pack(MAGIC, len(data), type) + data
+
+
+def unpack(buffer: bytearray) -> list[tuple[int, bytes]]:
+    """
+    Takes all complete messages from the start of a buffer.
+
+    :param buffer: The buffer. Complete messages are removed from it.
+    :return: The types and payloads of the messages.
+    """
+
+    messages = []
+    while len(buffer) >= HEADER.size:
+        magic, length, type = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError(f"invalid i3 message: {bytes(buffer[:HEADER.size])!r}")
+
+        end = HEADER.size + length
+        if len(buffer) < end:
+            break
+
+        messages.append((type, bytes(buffer[HEADER.size : end])))
+        del buffer[:end]
+
+    return messages
+
+
+def find_focused(node: dict) -> dict | None:
+    """
+    Finds the focused container in a tree.
+
+    :param node: The root of the tree.
+    :return: The focused container or None.
+    """
+
+    if node.get("focused"):
+        return node
+
+    for child in node.get("nodes", []) + node.get("floating_nodes", []):
+        if focused := find_focused(child):
+            return focused
+
+
+def get_socket_path() -> str | None:
+    """
+    Gets the path of the IPC socket of the running i3 or sway.
+
+    :return: The path or None.
+    """
+
+    return os.environ.get("I3SOCK") or os.environ.get("SWAYSOCK")
+
+
+class I3:
+    """
+    A client for the IPC interface of i3 and sway.
+    Events are parsed once and applied to a workspace model, which is exposed as variables.
+    """
+
+    def __init__(self, socket_path: str | None = None):
+        """
+        Connects to i3 or sway and subscribes to workspace, window and mode events.
+
+        :param socket_path: The path of the IPC socket (default: $I3SOCK or $SWAYSOCK).
+        """
+
+        self.socket_path = socket_path or get_socket_path()
+        if not self.socket_path:
+            raise LookupError("could not find i3 or sway socket")
+
+        self.workspaces: Variable[list[Workspace]] = Variable([])
+        """
+        The workspaces, sorted by their number.
+        """
+
+        self.focused_workspace: Variable[Workspace | None] = Variable.computed(
+            lambda workspaces: next((w for w in workspaces if w.focused), None),
+            self.workspaces,
+        )
+        """
+        The focused workspace.
+        """
+
+        self.window_title: Variable[str] = Variable("")
+        """
+        The title of the focused window.
+        """
+
+        self.mode: Variable[str] = Variable("default")
+        """
+        The current binding mode.
+        """
+
+        self.__workspaces: dict[int, Workspace] = {}
+        self.__connection: Gio.SocketConnection | None = None
+        self.__cancellable: Gio.Cancellable | None = None
+        self.__buffer = bytearray()
+        self.__output = bytearray()
+        self.__writing = False
+        self.__replies: list[Callable[[Any], None] | None] = []
+        self.__closed = False
+
+        self.__connect()
+
+    def command(
+        self, command: str, callback: Callable[[list[dict]], None] | None = None
+    ):
+        """
+        Runs an i3 command (e.g. "workspace 2").
+
+        :param command: The command.
+        :param callback: The callback to call with the results of the command.
+        """
+
+        self.request(MessageType.RUN_COMMAND, command, callback)
+
+    def request(
+        self,
+        type: MessageType,
+        payload: str = "",
+        callback: Callable[[Any], None] | None = None,
+    ):
+        """
+        Sends a message and calls the callback with the parsed reply.
+        The message is queued and written without blocking the main loop.
+
+        :param type: The type of the message.
+        :param payload: The payload of the message.
+        :param callback: The callback to call with the reply.
+        """
+
+        if not self.__connection:
+            logging.warning(f"Cannot send i3 message {type.name}: not connected.")
+            return
+
+        self.__output += pack(type, payload)
+        self.__replies.append(callback)
+        self.__write()
+
+    def close(self):
+        """
+        Closes the connection.
+        """
+
+        self.__closed = True
+        self.__disconnect()
+
+    def __connect(self):
+        """
+        Connects to the socket without blocking, subscribes to events and requests the current state.
+        """
+
+        if self.__closed:
+            return GLib.SOURCE_REMOVE
+
+        def cb(client: Gio.SocketClient, res):
+            try:
+                connection = client.connect_finish(res)
+            except GLib.Error as e:
+                if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                    logging.warning(
+                        f"Cannot connect to i3 at {self.socket_path}: {e.message}"
+                    )
+                    GLib.timeout_add_seconds(RECONNECT_DELAY, self.__connect)
+                return
+
+            self.__connection = connection
+            self.__read()
+
+            events = ["workspace", "window", "mode", "shutdown"]
+            self.request(MessageType.SUBSCRIBE, json.dumps(events))
+            self.request(MessageType.GET_WORKSPACES, callback=self.__set_workspaces)
+            self.request(MessageType.GET_TREE, callback=self.__set_tree)
+
+        self.__cancellable = Gio.Cancellable()
+        Gio.SocketClient().connect_async(
+            Gio.UnixSocketAddress.new(self.socket_path), self.__cancellable, cb
+        )
+        return GLib.SOURCE_REMOVE
+
+    def __disconnect(self):
+        """
+        Closes the connection and drops pending replies.
+        """
+
+        if self.__cancellable:
+            self.__cancellable.cancel()
+            self.__cancellable = None
+
+        if self.__connection:
+            self.__connection.close(None)
+            self.__connection = None
+
+        self.__buffer.clear()
+        self.__output.clear()
+        self.__writing = False
+        self.__replies.clear()
+
+    def __reconnect(self):
+        """
+        Reconnects after the connection was lost.
+        """
+
+        self.__disconnect()
+
+        if not self.__closed:
+            GLib.timeout_add_seconds(RECONNECT_DELAY, self.__connect)
+
+    def __write(self):
+        """
+        Writes the queued messages to the socket. Only one write is running at a time.
+        """
+
+        if self.__writing or not self.__output or not self.__connection:
+            return
+
+        def cb(stream: Gio.OutputStream, res):
+            try:
+                written = stream.write_bytes_finish(res)
+            except GLib.Error as e:
+                if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                    logging.warning(f"Lost connection to i3: {e.message}")
+                    self.__reconnect()
+                return
+
+            self.__writing = False
+            del self.__output[:written]
+            self.__write()
+
+        self.__writing = True
+        self.__connection.get_output_stream().write_bytes_async(
+            GLib.Bytes.new(bytes(self.__output)),
+            GLib.PRIORITY_DEFAULT,
+            self.__cancellable,
+            cb,
+        )
+
+    def __read(self):
+        """
+        Reads the next chunk from the socket.
+        """
+
+        def cb(stream: Gio.InputStream, res):
+            try:
+                data = stream.read_bytes_finish(res)
+            except GLib.Error as e:
+                if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                    logging.warning(f"Lost connection to i3: {e.message}")
+                    self.__reconnect()
+                return
+
+            chunk = data.get_data() if data else None
+            if not chunk:
+                logging.warning("Lost connection to i3: socket closed.")
+                self.__reconnect()
+                return
+
+            self.__buffer += chunk
+            try:
+                messages = unpack(self.__buffer)
+            except ValueError as e:
+                logging.error(f"Lost connection to i3: {e}")
+                self.__reconnect()
+                return
+
+            for type, payload in messages:
+                self.__on_message(type, payload)
+
+            if self.__connection and stream is self.__connection.get_input_stream():
+                self.__read()
+
+        self.__connection.get_input_stream().read_bytes_async(
+            CHUNK_SIZE, GLib.PRIORITY_DEFAULT, self.__cancellable, cb
+        )
+
+    def __on_message(self, type: int, payload: bytes):
+        """
+        Handles a reply or an event.
+
+        :param type: The type of the message.
+        :param payload: The payload of the message.
+        """
+
+        try:
+            data = json.loads(payload)
+        except ValueError as e:
+            logging.error(f"Invalid i3 message payload: {e}")
+            data = None
+
+        if not type & EVENT_BIT:
+            callback = self.__replies.pop(0) if self.__replies else None
+            if callback:
+                callback(data)
+            return
+
+        if data is None:
+            return
+
+        match type & ~EVENT_BIT:
+            case EventType.WORKSPACE:
+                self.__on_workspace_event(data)
+            case EventType.WINDOW:
+                self.__on_window_event(data)
+            case EventType.MODE:
+                self.mode.value = data.get("change", "default")
+            case EventType.SHUTDOWN:
+                self.__reconnect()
+
+    def __on_workspace_event(self, event: dict):
+        """
+        Applies a workspace event to the workspace model.
+
+        :param event: The event.
+        """
+
+        change = event.get("change")
+        current = event.get("current")
+
+        if change in ("move", "reload") or not current:
+            self.request(MessageType.GET_WORKSPACES, callback=self.__set_workspaces)
+            return
+
+        if change == "empty":
+            self.__workspaces.pop(current["id"], None)
+        elif change == "focus":
+            old = event.get("old")
+            for workspace in self.__workspaces.values():
+                workspace.focused = False
+                if old and workspace.id == old["id"]:
+                    workspace.visible = workspace.output != current.get("output")
+
+            self.__workspaces[current["id"]] = Workspace.from_json(
+                current | {"focused": True, "visible": True}
+            )
+        else:
+            previous = self.__workspaces.get(current["id"])
+            workspace = Workspace.from_json(current)
+            # The container of an event has no focused and visible fields.
+            if previous:
+                workspace.focused = previous.focused
+                workspace.visible = previous.visible
+            self.__workspaces[current["id"]] = workspace
+
+        self.__publish_workspaces()
+
+    def __on_window_event(self, event: dict):
+        """
+        Updates the focused window title.
+
+        :param event: The event.
+        """
+
+        container = event.get("container") or {}
+
+        match event.get("change"):
+            case "focus":
+                self.window_title.value = container.get("name") or ""
+            case "title" if container.get("focused"):
+                self.window_title.value = container.get("name") or ""
+            case "close" if container.get("focused"):
+                self.window_title.value = ""
+
+    def __set_workspaces(self, workspaces: list[dict] | None):
+        """
+        Replaces the workspace model with a workspace reply.
+
+        :param workspaces: The workspaces.
+        """
+
+        if workspaces is None:
+            return
+
+        self.__workspaces = {w["id"]: Workspace.from_json(w) for w in workspaces}
+        self.__publish_workspaces()
+
+    def __set_tree(self, tree: dict | None):
+        """
+        Sets the focused window title from a tree reply.
+
+        :param tree: The tree.
+        """
+
+        focused = find_focused(tree) if tree else None
+        if focused and focused.get("type") in ("con", "floating_con"):
+            self.window_title.value = focused.get("name") or ""
+
+    def __publish_workspaces(self):
+        """
+        Sets the workspaces variable. Equal lists do not notify.
+        """
+
+        self.workspaces.value = sorted(
+            (Workspace(**vars(w)) for w in self.__workspaces.values()),
+            key=lambda w: (w.num < 0, w.num, w.name),
+        )
+
+
+__client: I3 | None = None
+
+
+def get_i3() -> I3:
+    """
+    Gets the shared i3 client. The client connects on first use.
+
+    :return: The client.
+    """
+
+    global __client
+
+    if not __client:
+        __client = I3()
+
+    return __client
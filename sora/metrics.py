@@ -0,0 +1,361 @@
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+
+from sora.utils.timer import add_timer, remove_timer
+from sora.widgets.bind import Variable
+
+SECTOR_SIZE = 512
+"""
+The size in bytes of a sector in /proc/diskstats.
+"""
+
+IGNORED_DISKS = ("loop", "ram", "zram")
+"""
+The prefixes of block devices that are not reported as disks.
+"""
+
+
+@dataclass
+class CpuUsage:
+    """
+    The CPU usage in percent.
+
+    :param total: The usage of all cores.
+    :param cores: The usage of each core.
+    """
+
+    total: float
+    cores: list[float] = field(default_factory=list)
+
+
+@dataclass
+class MemoryUsage:
+    """
+    The memory usage in bytes.
+
+    :param total: The total memory.
+    :param available: The memory available for new processes.
+    :param used: The memory in use (total - available).
+    :param percent: The memory in use in percent.
+    """
+
+    total: int
+    available: int
+    used: int
+    percent: float
+
+
+@dataclass
+class Rate:
+    """
+    The transfer rate of a network interface or disk in bytes per second.
+
+    :param received: The received (network) or read (disk) bytes per second.
+    :param sent: The sent (network) or written (disk) bytes per second.
+    """
+
+    received: float
+    sent: float
+
+
+def parse_stat(content: str) -> dict[str, tuple[int, int]]:
+    """
+    Parses /proc/stat.
+
+    :param content: The content of /proc/stat.
+    :return: The idle and total time of all cores ("cpu") and each core ("cpu0", ...).
+    """
+
+    times = {}
+    for line in content.splitlines():
+        if not line.startswith("cpu"):
+            break
+
+        name, *values = line.split()
+        # user nice system idle iowait irq softirq steal, guest time is part of user.
+        ticks = [int(v) for v in values[:8]]
+        times[name] = (ticks[3] + ticks[4], sum(ticks))
+
+    return times
+
+
+def parse_meminfo(content: str) -> dict[str, int]:
+    """
+    Parses /proc/meminfo.
+
+    :param content: The content of /proc/meminfo.
+    :return: The values in bytes by their name.
+    """
+
+    values = {}
+    for line in content.splitlines():
+        name, _, value = line.partition(":")
+        parts = value.split()
+        if parts:
+            values[name] = int(parts[0]) * (1024 if len(parts) > 1 else 1)
+
+    return values
+
+
+def parse_net_dev(content: str) -> dict[str, tuple[int, int]]:
+    """
+    Parses /proc/net/dev.
+
+    :param content: The content of /proc/net/dev.
+    :return: The received and sent bytes by interface.
+    """
+
+    counters = {}
+    for line in content.splitlines()[2:]:
+        name, _, values = line.partition(":")
+        fields = values.split()
+        counters[name.strip()] = (int(fields[0]), int(fields[8]))
+
+    return counters
+
+
+def parse_diskstats(content: str) -> dict[str, tuple[int, int]]:
+    """
+    Parses /proc/diskstats.
+
+    :param content: The content of /proc/diskstats.
+    :return: The read and written bytes by block device.
+    """
+
+    counters = {}
+    for line in content.splitlines():
+        fields = line.split()
+        if len(fields) < 10 or fields[2].startswith(IGNORED_DISKS):
+            continue
+
+        counters[fields[2]] = (
+            int(fields[5]) * SECTOR_SIZE,
+            int(fields[9]) * SECTOR_SIZE,
+        )
+
+    return counters
+
+
+def cpu_usage(
+    previous: dict[str, tuple[int, int]], current: dict[str, tuple[int, int]]
+) -> CpuUsage:
+    """
+    Computes the CPU usage between two samples of /proc/stat.
+
+    :param previous: The previous sample.
+    :param current: The current sample.
+    :return: The CPU usage.
+    """
+
+    def usage(name: str) -> float:
+        idle, total = current[name]
+        previous_idle, previous_total = previous.get(name, (idle, total))
+        elapsed = total - previous_total
+        if elapsed <= 0:
+            return 0.0
+
+        return round(100 * (1 - (idle - previous_idle) / elapsed), 1)
+
+    cores = [usage(name) for name in current if name != "cpu"]
+    return CpuUsage(usage("cpu"), cores)
+
+
+def memory_usage(meminfo: dict[str, int]) -> MemoryUsage:
+    """
+    Computes the memory usage from /proc/meminfo.
+
+    :param meminfo: The parsed /proc/meminfo.
+    :return: The memory usage.
+    """
+
+    total = meminfo.get("MemTotal", 0)
+    available = meminfo.get("MemAvailable", meminfo.get("MemFree", 0))
+    used = total - available
+    percent = round(100 * used / total, 1) if total else 0.0
+    return MemoryUsage(total, available, used, percent)
+
+
+def rates(
+    previous: dict[str, tuple[int, int]],
+    current: dict[str, tuple[int, int]],
+    elapsed: float,
+) -> dict[str, Rate]:
+    """
+    Computes the transfer rates between two samples of byte counters.
+
+    :param previous: The previous counters.
+    :param current: The current counters.
+    :param elapsed: The time between the samples in seconds.
+    :return: The rates by interface or device.
+    """
+
+    result = {}
+    for name, (received, sent) in current.items():
+        previous_received, previous_sent = previous.get(name, (received, sent))
+        result[name] = Rate(
+            round(max(received - previous_received, 0) / elapsed, 1)
+            if elapsed
+            else 0.0,
+            round(max(sent - previous_sent, 0) / elapsed, 1) if elapsed else 0.0,
+        )
+
+    return result
+
+
+class ProcFile:
+    """
+    A file in /proc that is kept open and read into a preallocated buffer.
+    """
+
+    def __init__(self, path: str, size: int = 16 * 1024):
+        """
+        Opens the file.
+
+        :param path: The path of the file.
+        :param size: The initial size of the buffer. The buffer grows when the file does not fit.
+        """
+
+        self.path = path
+        self.__fd = os.open(path, os.O_RDONLY)
+        self.__buffer = bytearray(size)
+
+    def read(self) -> str:
+        """
+        Reads the whole file from the start.
+
+        :return: The content of the file.
+        """
+
+        while True:
+            length = os.preadv(self.__fd, [self.__buffer], 0)
+            if length < len(self.__buffer):
+                return str(memoryview(self.__buffer)[:length], "utf-8")
+
+            self.__buffer = bytearray(len(self.__buffer) * 2)
+
+    def close(self):
+        """
+        Closes the file.
+        """
+
+        os.close(self.__fd)
+
+
+class Sampler:
+    """
+    Samples CPU, memory, network and disk usage from /proc in a single pass per interval.
+    """
+
+    def __init__(self, interval: float = 1):
+        """
+        Creates a new Sampler and starts sampling.
+
+        :param interval: The interval in seconds.
+        """
+
+        self.interval = interval
+
+        self.cpu: Variable[CpuUsage | None] = Variable(None)
+        """
+        The CPU usage in percent.
+        """
+
+        self.memory: Variable[MemoryUsage | None] = Variable(None)
+        """
+        The memory usage in bytes.
+        """
+
+        self.network: Variable[dict[str, Rate]] = Variable({})
+        """
+        The transfer rates of the network interfaces.
+        """
+
+        self.disk: Variable[dict[str, Rate]] = Variable({})
+        """
+        The transfer rates of the disks.
+        """
+
+        self.__files: dict[str, ProcFile] = {}
+        for path in ("/proc/stat", "/proc/meminfo", "/proc/net/dev", "/proc/diskstats"):
+            try:
+                self.__files[path] = ProcFile(path)
+            except OSError as e:
+                logging.warning(f"Cannot sample {path}: {e}")
+
+        self.__time: float | None = None
+        self.__stat: dict[str, tuple[int, int]] = {}
+        self.__net: dict[str, tuple[int, int]] = {}
+        self.__disk: dict[str, tuple[int, int]] = {}
+
+        self.sample()
+        self.__timer: int | None = add_timer(interval, self.sample)
+
+    def sample(self):
+        """
+        Reads all files and updates the variables.
+        """
+
+        now = time.monotonic()
+        elapsed = now - self.__time if self.__time is not None else 0.0
+        self.__time = now
+
+        if file := self.__files.get("/proc/stat"):
+            stat = parse_stat(file.read())
+            self.cpu.value = cpu_usage(self.__stat, stat)
+            self.__stat = stat
+
+        if file := self.__files.get("/proc/meminfo"):
+            self.memory.value = memory_usage(parse_meminfo(file.read()))
+
+        if file := self.__files.get("/proc/net/dev"):
+            net = parse_net_dev(file.read())
+            self.network.value = rates(self.__net, net, elapsed)
+            self.__net = net
+
+        if file := self.__files.get("/proc/diskstats"):
+            disk = parse_diskstats(file.read())
+            self.disk.value = rates(self.__disk, disk, elapsed)
+            self.__disk = disk
+
+    @property
+    def stopped(self) -> bool:
+        """
+        Whether the sampler was stopped.
+        """
+
+        return self.__timer is None
+
+    def stop(self):
+        """
+        Stops sampling and closes the files.
+        """
+
+        if self.__timer:
+            remove_timer(self.__timer)
+            self.__timer = None
+
+        for file in self.__files.values():
+            file.close()
+
+        self.__files.clear()
+
+
+__samplers: dict[float, Sampler] = {}
+
+
+def get_sampler(interval: float = 1) -> Sampler:
+    """
+    Gets the shared sampler of the given interval. The sampler is created on first use
+    and created again if it was stopped.
+
+    :param interval: The interval in seconds.
+    :return: The sampler.
+    """
+
+    sampler = __samplers.get(interval)
+    if not sampler or sampler.stopped:
+        sampler = __samplers[interval] = Sampler(interval)
+
+    return sampler
@@ -1,12 +1,22 @@
 from gi.repository import Gdk
 
+from sora.widgets.bind import Variable
+
 
 class Monitor:
     """
     Represents a monitor connected to the system.
     """
 
-    def __init__(self, name: str, x: int, y: int, width: int, height: int) -> None:
+    def __init__(
+        self,
+        name: str,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        connector: str | None = None,
+    ) -> None:
         """
         Creates a new monitor.
 
@@ -15,6 +25,7 @@ class Monitor:
         :param y: The y coordinate of the monitor.
         :param width: The width of the monitor.
         :param height: The height of the monitor.
+        :param connector: The connector of the monitor (e.g. "HDMI-1"), if available.
         """
 
         self.name = name
@@ -22,6 +33,38 @@ class Monitor:
         self.y = y
         self.width = width
         self.height = height
+        self.connector = connector
+
+    def __key(self) -> tuple:
+        """
+        Gets the values a monitor is compared and hashed by.
+
+        :return: The values.
+        """
+
+        return (self.name, self.x, self.y, self.width, self.height, self.connector)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks whether the monitor equals another monitor.
+
+        :param other: The object to compare with.
+        :return: Whether both monitors have the same name, geometry and connector.
+        """
+
+        if isinstance(other, self.__class__):
+            return self.__key() == other.__key()
+
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        """
+        Hashes the monitor consistently with __eq__.
+
+        :return: The hash.
+        """
+
+        return hash(self.__key())
 
     @staticmethod
     def from_gdk_monitor(gdk_monitor: Gdk.Monitor | None):
@@ -34,21 +77,154 @@ class Monitor:
 
         if gdk_monitor:
             geometry = gdk_monitor.get_geometry()
+            get_connector = getattr(gdk_monitor, "get_connector", None)
             return Monitor(
                 name=gdk_monitor.get_model() or "",
                 x=geometry.x,
                 y=geometry.y,
                 width=geometry.width,
                 height=geometry.height,
+                connector=get_connector() if get_connector else None,
             )
 
 
-def get_monitor(identifier: str | int):
+class MonitorRegistry:
+    """
+    Caches the monitors of a display by index, name and connector.
+    The cache is invalidated when a monitor is added or removed or the monitor configuration changes.
     """
-    Gets a monitor by its name or index.
 
-    :param identifier: The name or index of the monitor.
-    :return: The monitor or None.
+    __registries: dict[Gdk.Display, "MonitorRegistry"] = {}
+
+    def __init__(self, display: Gdk.Display):
+        """
+        Creates a new MonitorRegistry.
+
+        :param display: The display to get the monitors from.
+        """
+
+        self.display = display
+        self.__by_index: dict[int, Monitor | None] = {}
+        self.__by_name: dict[str, Monitor] = {}
+        self.__monitors: list[Monitor | None] | None = None
+        self.__primary: Monitor | None = None
+        self.__primary_cached = False
+        self.__changed: Variable[list[Monitor | None]] | None = None
+
+        display.connect("monitor-added", self.__on_monitors_changed)
+        display.connect("monitor-removed", self.__on_monitors_changed)
+
+        if screen := display.get_default_screen():
+            screen.connect("monitors-changed", self.__on_monitors_changed)
+
+    @staticmethod
+    def for_display(display: Gdk.Display):
+        """
+        Gets the registry of the given display. The registry is created on first use.
+
+        :param display: The display.
+        :return: The registry.
+        """
+
+        if display not in MonitorRegistry.__registries:
+            MonitorRegistry.__registries[display] = MonitorRegistry(display)
+
+        return MonitorRegistry.__registries[display]
+
+    @property
+    def changed(self) -> Variable[list[Monitor | None]]:
+        """
+        A variable with the list of monitors, updated when the monitors change.
+        """
+
+        if self.__changed is None:
+            self.__changed = Variable(self.list())
+
+        return self.__changed
+
+    def get(self, identifier: str | int):
+        """
+        Gets a monitor by its index, name or connector.
+
+        :param identifier: The index, name or connector of the monitor.
+        :return: The monitor or None.
+        """
+
+        if type(identifier) is int:
+            if identifier not in self.__by_index:
+                self.__by_index[identifier] = Monitor.from_gdk_monitor(
+                    self.display.get_monitor(identifier)
+                )
+
+            return self.__by_index[identifier]
+
+        self.__scan()
+        return self.__by_name.get(identifier)
+
+    def list(self) -> list[Monitor | None]:
+        """
+        Lists all monitors.
+
+        :return: A list of monitors.
+        """
+
+        self.__scan()
+        return list(self.__monitors)
+
+    def primary(self):
+        """
+        Gets the primary monitor.
+
+        :return: The primary monitor or None.
+        """
+
+        if not self.__primary_cached:
+            self.__primary = Monitor.from_gdk_monitor(
+                self.display.get_primary_monitor()
+            )
+            self.__primary_cached = True
+
+        return self.__primary
+
+    def __scan(self):
+        """
+        Reads all monitors of the display, unless they are cached.
+        """
+
+        if self.__monitors is not None:
+            return
+
+        self.__monitors = []
+        for i in range(self.display.get_n_monitors()):
+            monitor = Monitor.from_gdk_monitor(self.display.get_monitor(i))
+            self.__monitors.append(monitor)
+            self.__by_index[i] = monitor
+
+            if monitor:
+                self.__by_name.setdefault(monitor.name, monitor)
+                if monitor.connector:
+                    self.__by_name.setdefault(monitor.connector, monitor)
+
+    def __on_monitors_changed(self, *_):
+        """
+        Invalidates the cache and updates the change variable.
+        """
+
+        self.__by_index.clear()
+        self.__by_name.clear()
+        self.__monitors = None
+        self.__primary = None
+        self.__primary_cached = False
+
+        if self.__changed:
+            self.__changed.value = self.list()
+
+
+def get_registry():
+    """
+    Gets the monitor registry of the default display.
+
+    :return: The registry or None.
     """
 
     display = Gdk.Display.get_default()
@@ -56,13 +232,19 @@ def get_monitor(identifier: str | int):
     if not display:
         return None
 
-    if type(identifier) is int:
-        return Monitor.from_gdk_monitor(display.get_monitor(identifier))
+    return MonitorRegistry.for_display(display)
+
+
+def get_monitor(identifier: str | int):
+    """
+    Gets a monitor by its name or index.
 
-    for i in range(display.get_n_monitors()):
-        monitor = display.get_monitor(i)
-        if monitor and monitor.get_model() == identifier:
-            return Monitor.from_gdk_monitor(monitor)
+    :param identifier: The name or index of the monitor.
+    :return: The monitor or None.
+    """
+
+    if registry := get_registry():
+        return registry.get(identifier)
 
 
 def list_monitors():
@@ -72,15 +254,10 @@ def list_monitors():
     :return: A list of monitors.
     """
 
-    display = Gdk.Display.get_default()
-    if not display:
-        return []
+    if registry := get_registry():
+        return registry.list()
 
-    monitors: list[Monitor] = []
-    for i in range(display.get_n_monitors()):
-        monitors.append(Monitor.from_gdk_monitor(display.get_monitor(i)))
-
-    return monitors
+    return []
 
 
 def get_primary_monitor():
@@ -90,5 +267,5 @@ def get_primary_monitor():
     :return: The primary monitor.
     """
 
-    display = Gdk.Display.get_default()
-    return Monitor.from_gdk_monitor(display.get_primary_monitor())
+    if registry := get_registry():
+        return registry.primary()
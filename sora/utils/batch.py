@@ -0,0 +1,95 @@
+import logging
+from typing import Any
+
+from gi.repository import GLib, GObject
+
+
+class PropertyBatch:
+    """
+    Collects pending property updates and applies them in a single pass on the main loop.
+    Only the latest value per (object, property) pair is applied.
+    """
+
+    def __init__(self, priority: int = GLib.PRIORITY_HIGH_IDLE):
+        """
+        Creates a new PropertyBatch.
+
+        :param priority: The priority of the idle source that applies the updates.
+            The default runs before GTK's resize and redraw.
+        """
+
+        self.__priority = priority
+        self.__pending: dict[tuple[GObject.GObject, str], Any] = {}
+        self.__source_id: int | None = None
+        self.__coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """
+        The number of updates that were replaced by a newer value before being applied.
+        """
+
+        return self.__coalesced
+
+    def queue(self, object: GObject.GObject, prop: str, value: Any):
+        """
+        Queues a property update.
+
+        :param object: The GObject to update.
+        :param prop: The property to update.
+        :param value: The new value.
+        """
+
+        key = (object, prop)
+        if key in self.__pending:
+            self.__coalesced += 1
+
+        self.__pending[key] = value
+
+        if not self.__source_id:
+            self.__source_id = GLib.idle_add(self.flush, priority=self.__priority)
+
+    def flush(self):
+        """
+        Applies all pending property updates.
+        """
+
+        if self.__source_id:
+            GLib.source_remove(self.__source_id)
+            self.__source_id = None
+
+        pending = self.__pending
+        self.__pending = {}
+
+        for (object, prop), value in pending.items():
+            try:
+                object.set_property(prop, value)
+            except Exception as e:
+                logging.error(f"Failed to set property '{prop}' of {object}: {e}")
+
+        return GLib.SOURCE_REMOVE
+
+
+__batch = PropertyBatch()
+
+
+def queue_property(object: GObject.GObject, prop: str, value: Any):
+    """
+    Queues a property update on the shared batch.
+
+    :param object: The GObject to update.
+    :param prop: The property to update.
+    :param value: The new value.
+    """
+
+    __batch.queue(object, prop, value)
+
+
+def get_batch() -> PropertyBatch:
+    """
+    Gets the shared batch.
+
+    :return: The shared batch.
+    """
+
+    return __batch
@@ -0,0 +1,122 @@
+import dataclasses
+from types import CodeType, FunctionType, MethodType
+from typing import Any
+
+
+def function_key(func: Any) -> Any:
+    """
+    Gets a key that is equal for functions with the same code, regardless of where they are defined.
+    Two lambdas with the same body and captured values have the same key.
+
+    :param func: The function.
+    :return: The key of the function.
+    """
+
+    return __function_key(func, set())
+
+
+def definition(value: Any) -> Any:
+    """
+    Gets a comparable definition of a config value.
+    Widgets are compared by their type and properties, functions by their code
+    and variables by their identity, so that the definitions of two separately
+    created but identical widget trees are equal.
+
+    :param value: The config value (e.g. a widget or property).
+    :return: The definition of the value.
+    """
+
+    return __definition(value, set())
+
+
+def __function_key(func: Any, seen: set[int]) -> Any:
+    """
+    Gets the key of a function.
+
+    :param func: The function.
+    :param seen: The ids of the values that are currently visited.
+    :return: The key of the function.
+    """
+
+    if isinstance(func, MethodType):
+        return ("method", __function_key(func.__func__, seen), id(func.__self__))
+
+    if not isinstance(func, FunctionType):
+        return func
+
+    if id(func) in seen:
+        return ("function", func.__qualname__)
+
+    seen.add(id(func))
+
+    closure = []
+    for cell in func.__closure__ or []:
+        try:
+            closure.append(__definition(cell.cell_contents, seen))
+        except ValueError:
+            closure.append(None)
+
+    key = (
+        "function",
+        func.__qualname__,
+        __code_key(func.__code__),
+        tuple(closure),
+        __definition(func.__defaults__, seen),
+    )
+
+    seen.discard(id(func))
+    return key
+
+
+def __code_key(code: CodeType) -> Any:
+    """
+    Gets the key of a code object, ignoring line numbers.
+
+    :param code: The code object.
+    :return: The key of the code object.
+    """
+
+    consts = tuple(
+        __code_key(const) if isinstance(const, CodeType) else const
+        for const in code.co_consts
+    )
+
+    return (code.co_code, consts, code.co_names, code.co_varnames)
+
+
+def __definition(value: Any, seen: set[int]) -> Any:
+    """
+    Gets the definition of a config value.
+
+    :param value: The config value.
+    :param seen: The ids of the values that are currently visited.
+    :return: The definition of the value.
+    """
+
+    from sora.widgets.bind import Variable
+
+    if isinstance(value, Variable):
+        return value.definition()
+
+    if isinstance(value, (FunctionType, MethodType)):
+        return __function_key(value, seen)
+
+    if isinstance(value, (list, tuple)):
+        return tuple(__definition(item, seen) for item in value)
+
+    if isinstance(value, dict):
+        return tuple((key, __definition(item, seen)) for key, item in value.items())
+
+    if props := getattr(value, "_props", None):
+        return (type(value).__qualname__, __definition(props, seen))
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value).__qualname__,
+            tuple(
+                (field.name, __definition(getattr(value, field.name), seen))
+                for field in dataclasses.fields(value)
+            ),
+        )
+
+    return value
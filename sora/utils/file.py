@@ -0,0 +1,188 @@
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+from gi.repository import GLib, Gio
+
+from sora.utils.timer import add_timer, remove_timer
+
+READ_SIZE = 4096
+"""
+The number of bytes read per pread call.
+"""
+
+PSEUDO_FILESYSTEMS = (Path("/proc"), Path("/sys"))
+"""
+The filesystems whose files change without emitting file monitor events.
+"""
+
+
+def is_pseudo_file(path: Path) -> bool:
+    """
+    Checks whether a file is on a pseudo filesystem and has to be polled.
+
+    :param path: The path of the file.
+    :return: Whether the file is a pseudo file.
+    """
+
+    path = path.resolve()
+    return any(path.is_relative_to(root) for root in PSEUDO_FILESYSTEMS)
+
+
+class FileWatcher:
+    """
+    Keeps a file open and reads it again when it has changed.
+    Regular files are watched with a Gio.FileMonitor, pseudo files (e.g. in /proc or /sys) are polled.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        callback: Callable[[str], None],
+        poll_interval: float = 5,
+        poll: bool | None = None,
+    ):
+        """
+        Creates a new FileWatcher and reads the file once.
+
+        :param path: The path of the file.
+        :param callback: The callback to call with the content of the file.
+        :param poll_interval: The interval in seconds to poll pseudo files with.
+        :param poll: Whether to poll instead of watching the file (default: only pseudo files are polled).
+        """
+
+        self.path = Path(path)
+        self.__callback = callback
+        self.__fd: int | None = None
+        self.__monitor: Gio.FileMonitor | None = None
+        self.__timer: int | None = None
+        self.__read_source: int | None = None
+        self.__reads = 0
+        self.__last_read: float | None = None
+
+        if poll is None:
+            poll = is_pseudo_file(self.path)
+
+        self.__poll = poll
+        if poll:
+            self.__timer = add_timer(poll_interval, self.__read)
+        else:
+            self.__monitor = Gio.File.new_for_path(str(self.path)).monitor_file(
+                Gio.FileMonitorFlags.WATCH_MOVES, None
+            )
+            self.__monitor.connect("changed", self.__on_changed)
+
+        self.__read()
+
+    @property
+    def reads(self) -> int:
+        """
+        The number of times the file was read.
+        """
+
+        return self.__reads
+
+    @property
+    def last_read(self) -> float | None:
+        """
+        The time of the last read (time.monotonic), or None if the file was never read.
+        """
+
+        return self.__last_read
+
+    def read(self) -> str | None:
+        """
+        Reads the whole file from the start, reopening a watched file if it was replaced.
+
+        :return: The content of the file or None if it cannot be read.
+        """
+
+        try:
+            if self.__fd is None or (not self.__poll and self.__is_replaced()):
+                self.__close()
+                self.__fd = os.open(self.path, os.O_RDONLY)
+
+            chunks = []
+            offset = 0
+            while chunk := os.pread(self.__fd, READ_SIZE, offset):
+                chunks.append(chunk)
+                offset += len(chunk)
+        except OSError as e:
+            logging.debug(f"Cannot read {self.path}: {e}")
+            self.__close()
+            return None
+
+        self.__reads += 1
+        self.__last_read = time.monotonic()
+        return b"".join(chunks).decode("utf-8", errors="replace")
+
+    def stop(self):
+        """
+        Stops watching and closes the file.
+        """
+
+        if self.__monitor:
+            self.__monitor.cancel()
+            self.__monitor = None
+
+        if self.__timer:
+            remove_timer(self.__timer)
+            self.__timer = None
+
+        if self.__read_source:
+            GLib.source_remove(self.__read_source)
+            self.__read_source = None
+
+        self.__close()
+
+    def __read(self):
+        """
+        Reads the file and calls the callback with its content.
+        """
+
+        self.__read_source = None
+
+        content = self.read()
+        if content is not None:
+            self.__callback(content)
+
+        return GLib.SOURCE_REMOVE
+
+    def __on_changed(self, _monitor, _file, _other, event: Gio.FileMonitorEvent):
+        """
+        Called when the file has changed. Reads the file once after a burst of events.
+        """
+
+        if event in (
+            Gio.FileMonitorEvent.ATTRIBUTE_CHANGED,
+            Gio.FileMonitorEvent.PRE_UNMOUNT,
+            Gio.FileMonitorEvent.UNMOUNTED,
+        ):
+            return
+
+        if event in (Gio.FileMonitorEvent.DELETED, Gio.FileMonitorEvent.MOVED_OUT):
+            self.__close()
+            return
+
+        if not self.__read_source:
+            self.__read_source = GLib.idle_add(self.__read)
+
+    def __is_replaced(self) -> bool:
+        """
+        Checks whether the open file was replaced by another file at the same path.
+
+        :return: Whether the file was replaced.
+        """
+
+        return os.fstat(self.__fd).st_ino != os.stat(self.path).st_ino
+
+    def __close(self):
+        """
+        Closes the file.
+        """
+
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
@@ -0,0 +1,131 @@
+import math
+
+
+class _Axis:
+    """
+    The summed deltas of one scroll axis.
+
+    A leading step is taken ahead of the deltas that make it up. Until later deltas in the same
+    direction have paid it back, it is kept as debt and no further leading step is taken.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new axis without deltas.
+        """
+
+        self.remainder = 0.0
+        self.debt = 0.0
+        self.direction = 0.0
+
+    def add(self, delta: float):
+        """
+        Adds a delta. Deltas in the direction of the debt pay it back first,
+        deltas in the opposite direction drop it, so the remainder never crosses zero because of it.
+
+        :param delta: The delta.
+        """
+
+        if not delta:
+            return
+
+        direction = math.copysign(1, delta)
+
+        if self.debt:
+            if direction == self.direction:
+                paid = min(self.debt, abs(delta))
+                self.debt = round(self.debt - paid, 9)
+                delta -= direction * paid
+            else:
+                self.debt = 0.0
+
+        self.direction = direction
+        self.remainder += delta
+
+    def take(self, leading: bool) -> int:
+        """
+        Takes the whole steps.
+
+        :param leading: Whether to take a step ahead of a fractional remainder.
+        :return: The steps.
+        """
+
+        # Round away floating point errors, so that ten deltas of 0.1 make a step.
+        remainder = round(self.remainder, 9)
+        steps = int(remainder)
+        remainder -= steps
+
+        if (
+            leading
+            and steps == 0
+            and not self.debt
+            and remainder
+            and math.copysign(1, remainder) == self.direction
+        ):
+            steps = int(self.direction)
+            self.debt = round(1 - abs(remainder), 9)
+            remainder = 0.0
+
+        self.remainder = remainder
+        return steps
+
+    def reset(self):
+        """
+        Drops the remainder and the debt.
+        """
+
+        self.remainder = 0.0
+        self.debt = 0.0
+        self.direction = 0.0
+
+
+class ScrollAccumulator:
+    """
+    Sums smooth scroll deltas into whole steps.
+    Fractional remainders are carried over to the next time the steps are taken.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new ScrollAccumulator.
+        """
+
+        self.__x = _Axis()
+        self.__y = _Axis()
+
+    def add(self, dx: float, dy: float):
+        """
+        Adds scroll deltas. A delta of 1 equals one step.
+
+        :param dx: The horizontal delta.
+        :param dy: The vertical delta.
+        """
+
+        self.__x.add(dx)
+        self.__y.add(dy)
+
+    @property
+    def pending(self) -> bool:
+        """
+        Whether there are deltas that were not taken yet.
+        """
+
+        return self.__x.remainder != 0 or self.__y.remainder != 0
+
+    def take(self, leading: bool = False) -> tuple[int, int]:
+        """
+        Takes the whole steps of the summed deltas.
+
+        :param leading: Whether to take a step ahead of a pending delta, unless a previous leading step was not paid back yet.
+        :return: The horizontal and vertical steps.
+        """
+
+        return self.__x.take(leading), self.__y.take(leading)
+
+    def reset(self):
+        """
+        Drops all pending deltas.
+        """
+
+        self.__x.reset()
+        self.__y.reset()
@@ -1,24 +1,119 @@
 import logging
 import re
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
 from typing import Callable
 from gi.repository import GLib, Gio
 
+CHUNK_SIZE = 64 * 1024
+"""
+The maximum number of bytes read from stdout per wakeup.
+"""
+
+MAX_RUNNING_COMMANDS = 8
+"""
+The maximum number of one-shot commands running at the same time. Further commands are queued.
+"""
+
+__running_commands = 0
+__queued_commands: deque[Callable[[], None]] = deque()
+
+__listeners: dict[tuple[str, ...], "Listener"] = {}
+__subscriptions: dict[int, "Listener"] = {}
+__next_subscription = 1
+
+
+class ReadMode(Enum):
+    """
+    Defines how the lines read from stdout are passed to the callback.
+
+    EACH: The callback is called for each line.
+    LATEST: The callback is called with the latest line of each read chunk.
+    BATCH: The callback is called with a list of all lines of each read chunk.
+    """
+
+    EACH = 1
+    LATEST = 2
+    BATCH = 3
+
+
+class LineBuffer:
+    """
+    Splits a stream of bytes into lines.
+    """
+
+    def __init__(self):
+        """
+        Creates a new LineBuffer.
+        """
+
+        self.__buffer = bytearray()
+
+    def feed(self, data: bytes) -> list[str]:
+        """
+        Appends data to the buffer and returns all complete lines.
+
+        :param data: The data to append.
+        :return: The complete lines without line endings.
+        """
+
+        self.__buffer += data
+
+        end = self.__buffer.rfind(b"\n")
+        if end < 0:
+            return []
+
+        lines = self.__buffer[:end].decode("utf-8", errors="replace").split("\n")
+        del self.__buffer[: end + 1]
+        return lines
+
+    def flush(self) -> list[str]:
+        """
+        Returns the remaining incomplete line and clears the buffer.
+
+        :return: The remaining line, if any.
+        """
+
+        if not self.__buffer:
+            return []
+
+        line = self.__buffer.decode("utf-8", errors="replace")
+        self.__buffer.clear()
+        return [line]
+
+
+def normalize_command(cmd: list[str] | str) -> list[str]:
+    """
+    Normalizes a command to a list of arguments.
+
+    :param cmd: The command as list or whitespace separated string.
+    :return: The list of arguments.
+    """
+
+    if type(cmd) is str:
+        return re.split(r"\s+", cmd.strip())
+
+    return list(cmd)
+
 
 def subprocess(
     cmd: list[str] | str,
-    callback: Callable[[str], None],
+    callback: Callable[[str], None] | Callable[[list[str]], None],
+    mode: ReadMode = ReadMode.EACH,
 ):
     """
-    Starts a subprocess and calls the callback for each line of stdout.
+    Starts a subprocess and calls the callback with the lines of stdout.
+    stdout is read in large chunks, see ReadMode for how the lines are passed to the callback.
 
     :param cmd: The command to run.
-    :param callback: The callback to call for each line of stdout.
+    :param callback: The callback to call with the lines of stdout.
+    :param mode: How the lines are passed to the callback.
     :return: The subprocess.
     """
 
     try:
-        if type(cmd) is str:
-            cmd = re.split(r"\s+", cmd)
+        cmd = normalize_command(cmd)
 
         process = Gio.Subprocess.new(
             cmd,
@@ -28,34 +123,378 @@ def subprocess(
         if not process:
             raise Exception("failed to start subprocess: process is None")
 
-        def read(stdout: Gio.DataInputStream):
-            def cb(stream: Gio.DataInputStream, res):
-                if stream:
-                    (output, _) = stream.read_line_finish_utf8(res)
-                    if type(output) is str:
-                        callback(output)
-                        read(stream)
+        buffer = LineBuffer()
 
-            stdout.read_line_async(GLib.PRIORITY_LOW, None, cb)
+        def dispatch(lines: list[str]):
+            if not lines:
+                return
 
-        pipe = process.get_stdout_pipe()
-        if not pipe:
-            raise Exception("failed to start subprocess: stdout is None")
+            match mode:
+                case ReadMode.EACH:
+                    for line in lines:
+                        callback(line)
+                case ReadMode.LATEST:
+                    callback(lines[-1])
+                case ReadMode.BATCH:
+                    callback(lines)
 
-        stdout = Gio.DataInputStream(
-            base_stream=pipe,
-            close_base_stream=True,
-        )
+        def read(stdout: Gio.InputStream):
+            def cb(stream: Gio.InputStream, res):
+                try:
+                    data = stream.read_bytes_finish(res)
+                except GLib.Error as e:
+                    logging.debug(f"Stopped reading subprocess output: {e.message}")
+                    return
+
+                chunk = data.get_data() if data else None
+                if not chunk:
+                    dispatch(buffer.flush())
+                    return
+
+                dispatch(buffer.feed(chunk))
+                read(stream)
+
+            stdout.read_bytes_async(CHUNK_SIZE, GLib.PRIORITY_LOW, None, cb)
+
+        stdout = process.get_stdout_pipe()
+        if not stdout:
+            raise Exception("failed to start subprocess: stdout is None")
 
         read(stdout)
 
-        process.wait_async(
-            None,
-            lambda *_: logging.info(
-                f"Subprocess finished with exit code {process.get_exit_status()}"
-            ),
-        )
+        def on_exit(*_):
+            if process.get_if_exited():
+                logging.info(
+                    f"Subprocess finished with exit code {process.get_exit_status()}"
+                )
+            else:
+                logging.info(
+                    f"Subprocess was stopped by signal {process.get_term_sig()}"
+                )
+
+        process.wait_async(None, on_exit)
 
         return process
     except Exception as e:
         raise Exception(f"failed to start subprocess {e}")
+
+
+class Listener:
+    """
+    A long-running subprocess whose lines are passed to all of its subscribers.
+    The last line is kept, so that late subscribers start with the current state.
+    """
+
+    def __init__(self, cmd: list[str]):
+        """
+        Starts the subprocess.
+
+        :param cmd: The command to run.
+        """
+
+        self.cmd = cmd
+        self.last_line: str | None = None
+        self.__subscribers: dict[int, tuple[Callable, ReadMode]] = {}
+        self.process = subprocess(cmd, self.__on_lines, ReadMode.BATCH)
+
+    @property
+    def subscriber_count(self) -> int:
+        """
+        The number of subscribers.
+        """
+
+        return len(self.__subscribers)
+
+    def subscribe(
+        self,
+        subscription: int,
+        callback: Callable[[str], None] | Callable[[list[str]], None],
+        mode: ReadMode,
+    ):
+        """
+        Adds a subscriber and passes the last line to it, if any.
+
+        :param subscription: The id of the subscription.
+        :param callback: The callback to call with the lines.
+        :param mode: How the lines are passed to the callback.
+        """
+
+        self.__subscribers[subscription] = (callback, mode)
+
+        if self.last_line is not None:
+            self.__dispatch(callback, mode, [self.last_line])
+
+    def unsubscribe(self, subscription: int):
+        """
+        Removes a subscriber.
+
+        :param subscription: The id of the subscription.
+        """
+
+        self.__subscribers.pop(subscription, None)
+
+    def stop(self):
+        """
+        Stops the subprocess.
+        """
+
+        self.process.force_exit()
+
+    def __on_lines(self, lines: list[str]):
+        """
+        Passes the lines read from stdout to all subscribers.
+
+        :param lines: The lines.
+        """
+
+        self.last_line = lines[-1]
+
+        for callback, mode in list(self.__subscribers.values()):
+            self.__dispatch(callback, mode, lines)
+
+    def __dispatch(self, callback: Callable, mode: ReadMode, lines: list[str]):
+        """
+        Passes lines to a subscriber.
+
+        :param callback: The callback of the subscriber.
+        :param mode: How the lines are passed to the callback.
+        :param lines: The lines.
+        """
+
+        try:
+            match mode:
+                case ReadMode.EACH:
+                    for line in lines:
+                        callback(line)
+                case ReadMode.LATEST:
+                    callback(lines[-1])
+                case ReadMode.BATCH:
+                    callback(lines)
+        except Exception as e:
+            logging.error(f"Subscriber of {self.cmd} failed: {e}")
+
+
+def listen(
+    cmd: list[str] | str,
+    callback: Callable[[str], None] | Callable[[list[str]], None],
+    mode: ReadMode = ReadMode.EACH,
+) -> int:
+    """
+    Subscribes to the lines of a long-running command.
+    Subscribers of the same command share a single subprocess, which is stopped when the last subscriber unsubscribes.
+
+    :param cmd: The command to run.
+    :param callback: The callback to call with the lines of stdout.
+    :param mode: How the lines are passed to the callback.
+    :return: The id of the subscription.
+    """
+
+    global __next_subscription
+
+    key = tuple(normalize_command(cmd))
+    listener = __listeners.get(key)
+
+    if not listener:
+        listener = Listener(list(key))
+        __listeners[key] = listener
+        listener.process.wait_async(None, lambda *_: __on_listener_exit(listener))
+
+    subscription = __next_subscription
+    __next_subscription += 1
+    __subscriptions[subscription] = listener
+
+    listener.subscribe(subscription, callback, mode)
+    return subscription
+
+
+def unlisten(subscription: int) -> bool:
+    """
+    Removes a subscription. The subprocess is stopped when it has no subscribers left.
+
+    :param subscription: The id of the subscription.
+    :return: Whether the subscription existed.
+    """
+
+    listener = __subscriptions.pop(subscription, None)
+    if not listener:
+        return False
+
+    listener.unsubscribe(subscription)
+
+    if not listener.subscriber_count:
+        # An exited listener may already be replaced by a new one.
+        key = tuple(listener.cmd)
+        if __listeners.get(key) is listener:
+            del __listeners[key]
+
+        listener.stop()
+
+    return True
+
+
+def get_listener(cmd: list[str] | str) -> Listener | None:
+    """
+    Gets the running listener of a command.
+
+    :param cmd: The command.
+    :return: The listener or None.
+    """
+
+    return __listeners.get(tuple(normalize_command(cmd)))
+
+
+def __on_listener_exit(listener: Listener):
+    """
+    Called when the subprocess of a listener has exited.
+    The next subscriber of the command starts a new subprocess.
+
+    :param listener: The listener.
+    """
+
+    key = tuple(listener.cmd)
+    if __listeners.get(key) is listener:
+        del __listeners[key]
+
+
+@dataclass
+class CommandResult:
+    """
+    The result of a one-shot command.
+
+    :param stdout: The output of the command.
+    :param stderr: The error output of the command.
+    :param exit_status: The exit status, or None if the command did not exit normally.
+    :param timed_out: Whether the command was stopped because it exceeded the timeout.
+    """
+
+    stdout: str
+    stderr: str
+    exit_status: int | None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the command exited with status 0.
+        """
+
+        return self.exit_status == 0
+
+
+def run(
+    cmd: list[str] | str,
+    callback: Callable[[CommandResult], None] | None = None,
+    timeout: float | None = None,
+):
+    """
+    Runs a one-shot command without blocking and calls the callback with its result on the GLib main loop.
+    At most MAX_RUNNING_COMMANDS commands run at the same time, further commands are queued.
+
+    :param cmd: The command to run.
+    :param callback: The callback to call with the result.
+    :param timeout: The time in seconds after which the command is stopped.
+    """
+
+    cmd = normalize_command(cmd)
+    __queued_commands.append(lambda: __start_command(cmd, callback, timeout))
+    __start_queued_commands()
+
+
+def running_commands() -> int:
+    """
+    Gets the number of running one-shot commands.
+
+    :return: The number of running commands.
+    """
+
+    return __running_commands
+
+
+def queued_commands() -> int:
+    """
+    Gets the number of one-shot commands waiting to be started.
+
+    :return: The number of queued commands.
+    """
+
+    return len(__queued_commands)
+
+
+def __start_queued_commands():
+    """
+    Starts queued commands until the limit of running commands is reached.
+    """
+
+    global __running_commands
+
+    while __queued_commands and __running_commands < MAX_RUNNING_COMMANDS:
+        __running_commands += 1
+        __queued_commands.popleft()()
+
+
+def __start_command(
+    cmd: list[str],
+    callback: Callable[[CommandResult], None] | None,
+    timeout: float | None,
+):
+    """
+    Starts a one-shot command. The command has to be counted as running already.
+
+    :param cmd: The command to run.
+    :param callback: The callback to call with the result.
+    :param timeout: The time in seconds after which the command is stopped.
+    """
+
+    timeout_id: int | None = None
+    timed_out = False
+
+    def finish(result: CommandResult):
+        global __running_commands
+
+        if timeout_id:
+            GLib.source_remove(timeout_id)
+
+        __running_commands -= 1
+
+        if callback:
+            try:
+                callback(result)
+            except Exception as e:
+                logging.error(f"Callback of command {cmd} failed: {e}")
+
+        __start_queued_commands()
+        return GLib.SOURCE_REMOVE
+
+    try:
+        process = Gio.Subprocess.new(
+            cmd,
+            Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_PIPE,
+        )
+    except GLib.Error as e:
+        logging.error(f"Failed to start command {cmd}: {e.message}")
+        GLib.idle_add(finish, CommandResult("", e.message, None))
+        return
+
+    def on_timeout():
+        nonlocal timeout_id, timed_out
+
+        timeout_id = None
+        timed_out = True
+        logging.warning(f"Command {cmd} timed out after {timeout}s.")
+        process.force_exit()
+        return GLib.SOURCE_REMOVE
+
+    def on_done(process: Gio.Subprocess, res):
+        try:
+            _, stdout, stderr = process.communicate_utf8_finish(res)
+        except GLib.Error as e:
+            logging.debug(f"Failed to read output of command {cmd}: {e.message}")
+            stdout, stderr = "", ""
+
+        exit_status = process.get_exit_status() if process.get_if_exited() else None
+        finish(CommandResult(stdout or "", stderr or "", exit_status, timed_out))
+
+    if timeout is not None:
+        timeout_id = GLib.timeout_add(int(timeout * 1000), on_timeout)
+
+    process.communicate_utf8_async(None, None, on_done)
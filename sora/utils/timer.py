@@ -0,0 +1,200 @@
+import logging
+from typing import Callable
+
+from gi.repository import GLib
+
+STAGGER_SLOTS = 4
+"""
+The number of phases a period is split into for staggered timers.
+"""
+
+
+class _TimerGroup:
+    """
+    Timers that share the same period and phase and are run by a single GLib source.
+    """
+
+    def __init__(self, interval: float, phase: float):
+        """
+        Creates a new timer group and starts its source.
+
+        :param interval: The period in seconds.
+        :param phase: The offset of the first run in seconds.
+        """
+
+        self.interval = interval
+        self.phase = phase
+        self.callbacks: dict[int, Callable[[], None]] = {}
+        self.__source_id: int | None = None
+
+        if phase:
+            self.__source_id = GLib.timeout_add(int(phase * 1000), self.__start)
+        else:
+            self.__start()
+
+    def __start(self):
+        """
+        Starts the periodic source.
+        Whole second periods use timeout_add_seconds, so that their wakeups are grouped with other sources.
+        """
+
+        if not self.phase and self.interval == int(self.interval):
+            self.__source_id = GLib.timeout_add_seconds(int(self.interval), self.__tick)
+        else:
+            self.__source_id = GLib.timeout_add(int(self.interval * 1000), self.__tick)
+
+        return GLib.SOURCE_REMOVE
+
+    def __tick(self):
+        """
+        Runs all callbacks of the group.
+        """
+
+        for callback in list(self.callbacks.values()):
+            try:
+                callback()
+            except Exception as e:
+                logging.error(f"Timer callback {callback} failed: {e}")
+
+        return GLib.SOURCE_CONTINUE
+
+    def stop(self):
+        """
+        Stops the source of the group.
+        """
+
+        if self.__source_id:
+            GLib.source_remove(self.__source_id)
+            self.__source_id = None
+
+
+class TimerWheel:
+    """
+    Owns periodic timers. Timers with the same period share a single wakeup.
+    """
+
+    def __init__(self):
+        """
+        Creates a new TimerWheel.
+        """
+
+        self.__groups: dict[tuple[float, int], _TimerGroup] = {}
+        self.__timers: dict[int, tuple[float, int]] = {}
+        self.__next_handle = 1
+
+    @property
+    def sources(self) -> int:
+        """
+        The number of GLib sources used by the timers.
+        """
+
+        return len(self.__groups)
+
+    def add(
+        self,
+        interval: float,
+        callback: Callable[[], None],
+        stagger: bool = False,
+    ) -> int:
+        """
+        Adds a periodic timer.
+
+        :param interval: The period in seconds. Fractions of a second are supported.
+        :param callback: The function to call every period.
+        :param stagger: Whether to spread the timer across the period instead of running it with all other timers of the same period.
+        :return: The handle of the timer.
+        """
+
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+
+        slot = self.__find_slot(interval) if stagger else 0
+        key = (interval, slot)
+
+        group = self.__groups.get(key)
+        if not group:
+            group = _TimerGroup(interval, interval * slot / STAGGER_SLOTS)
+            self.__groups[key] = group
+
+        handle = self.__next_handle
+        self.__next_handle += 1
+
+        group.callbacks[handle] = callback
+        self.__timers[handle] = key
+        return handle
+
+    def remove(self, handle: int) -> bool:
+        """
+        Removes a periodic timer.
+
+        :param handle: The handle of the timer.
+        :return: Whether the timer existed.
+        """
+
+        key = self.__timers.pop(handle, None)
+        if not key:
+            return False
+
+        group = self.__groups[key]
+        del group.callbacks[handle]
+
+        if not group.callbacks:
+            group.stop()
+            del self.__groups[key]
+
+        return True
+
+    def __find_slot(self, interval: float) -> int:
+        """
+        Finds the phase slot of the given period with the fewest timers.
+
+        :param interval: The period in seconds.
+        :return: The slot.
+        """
+
+        def size(slot: int):
+            group = self.__groups.get((interval, slot))
+            return len(group.callbacks) if group else 0
+
+        return min(range(STAGGER_SLOTS), key=size)
+
+
+__wheel = TimerWheel()
+
+
+def get_wheel() -> TimerWheel:
+    """
+    Gets the shared timer wheel.
+
+    :return: The shared timer wheel.
+    """
+
+    return __wheel
+
+
+def add_timer(
+    interval: float,
+    callback: Callable[[], None],
+    stagger: bool = False,
+) -> int:
+    """
+    Adds a periodic timer to the shared timer wheel.
+
+    :param interval: The period in seconds. Fractions of a second are supported.
+    :param callback: The function to call every period.
+    :param stagger: Whether to spread the timer across the period.
+    :return: The handle of the timer.
+    """
+
+    return __wheel.add(interval, callback, stagger)
+
+
+def remove_timer(handle: int) -> bool:
+    """
+    Removes a periodic timer from the shared timer wheel.
+
+    :param handle: The handle of the timer.
+    :return: Whether the timer existed.
+    """
+
+    return __wheel.remove(handle)
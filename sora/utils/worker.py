@@ -0,0 +1,88 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from gi.repository import GLib
+
+T = TypeVar("T")
+
+MAX_WORKERS = 4
+"""
+The maximum number of worker threads.
+"""
+
+__executor: ThreadPoolExecutor | None = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Gets the shared worker pool. The pool is created on first use.
+
+    :return: The worker pool.
+    """
+
+    global __executor
+
+    if not __executor:
+        __executor = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS,
+            thread_name_prefix="sora-worker",
+        )
+
+    return __executor
+
+
+def submit(
+    func: Callable[[], T],
+    callback: Callable[[T], None],
+    timeout: float | None = None,
+    on_timeout: Callable[[], None] | None = None,
+) -> Future:
+    """
+    Runs a function on the worker pool and calls the callback with its result on the GLib main loop.
+    Results of runs that exceeded the timeout are dropped.
+    A thread cannot be interrupted, so a timed out run keeps its worker until the function returns.
+
+    :param func: The function to run.
+    :param callback: The callback to call with the result.
+    :param timeout: The time in seconds after which the result is dropped.
+    :param on_timeout: The callback to call on the GLib main loop when the run has timed out.
+    :return: The future of the run.
+    """
+
+    timeout_id: int | None = None
+    timed_out = False
+
+    def on_timeout_reached():
+        nonlocal timeout_id, timed_out
+
+        timeout_id = None
+        timed_out = True
+        logging.warning(f"Worker run of {func} timed out after {timeout}s.")
+
+        if on_timeout:
+            on_timeout()
+
+        return GLib.SOURCE_REMOVE
+
+    def on_done(future: Future):
+        if timeout_id:
+            GLib.source_remove(timeout_id)
+
+        if timed_out:
+            return GLib.SOURCE_REMOVE
+
+        if error := future.exception():
+            logging.error(f"Worker run of {func} failed: {error}")
+        else:
+            callback(future.result())
+
+        return GLib.SOURCE_REMOVE
+
+    future = get_executor().submit(func)
+
+    if timeout is not None:
+        timeout_id = GLib.timeout_add(int(timeout * 1000), on_timeout_reached)
+
+    future.add_done_callback(lambda f: GLib.idle_add(on_done, f))
+    return future
@@ -54,6 +54,7 @@ def BaseWidget(Widget: type[Gtk.Widget]):
         """
 
         __cursor: Cursor = Cursor.DEFAULT
+        __hover_handlers: tuple[int, int] | None = None
 
         def __init__(self, props: BaseWidgetProps):
             """
@@ -63,6 +64,7 @@ def BaseWidget(Widget: type[Gtk.Widget]):
             """
 
             super().__init__()
+            self._props = props
             self._bind_property("name", props.name)
             self._bind_property("visible", props.visible)
             self._bind_property("tooltip-text", props.tooltip_text)
@@ -74,11 +76,6 @@ def BaseWidget(Widget: type[Gtk.Widget]):
             self._bind_property("classnames", props.classnames)
             self._bind_property("cursor", props.cursor)
 
-            self.add_events(Gdk.EventMask.ENTER_NOTIFY_MASK)
-            self.add_events(Gdk.EventMask.LEAVE_NOTIFY_MASK)
-            self.connect("enter-notify-event", self.__set_cursor_on_hover)
-            self.connect("leave-notify-event", self.__unset_cursor_on_hover)
-
         @GObject.Property(type=GObject.TYPE_PYOBJECT)
         def classnames(self) -> list[str]:
             """
@@ -91,17 +88,22 @@ def BaseWidget(Widget: type[Gtk.Widget]):
         def classnames(self, classnames: list[str] | str):
             """
             Sets the classnames of the widget.
+            Only the classes that have changed are removed or added.
             """
 
             if type(classnames) is str:
                 classnames = re.split(" +", classnames.strip())
 
             style_context = self.get_style_context()
-            for classname in style_context.list_classes():
+            current = set(style_context.list_classes())
+            new = set(classnames)
+
+            for classname in current - new:
                 style_context.remove_class(classname)
 
-            for classname in classnames:
-                style_context.add_class(classname)
+            for classname in dict.fromkeys(classnames):
+                if classname and classname not in current:
+                    style_context.add_class(classname)
 
         @GObject.Property(type=GObject.TYPE_PYOBJECT)
         def cursor(self):
@@ -115,10 +117,26 @@ def BaseWidget(Widget: type[Gtk.Widget]):
         def cursor(self, cursor: Cursor):
             """
             Sets the cursor of the widget.
+            The hover handlers are only connected while the cursor is not the default cursor.
             """
 
             self.__cursor = cursor
 
+            if cursor != Cursor.DEFAULT and not self.__hover_handlers:
+                self.add_events(
+                    Gdk.EventMask.ENTER_NOTIFY_MASK | Gdk.EventMask.LEAVE_NOTIFY_MASK
+                )
+                self.__hover_handlers = (
+                    self.connect("enter-notify-event", self.__set_cursor_on_hover),
+                    self.connect("leave-notify-event", self.__unset_cursor_on_hover),
+                )
+            elif cursor == Cursor.DEFAULT and self.__hover_handlers:
+                for handler_id in self.__hover_handlers:
+                    self.disconnect(handler_id)
+
+                self.__hover_handlers = None
+                self.__unset_cursor_on_hover()
+
         def __set_cursor_on_hover(self, *_):
             """
             Sets the cursor on hover.
@@ -1,12 +1,32 @@
 import logging
+import weakref
+from concurrent.futures import Future
 from typing import Any, Callable, Generic, TypeVar
 
-from gi.repository import GObject, GLib, Gio
-
-from sora.utils.spawn import subprocess
+from gi.repository import GObject, GLib
+
+from sora.utils.batch import queue_property
+from sora.utils.definition import definition, function_key
+from sora.utils.file import FileWatcher
+from sora.utils.spawn import (
+    CommandResult,
+    ReadMode,
+    listen,
+    normalize_command,
+    run,
+    unlisten,
+)
+from sora.utils.timer import add_timer, remove_timer
+from sora.utils.worker import submit
 
 T = TypeVar("T")
 
+MAX_TIMED_OUT_RUNS = 2
+"""
+The maximum number of timed out runs of a threaded interval variable that may still occupy a worker.
+Further polls are skipped until one of them has returned.
+"""
+
 
 class Variable(Generic[T], GObject.GObject):
     """
@@ -16,85 +36,620 @@ class Variable(Generic[T], GObject.GObject):
     __value: T
     __transform: Callable[[T], Any] | None = None
     __interval_id: int | None = None
-    __process: Gio.Subprocess | None = None
+    __future: Future | None = None
+    __timed_out_runs: int = 0
+    __subscription: int | None = None
+    __watcher: FileWatcher | None = None
+    __compare: Callable[[Any, Any], bool] | None = None
+    __default_compare: Callable[[Any, Any], bool] | None = None
+    __key: Callable[[T], Any] | None = None
+    __suppressed_updates: int = 0
+    __version: int = 0
+    __compute: Callable[..., T] | None = None
+    __dependencies: tuple["Variable", ...] = ()
+    __dependents: weakref.WeakSet["Variable"]
+    __versions: tuple[int, ...] | None = None
+    __stale: bool = False
+    __depth: int = 0
+    __transformed: Any = None
+    __transformed_version: int | None = None
+    __transform_cache_hits: int = 0
+    __source_args: tuple | None = None
+
+    __sources: list["Variable"] = []
+    """
+    The running polling, listening and file variables of all instances.
+    """
+
+    __reusable: dict[tuple, list["Variable"]] | None = None
+    """
+    The running variables that can be reused during a config reload.
+    """
+
+    __scopes: list[list["Variable"]] = []
+    """
+    The running variables collected by the active collect_sources calls, innermost last.
+    """
 
-    def __init__(self, v: T) -> None:
+    def __init__(
+        self,
+        v: T,
+        compare: Callable[[Any, Any], bool] | None = None,
+        key: Callable[[T], Any] | None = None,
+    ) -> None:
         """
         Creates a new variable.
 
         :param v: The initial value.
+        :param compare: The function to check whether two values are equal (default: ==).
+        :param key: The function to get the value to compare from a value.
         """
 
         super().__init__()
         self.__value = v
+        self.__compare = compare
+        self.__key = key
+        self.__dependents = weakref.WeakSet()
+
+    def distinct(
+        self,
+        compare: Callable[[Any, Any], bool] | None = None,
+        key: Callable[[T], Any] | None = None,
+    ):
+        """
+        Sets how a new value is compared to the current one.
+        Updates with an equal value are suppressed.
+
+        :param compare: The function to check whether two values are equal (default: ==).
+        :param key: The function to get the value to compare from a value.
+        :return: The variable.
+        """
+
+        self.__compare = compare
+        self.__key = key
+        return self
 
     def transform(self, transform: Callable[[T], Any]):
         """
         Sets the transform function.
+        The transformed value is cached until the value or the transform function changes.
 
         :param transform: The transform function.
         :return: The variable.
         """
 
         self.__transform = transform
+        self.__transformed_version = None
         return self
 
     @classmethod
-    def interval(cls, interval, func: Callable[[], T]):
+    def interval(
+        cls,
+        interval,
+        func: Callable[[], T],
+        threaded: bool = False,
+        timeout: float | None = None,
+        initial: T | None = None,
+        stagger: bool = False,
+    ):
         """
         Creates a new variable that updates itself every interval seconds.
+        Variables with the same interval are polled in a single wakeup.
 
         :param interval: The interval in seconds.
         :param func: The function to get the value from.
+        :param threaded: Whether to run the function on the worker pool instead of the main loop.
+        :param timeout: The time in seconds after which a threaded run is dropped and the next poll starts a new run.
+        :param initial: The initial value until the first threaded run has finished.
+        :param stagger: Whether to spread the poll across the interval instead of running it with all other variables of the same interval.
         :return: The created variable.
         """
 
-        variable = Variable(func())
-
-        def on_timeout():
-            variable.value = func()
-            return GLib.SOURCE_CONTINUE
-
-        variable.__interval_id = GLib.timeout_add_seconds(interval, on_timeout)
+        args = ("interval", interval, func, threaded, timeout, stagger)
+        if variable := Variable.__reuse(args):
+            return variable
+
+        if not threaded:
+            variable = Variable(func())
+            variable.__register(args)
+
+            def on_timeout():
+                variable.value = func()
+
+            variable.__interval_id = add_timer(interval, on_timeout, stagger)
+            return variable
+
+        variable = Variable(initial)
+        variable.__register(args)
+
+        def on_result(value: T):
+            if variable.__interval_id:
+                variable.value = value
+
+        def on_timed_out_return():
+            variable.__timed_out_runs -= 1
+            return GLib.SOURCE_REMOVE
+
+        def on_run_timeout(future: Future):
+            # The run keeps its worker, but polling resumes with a new run.
+            if variable.__future is future:
+                variable.__future = None
+
+            variable.__timed_out_runs += 1
+            if variable.__timed_out_runs >= MAX_TIMED_OUT_RUNS:
+                logging.warning(
+                    f"Pausing polls of {func}: {variable.__timed_out_runs} timed out runs are still running."
+                )
+
+            future.add_done_callback(lambda _: GLib.idle_add(on_timed_out_return))
+
+        def poll():
+            if variable.__future and not variable.__future.done():
+                logging.debug(f"Skipping poll of {func}: previous run still running.")
+            elif variable.__timed_out_runs >= MAX_TIMED_OUT_RUNS:
+                logging.debug(f"Skipping poll of {func}: too many timed out runs.")
+            else:
+                future = submit(
+                    func, on_result, timeout, lambda: on_run_timeout(future)
+                )
+                variable.__future = future
+
+        variable.__interval_id = add_timer(interval, poll, stagger)
+        poll()
         return variable
 
     @classmethod
     def listen(cls, cmd: list[str], initial: str = ""):
         """
         Creates a new variable that listens on a command output and updates itself.
+        When multiple lines are read at once, only the latest line is used.
+        Variables listening on the same command share a single process.
+        Every line notifies, even if it equals the previous one (e.g. the events of "pactl subscribe"),
+        unless equal lines are suppressed with distinct().
 
         :param cmd: The listening command.
         :param initial: The initial value.
         :return: The created variable.
         """
 
-        variable = cls(initial)
+        cmd = normalize_command(cmd)
+        args = ("listen", tuple(cmd))
+        if variable := Variable.__reuse(args):
+            return variable
+
+        variable = cls(initial, compare=Variable.__never_equal)
+        variable.__default_compare = Variable.__never_equal
+        variable.__register(args)
 
         def on_data(data: str):
-            print(data)
             variable.value = data
 
-        variable.__process = subprocess(cmd, on_data)
+        variable.__subscription = listen(cmd, on_data, ReadMode.LATEST)
+        return variable
+
+    @classmethod
+    def file(
+        cls,
+        path: str,
+        parse: Callable[[str], T] | None = None,
+        poll_interval: float = 5,
+        initial: T | None = None,
+    ):
+        """
+        Creates a new variable that holds the content of a file and updates itself when the file changes.
+        The file is kept open and only read again after a change event. Files in /proc and /sys
+        do not emit change events and are polled every poll_interval seconds instead.
+
+        :param path: The path of the file.
+        :param parse: The function to get the value from the content of the file (default: the stripped content).
+        :param poll_interval: The interval in seconds to poll files in /proc and /sys with.
+        :param initial: The value while the file cannot be read.
+        :return: The created variable.
+        """
+
+        args = ("file", str(path), parse, poll_interval)
+        if variable := Variable.__reuse(args):
+            return variable
+
+        variable = cls(initial)
+        variable.__register(args)
+
+        def on_content(content: str):
+            variable.value = parse(content) if parse else content.strip()
+
+        variable.__watcher = FileWatcher(path, on_content, poll_interval)
+        return variable
+
+    @classmethod
+    def command(
+        cls,
+        cmd: list[str] | str,
+        timeout: float | None = None,
+        initial: CommandResult | None = None,
+    ) -> "Variable[CommandResult | None]":
+        """
+        Creates a new variable that is set to the result of a one-shot command once it has finished.
+        The command is run without blocking the main loop.
+
+        :param cmd: The command to run.
+        :param timeout: The time in seconds after which the command is stopped.
+        :param initial: The initial value until the command has finished.
+        :return: The created variable.
+        """
+
+        variable = cls(initial)
+
+        def on_result(result: CommandResult):
+            variable.value = result
+
+        run(cmd, on_result, timeout)
+        return variable
+
+    @classmethod
+    def computed(cls, compute: Callable[..., T], *dependencies: "Variable"):
+        """
+        Creates a new variable that is computed from the values of other variables.
+        The value is only recomputed after a dependency has actually changed:
+        right away when the variable is bound, otherwise lazily on the next read.
+
+        The dependencies only hold weak references to the variable, so it is freed once it is no longer used.
+
+        :param compute: The function to compute the value, called with the values of the dependencies.
+        :param dependencies: The variables the value is computed from.
+        :return: The created variable.
+        """
+
+        variable = cls(None)
+        variable.__compute = compute
+        variable.__dependencies = dependencies
+        variable.__depth = 1 + max((d.__depth for d in dependencies), default=0)
+        variable.__stale = True
+
+        for dependency in dependencies:
+            dependency.__dependents.add(variable)
+
+        return variable
+
+    @classmethod
+    def begin_reload(cls):
+        """
+        Starts a config reload. Polling and listening variables that are created again
+        with the same arguments are reused with their current value instead of being restarted.
+        """
+
+        Variable.__reusable = {}
+
+        for variable in Variable.__sources:
+            key = Variable.__source_key(variable.__source_args)
+            # Variables without a comparable key are not reused, but still stopped.
+            if key is None:
+                key = ("unreusable", id(variable))
+
+            Variable.__reusable.setdefault(key, []).append(variable)
+
+    @classmethod
+    def end_reload(cls, stop_unused: bool = True):
+        """
+        Ends a config reload.
+
+        :param stop_unused: Whether to stop the running variables that were not reused.
+        """
+
+        reusable = Variable.__reusable or {}
+        Variable.__reusable = None
+
+        if not stop_unused:
+            return
+
+        for variables in reusable.values():
+            for variable in variables:
+                variable.stop()
+
+    @classmethod
+    def is_reloading(cls) -> bool:
+        """
+        Checks whether a config reload is in progress.
+
+        :return: Whether a config reload is in progress.
+        """
+
+        return Variable.__reusable is not None
+
+    @classmethod
+    def collect_sources(cls, func: Callable[[], Any]) -> tuple[Any, list["Variable"]]:
+        """
+        Calls a function and collects the polling, listening and file variables it creates,
+        so that they can be stopped together with the widgets built by the function.
+
+        :param func: The function to call.
+        :return: The result of the function and the collected variables.
+        """
+
+        variables = []
+        Variable.__scopes.append(variables)
+
+        try:
+            return func(), variables
+        finally:
+            Variable.__scopes.remove(variables)
+
+    @staticmethod
+    def __source_key(args: tuple) -> tuple | None:
+        """
+        Gets a hashable key from the arguments of a running variable.
+        Functions are compared by their definition, or by their identity if the definition is not hashable
+        (e.g. when a closure captures a set).
+
+        :param args: The arguments of the variable.
+        :return: The key or None if the arguments are not hashable.
+        """
+
+        for get_key in (function_key, id):
+            key = tuple(get_key(a) if callable(a) else a for a in args)
+            try:
+                hash(key)
+                return key
+            except TypeError:
+                continue
+
+        return None
+
+    @classmethod
+    def __reuse(cls, args: tuple) -> "Variable | None":
+        """
+        Takes a running variable with the given arguments during a config reload.
+        Its transform and comparison functions are reset, so that they can be set again.
+
+        :param args: The arguments of the variable.
+        :return: The running variable or None.
+        """
+
+        if not Variable.__reusable:
+            return None
+
+        key = Variable.__source_key(args)
+        if key is None or not (variables := Variable.__reusable.get(key)):
+            return None
+
+        variable = variables.pop()
+        variable.__transform = None
+        variable.__transformed_version = None
+        variable.__compare = variable.__default_compare
+        variable.__key = None
+
+        if Variable.__scopes:
+            Variable.__scopes[-1].append(variable)
+
         return variable
 
-    @GObject.Property(type=GObject.TYPE_PYOBJECT)
+    def __register(self, args: tuple):
+        """
+        Registers the variable as running source.
+        The arguments are only turned into a key when a config reload starts.
+
+        :param args: The arguments of the variable.
+        """
+
+        self.__source_args = args
+        Variable.__sources.append(self)
+
+        if Variable.__scopes:
+            Variable.__scopes[-1].append(self)
+
+    def __unregister(self):
+        """
+        Unregisters the variable as running source.
+        """
+
+        if self.__source_args is None:
+            return
+
+        if self in Variable.__sources:
+            Variable.__sources.remove(self)
+
+        self.__source_args = None
+
+    def stop(self):
+        """
+        Stops the interval, listener or file watcher of the variable. When none is running, nothing happens.
+        """
+
+        if self.__interval_id:
+            self.stop_interval()
+
+        if self.__subscription:
+            self.stop_listener()
+
+        if self.__watcher:
+            self.stop_watcher()
+
+    def definition(self):
+        """
+        Gets a comparable definition of the variable.
+        Computed variables are compared by their function and dependencies, all other variables by their identity.
+
+        :return: The definition.
+        """
+
+        functions = (
+            function_key(self.__transform),
+            function_key(self.__compare),
+            function_key(self.__key),
+        )
+
+        if self.__compute:
+            return (
+                "computed",
+                function_key(self.__compute),
+                definition(self.__dependencies),
+                functions,
+            )
+
+        return (self, functions)
+
+    @GObject.Property(
+        type=GObject.TYPE_PYOBJECT,
+        flags=GObject.ParamFlags.READWRITE | GObject.ParamFlags.EXPLICIT_NOTIFY,
+    )
     def value(self):
         """
         The value of the variable.
         """
 
-        if self.__transform:
-            return self.__transform(self.__value)
+        if self.__stale:
+            self.__refresh()
 
-        return self.__value
+        if not self.__transform:
+            return self.__value
+
+        if self.__transformed_version == self.__version:
+            self.__transform_cache_hits += 1
+            return self.__transformed
+
+        self.__transformed = self.__transform(self.__value)
+        self.__transformed_version = self.__version
+        return self.__transformed
 
     @value.setter
     def value(self, v: T):
         """
         Sets the value of the variable.
+        Notifies only when the value has changed.
         """
 
+        if self.__compute:
+            logging.error("Cannot set the value of a computed variable.")
+            return
+
+        if self.__update(v):
+            self.__invalidate_dependents()
+
+    def __update(self, v: T) -> bool:
+        """
+        Stores a new value and notifies when it has changed.
+
+        :param v: The new value.
+        :return: Whether the value has changed.
+        """
+
+        if self.__is_equal(self.__value, v):
+            self.__suppressed_updates += 1
+            return False
+
         self.__value = v
+        self.__version += 1
+        self.notify("value")
+        return True
+
+    def __refresh(self):
+        """
+        Brings the dependencies of a computed variable up to date
+        and recomputes the value if any of them has changed.
+        """
+
+        values = [dependency.value for dependency in self.__dependencies]
+        self.__stale = False
+
+        versions = tuple(dependency.__version for dependency in self.__dependencies)
+        if versions == self.__versions:
+            return
+
+        self.__versions = versions
+        self.__update(self.__compute(*values))
+
+    def __invalidate_dependents(self):
+        """
+        Marks all computed variables that depend on this variable as stale
+        and recomputes the observed ones, each at most once and in dependency order.
+        """
+
+        visited: set[Variable] = set()
+        observed: list[Variable] = []
+
+        def mark(variable: Variable):
+            for dependent in list(variable.__dependents):
+                if dependent in visited:
+                    continue
+
+                visited.add(dependent)
+                dependent.__stale = True
+                if dependent.__is_observed():
+                    observed.append(dependent)
+
+                mark(dependent)
+
+        mark(self)
+
+        for dependent in sorted(observed, key=lambda d: d.__depth):
+            if dependent.__stale:
+                dependent.__refresh()
+
+    def __is_observed(self) -> bool:
+        """
+        Checks whether anything listens for changes of the value.
+
+        :return: Whether the value is observed.
+        """
+
+        return GObject.signal_has_handler_pending(
+            self,
+            GObject.signal_lookup("notify", GObject.Object),
+            GLib.quark_from_string("value"),
+            False,
+        )
+
+    @property
+    def file_reads(self) -> int:
+        """
+        The number of times the file of a file variable was read.
+        """
+
+        return self.__watcher.reads if self.__watcher else 0
+
+    @property
+    def suppressed_updates(self) -> int:
+        """
+        The number of updates that were suppressed because the value has not changed.
+        """
+
+        return self.__suppressed_updates
+
+    @property
+    def transform_cache_hits(self) -> int:
+        """
+        The number of reads that returned the cached transformed value instead of calling the transform function.
+        """
+
+        return self.__transform_cache_hits
+
+    @staticmethod
+    def __never_equal(a: Any, b: Any) -> bool:
+        """
+        Treats every value as changed, for variables that stream events.
+
+        :param a: The first value.
+        :param b: The second value.
+        :return: Always False.
+        """
+
+        return False
+
+    def __is_equal(self, a: T, b: T) -> bool:
+        """
+        Checks whether two values are equal.
+
+        :param a: The first value.
+        :param b: The second value.
+        :return: Whether the values are equal.
+        """
+
+        if self.__key:
+            a, b = self.__key(a), self.__key(b)
+
+        if self.__compare:
+            return self.__compare(a, b)
+
+        return a == b
 
     def bind(self, object: GObject.GObject, prop: str):
         """
@@ -104,15 +659,22 @@ class Variable(Generic[T], GObject.GObject):
         :param prop: The property to bind to.
         """
 
-        self.connect("notify::value", lambda *_: self.__on_bind(object, prop))
+        handler_id = self.connect(
+            "notify::value", lambda *_: self.__on_bind(object, prop)
+        )
         object.set_property(prop, self.value)
 
+        # Release the binding when a widget is destroyed.
+        if GObject.signal_lookup("destroy", type(object)):
+            object.connect("destroy", lambda *_: self.disconnect(handler_id))
+
     def __on_bind(self, object: GObject.GObject, prop: str):
         """
         Called when the variable has changed and the GObject property should be updated.
+        The update is applied together with all other pending updates before the next layout.
         """
 
-        GLib.idle_add(object.set_property, prop, self.value)
+        queue_property(object, prop, self.value)
 
     def stop_interval(self):
         """
@@ -120,22 +682,37 @@ class Variable(Generic[T], GObject.GObject):
         """
 
         if self.__interval_id:
-            GLib.source_remove(self.__interval_id)
+            remove_timer(self.__interval_id)
             self.__interval_id = None
+            self.__unregister()
         else:
             logging.warn("Cannot stop interval: no interval running.")
 
     def stop_listener(self):
         """
-        Stops the listener. When the listener is not running, nothing happens.
+        Stops the listener. The process is stopped when no other variable listens on the same command.
+        When the listener is not running, nothing happens.
         """
 
-        if self.__process:
-            self.__process.force_exit()
-            self.__process = None
+        if self.__subscription:
+            unlisten(self.__subscription)
+            self.__subscription = None
+            self.__unregister()
         else:
             logging.warn("Cannot stop listener: no process running.")
 
+    def stop_watcher(self):
+        """
+        Stops watching the file and closes it. When no file is watched, nothing happens.
+        """
+
+        if self.__watcher:
+            self.__watcher.stop()
+            self.__watcher = None
+            self.__unregister()
+        else:
+            logging.warning("Cannot stop watcher: no file watched.")
+
 
 Bindable = T | Variable[T]
 """
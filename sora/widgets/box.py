@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Callable, Hashable
 from sora.widgets.base import BaseWidget, BaseWidgetProps
 from gi.repository import Gtk, GObject
 
@@ -14,12 +15,14 @@ class BoxProps(BaseWidgetProps):
     :param spacing: The spacing between the children.
     :param homogeneous: Whether the box is homogeneous.
     :param children: The children of the box.
+    :param child_key: The function to get the key of a child. A new child with the key of an existing child is dropped and the existing child is kept.
     """
 
     orientation: Bindable[Gtk.Orientation] = Gtk.Orientation.HORIZONTAL
     spacing: Bindable[int] = 0
     homogeneous: Bindable[bool] = True
     children: Bindable[list[Gtk.Widget]] | None = None
+    child_key: Callable[[Gtk.Widget], Hashable] | None = None
 
 
 class Box(BaseWidget(Gtk.Box), Gtk.Box):
@@ -27,6 +30,8 @@ class Box(BaseWidget(Gtk.Box), Gtk.Box):
     A box that can contain other widgets.
     """
 
+    __child_key: Callable[[Gtk.Widget], Hashable] | None = None
+
     def __init__(self, props: BoxProps):
         """
         Creates a new Box.
@@ -35,6 +40,7 @@ class Box(BaseWidget(Gtk.Box), Gtk.Box):
         """
 
         super().__init__(props)
+        self.__child_key = props.child_key
         self._bind_property("orientation", props.orientation)
         self._bind_property("spacing", props.spacing)
         self._bind_property("homogeneous", props.homogeneous)
@@ -52,11 +58,46 @@ class Box(BaseWidget(Gtk.Box), Gtk.Box):
     def children(self, children: list[Gtk.Widget]):
         """
         Sets the children of the box.
+        Existing children are matched by their key (by default the widget itself) and kept,
+        so that only the minimal removals, inserts and reorders are applied.
 
         :param children: The children to set.
         """
 
-        for current in self.get_children():
-            current.destroy()
-        for new in children:
-            self.add(new)
+        key = self.__child_key or (lambda widget: widget)
+        current = self.get_children()
+
+        existing: dict[Hashable, Gtk.Widget] = {}
+        for widget in current:
+            existing.setdefault(key(widget), widget)
+
+        kept: set[Gtk.Widget] = set()
+        targets: list[Gtk.Widget] = []
+        for child in children:
+            match = existing.pop(key(child), None)
+            if match is None:
+                targets.append(child)
+                continue
+
+            if match is not child:
+                child.destroy()
+
+            kept.add(match)
+            targets.append(match)
+
+        for widget in current:
+            if widget not in kept:
+                widget.destroy()
+
+        order = [widget for widget in current if widget in kept]
+        for index, widget in enumerate(targets):
+            if widget not in kept:
+                self.add(widget)
+                order.append(widget)
+            elif order[index] is widget:
+                continue
+
+            if order[index] is not widget:
+                order.remove(widget)
+                order.insert(index, widget)
+                self.reorder_child(widget, index)
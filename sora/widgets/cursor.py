@@ -2,6 +2,11 @@ from enum import Enum
 
 from gi.repository import Gdk
 
+_cache: dict[Gdk.Display, dict["Cursor", Gdk.Cursor]] = {}
+"""
+The created Gdk cursors by display.
+"""
+
 
 class Cursor(Enum):
     """
@@ -46,9 +51,19 @@ class Cursor(Enum):
     def to_gdk_cursor(self, display: Gdk.Display) -> Gdk.Cursor:
         """
         Converts the cursor to a Gdk.Cursor.
+        Each cursor is only created once per display.
 
         :param display: The Gdk Display.
         :return: The Gdk.Cursor.
         """
 
-        return Gdk.Cursor.new_from_name(display, self.value)
+        cursors = _cache.get(display)
+        if cursors is None:
+            cursors = _cache[display] = {}
+            display.connect("closed", lambda *_: _cache.pop(display, None))
+
+        cursor = cursors.get(self)
+        if cursor is None:
+            cursor = cursors[self] = Gdk.Cursor.new_from_name(display, self.value)
+
+        return cursor
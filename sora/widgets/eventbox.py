@@ -2,8 +2,9 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Callable
 
-from gi.repository import Gtk, GObject, Gdk
+from gi.repository import Gtk, GObject, Gdk, GLib
 
+from sora.utils.scroll import ScrollAccumulator
 from sora.widgets.base import BaseWidget, BaseWidgetProps
 
 
@@ -27,6 +28,9 @@ class EventBoxProps(BaseWidgetProps):
     :param on_hover: The function to call when the mouse enters the event box.
     :param on_hover_lost: The function to call when the mouse leaves the event box.
     :param on_scroll: The function to call when the mouse is scrolled.
+    :param on_scroll_steps: The function to call with the direction and number of steps scrolled within a scroll window.
+    :param scroll_window: The time in milliseconds over which scrolling is summed for on_scroll_steps (0 = one frame).
+    :param scroll_leading: Whether to call on_scroll_steps right away at the start of a scroll window.
     :param on_click: The function to call when the event box is clicked.
     :param on_middle_click: The function to call when the event box is middle clicked.
     :param on_right_click: The function to call when the event box is right clicked.
@@ -36,6 +40,9 @@ class EventBoxProps(BaseWidgetProps):
     on_hover: Callable[[], None] | None = None
     on_hover_lost: Callable[[], None] | None = None
     on_scroll: Callable[[ScrollDirection], None] | None = None
+    on_scroll_steps: Callable[[ScrollDirection, int], None] | None = None
+    scroll_window: int = 0
+    scroll_leading: bool = False
     on_click: Callable[[], None] | None = None
     on_middle_click: Callable[[], None] | None = None
     on_right_click: Callable[[], None] | None = None
@@ -49,6 +56,11 @@ class EventBox(BaseWidget(Gtk.EventBox), Gtk.EventBox):
     __on_hover: Callable[[], None] | None = None
     __on_hover_lost: Callable[[], None] | None = None
     __on_scroll: Callable[[ScrollDirection], None] | None = None
+    __on_scroll_steps: Callable[[ScrollDirection, int], None] | None = None
+    __scroll_window: int = 0
+    __scroll_leading: bool = False
+    __scroll_source: int | None = None
+    __scroll_source_is_tick: bool = False
     __on_click: Callable[[], None] | None = None
     __on_middle_click: Callable[[], None] | None = None
     __on_right_click: Callable[[], None] | None = None
@@ -61,10 +73,15 @@ class EventBox(BaseWidget(Gtk.EventBox), Gtk.EventBox):
         """
 
         super().__init__(props)
+        self.__scroll_accumulator = ScrollAccumulator()
+
         self._bind_property("child", props.child)
         self._bind_property("on_hover", props.on_hover)
         self._bind_property("on_hover_lost", props.on_hover_lost)
         self._bind_property("on_scroll", props.on_scroll)
+        self._bind_property("on_scroll_steps", props.on_scroll_steps)
+        self._bind_property("scroll_window", props.scroll_window)
+        self._bind_property("scroll_leading", props.scroll_leading)
         self._bind_property("on_click", props.on_click)
         self._bind_property("on_middle_click", props.on_middle_click)
         self._bind_property("on_right_click", props.on_right_click)
@@ -78,6 +95,7 @@ class EventBox(BaseWidget(Gtk.EventBox), Gtk.EventBox):
         self.add_events(Gdk.EventMask.SCROLL_MASK)
         self.add_events(Gdk.EventMask.SMOOTH_SCROLL_MASK)
         self.connect("scroll-event", self.__handle_scroll)
+        self.connect("destroy", self.__stop_scroll_window)
 
         self.connect("button-press-event", self.__handle_on_click)
         self.connect("enter-notify-event", self.__set_css_hover)
@@ -152,6 +170,56 @@ class EventBox(BaseWidget(Gtk.EventBox), Gtk.EventBox):
 
         self.__on_scroll = on_scroll
 
+    @GObject.Property(type=GObject.TYPE_PYOBJECT)
+    def on_scroll_steps(self) -> Callable[[ScrollDirection, int], None] | None:
+        """
+        The function to call with the direction and number of steps scrolled within a scroll window.
+        """
+
+        return self.__on_scroll_steps
+
+    @on_scroll_steps.setter
+    def on_scroll_steps(
+        self, on_scroll_steps: Callable[[ScrollDirection, int], None] | None
+    ):
+        """
+        Sets the function to call with the direction and number of steps scrolled within a scroll window.
+        """
+
+        self.__on_scroll_steps = on_scroll_steps
+
+    @GObject.Property(type=GObject.TYPE_INT, default=0)
+    def scroll_window(self) -> int:
+        """
+        The time in milliseconds over which scrolling is summed for on_scroll_steps (0 = one frame).
+        """
+
+        return self.__scroll_window
+
+    @scroll_window.setter
+    def scroll_window(self, scroll_window: int):
+        """
+        Sets the time in milliseconds over which scrolling is summed for on_scroll_steps.
+        """
+
+        self.__scroll_window = scroll_window
+
+    @GObject.Property(type=GObject.TYPE_BOOLEAN, default=False)
+    def scroll_leading(self) -> bool:
+        """
+        Whether to call on_scroll_steps right away at the start of a scroll window.
+        """
+
+        return self.__scroll_leading
+
+    @scroll_leading.setter
+    def scroll_leading(self, scroll_leading: bool):
+        """
+        Sets whether to call on_scroll_steps right away at the start of a scroll window.
+        """
+
+        self.__scroll_leading = scroll_leading
+
     @GObject.Property(type=GObject.TYPE_PYOBJECT)
     def on_click(self):
         """
@@ -240,6 +308,9 @@ class EventBox(BaseWidget(Gtk.EventBox), Gtk.EventBox):
         :param event: The event.
         """
 
+        if self.__on_scroll_steps:
+            self.__accumulate_scroll(event)
+
         if not self.__on_scroll:
             return
 
@@ -254,6 +325,100 @@ class EventBox(BaseWidget(Gtk.EventBox), Gtk.EventBox):
         elif x < 0:
             self.__on_scroll(ScrollDirection.LEFT)
 
+    def __accumulate_scroll(self, event: Gdk.EventScroll):
+        """
+        Adds a scroll event to the current scroll window and opens a window if none is open.
+
+        :param event: The event.
+        """
+
+        (smooth, x, y) = event.get_scroll_deltas()
+        if not smooth:
+            (x, y) = self.__discrete_deltas(event.direction)
+
+        self.__scroll_accumulator.add(x, y)
+
+        if self.__scroll_source is not None:
+            return
+
+        if self.__scroll_leading:
+            self.__emit_scroll_steps(leading=True)
+
+        self.__scroll_source_is_tick = self.__scroll_window <= 0
+        if self.__scroll_source_is_tick:
+            self.__scroll_source = self.add_tick_callback(self.__on_scroll_window_end)
+        else:
+            self.__scroll_source = GLib.timeout_add(
+                self.__scroll_window, self.__on_scroll_window_end
+            )
+
+    def __on_scroll_window_end(self, *_):
+        """
+        Called at the end of a scroll window.
+        """
+
+        self.__scroll_source = None
+        self.__emit_scroll_steps()
+        return GLib.SOURCE_REMOVE
+
+    def __emit_scroll_steps(self, leading: bool = False):
+        """
+        Calls on_scroll_steps with the whole steps scrolled so far.
+        The fractional remainder is kept for the next scroll window.
+
+        :param leading: Whether to emit at least one step.
+        """
+
+        (x, y) = self.__scroll_accumulator.take(leading)
+        if not self.__on_scroll_steps:
+            return
+
+        if y:
+            self.__on_scroll_steps(
+                ScrollDirection.DOWN if y > 0 else ScrollDirection.UP, abs(y)
+            )
+
+        if x:
+            self.__on_scroll_steps(
+                ScrollDirection.RIGHT if x > 0 else ScrollDirection.LEFT, abs(x)
+            )
+
+    def __stop_scroll_window(self, *_):
+        """
+        Stops the open scroll window.
+        """
+
+        if self.__scroll_source is None:
+            return
+
+        if self.__scroll_source_is_tick:
+            self.remove_tick_callback(self.__scroll_source)
+        else:
+            GLib.source_remove(self.__scroll_source)
+
+        self.__scroll_source = None
+
+    @staticmethod
+    def __discrete_deltas(direction: Gdk.ScrollDirection) -> tuple[float, float]:
+        """
+        Converts the direction of a discrete scroll event to deltas.
+
+        :param direction: The direction.
+        :return: The horizontal and vertical delta.
+        """
+
+        match direction:
+            case Gdk.ScrollDirection.UP:
+                return (0, -1)
+            case Gdk.ScrollDirection.DOWN:
+                return (0, 1)
+            case Gdk.ScrollDirection.LEFT:
+                return (-1, 0)
+            case Gdk.ScrollDirection.RIGHT:
+                return (1, 0)
+            case _:
+                return (0, 0)
+
     def __set_css_hover(self, widget: Gtk.EventBox, _):
         """
         Sets the :hover CSS class for the hover state.
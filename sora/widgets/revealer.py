@@ -1,9 +1,10 @@
 from dataclasses import dataclass
+from typing import Callable
 
 from sora.widgets.base import BaseWidget, BaseWidgetProps
-from sora.widgets.bind import Bindable
+from sora.widgets.bind import Bindable, Variable
 
-from gi.repository import Gtk
+from gi.repository import Gtk, GLib
 
 
 @dataclass(kw_only=True)
@@ -15,6 +16,9 @@ class RevealerProps(BaseWidgetProps):
     :param transition_duration: The duration of the transition in milliseconds.
     :param transition_type: The type of the transition animation.
     :param child: The child widget.
+    :param child_factory: The function that builds the child widget when it is revealed for the first time.
+    :param keep_alive: The time in seconds after which a hidden child from the child factory is destroyed
+        and the polling, listening and file variables created by the factory are stopped.
     """
 
     reveal_child: Bindable[bool] = False
@@ -23,6 +27,8 @@ class RevealerProps(BaseWidgetProps):
         Gtk.RevealerTransitionType
     ] = Gtk.RevealerTransitionType.NONE
     child: Bindable[Gtk.Widget] | None = None
+    child_factory: Callable[[], Gtk.Widget] | None = None
+    keep_alive: float | None = None
 
 
 class Revealer(BaseWidget(Gtk.Revealer), Gtk.Revealer):
@@ -30,6 +36,10 @@ class Revealer(BaseWidget(Gtk.Revealer), Gtk.Revealer):
     A widget that animates the transition of its child.
     """
 
+    __child_factory: Callable[[], Gtk.Widget] | None = None
+    __keep_alive: float | None = None
+    __keep_alive_id: int | None = None
+
     def __init__(self, props: RevealerProps):
         """
         Create a new Revealer widget.
@@ -39,7 +49,89 @@ class Revealer(BaseWidget(Gtk.Revealer), Gtk.Revealer):
 
         super().__init__(props)
 
+        self.__child_factory = props.child_factory
+        self.__keep_alive = props.keep_alive
+        self.__child_variables: list[Variable] = []
+
+        if self.__child_factory:
+            self.connect("notify::reveal-child", self.__on_reveal_child)
+            self.connect("notify::child-revealed", self.__on_child_revealed)
+            self.connect("destroy", self.__on_destroy)
+
         self._bind_property("reveal_child", props.reveal_child)
         self._bind_property("transition_duration", props.transition_duration)
         self._bind_property("transition_type", props.transition_type)
         self._bind_property("child", props.child)
+
+    def __on_reveal_child(self, *_):
+        """
+        Builds the child from the child factory when it is revealed and there is no child.
+        """
+
+        if not self.get_reveal_child():
+            return
+
+        if self.__keep_alive_id:
+            GLib.source_remove(self.__keep_alive_id)
+            self.__keep_alive_id = None
+
+        if not self.get_child():
+            self.__stop_child_variables()
+            child, self.__child_variables = Variable.collect_sources(
+                self.__child_factory
+            )
+            self.add(child)
+
+    def __on_child_revealed(self, *_):
+        """
+        Starts the keep alive timeout after the child was hidden.
+        """
+
+        if self.get_child_revealed() or self.get_reveal_child():
+            return
+
+        if self.__keep_alive is None or self.__keep_alive_id:
+            return
+
+        self.__keep_alive_id = GLib.timeout_add(
+            int(self.__keep_alive * 1000), self.__on_keep_alive_timeout
+        )
+
+    def __on_keep_alive_timeout(self):
+        """
+        Destroys the hidden child, which releases its variable bindings,
+        and stops the variables created by the child factory.
+        """
+
+        self.__keep_alive_id = None
+
+        if not self.get_reveal_child() and (child := self.get_child()):
+            child.destroy()
+            self.__stop_child_variables()
+
+        return GLib.SOURCE_REMOVE
+
+    def __on_destroy(self, *_):
+        """
+        Stops the keep alive timeout and the variables created by the child factory.
+        During a config reload, the variables may be reused by the new config and are left to the reload.
+        """
+
+        if self.__keep_alive_id:
+            GLib.source_remove(self.__keep_alive_id)
+            self.__keep_alive_id = None
+
+        if Variable.is_reloading():
+            self.__child_variables = []
+        else:
+            self.__stop_child_variables()
+
+    def __stop_child_variables(self):
+        """
+        Stops the variables created by the child factory.
+        """
+
+        for variable in self.__child_variables:
+            variable.stop()
+
+        self.__child_variables = []
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import Callable
+from sora.utils.scroll import ScrollAccumulator
 from sora.widgets.base import BaseWidget, BaseWidgetProps
-from gi.repository import Gtk, GObject, Gdk
+from gi.repository import Gtk, GObject, Gdk, GLib
 
 from sora.widgets.bind import Bindable
 
@@ -21,7 +22,9 @@ class SliderProps(BaseWidgetProps):
     :param round_digits: The number of digits to round the value to.
     :param marks: The marks of the slider.
     :param scrollable: Whether the slider is scrollable.
+    :param smooth_scroll: Whether to sum smooth scroll deltas into whole steps instead of moving one step per scroll event.
     :param on_change: The callback to call when the value of the slider changes.
+    :param change_throttle: The minimum time in milliseconds between two calls of on_change (0 = no throttling).
     """
 
     orientation: Bindable[Gtk.Orientation] = Gtk.Orientation.HORIZONTAL
@@ -34,13 +37,19 @@ class SliderProps(BaseWidgetProps):
     round_digits: Bindable[int] = 1
     marks: Bindable[list[tuple[float, Gtk.PositionType, str]]] | None = None
     scrollable: Bindable[bool] = True
+    smooth_scroll: Bindable[bool] = False
     on_change: Callable[[float], None] | None = None
+    change_throttle: Bindable[int] = 0
 
 
 class Slider(BaseWidget(Gtk.Scale), Gtk.Scale):
     __on_change: Callable[[float], None] | None = None
     __marks: list[tuple[float, Gtk.PositionType, str]] = []
     __scrollable: bool = True
+    __smooth_scroll: bool = False
+    __change_throttle: int = 0
+    __change_source: int | None = None
+    __change_pending: bool = False
 
     """
     A slider widget.
@@ -54,6 +63,8 @@ class Slider(BaseWidget(Gtk.Scale), Gtk.Scale):
         """
 
         super().__init__(props)
+        self.__scroll_accumulator = ScrollAccumulator()
+
         self._bind_property("orientation", props.orientation)
         self._bind_property("inverted", props.inverted)
         self._bind_property("min", props.min)
@@ -64,16 +75,57 @@ class Slider(BaseWidget(Gtk.Scale), Gtk.Scale):
         self._bind_property("round_digits", props.round_digits)
         self._bind_property("marks", props.marks)
         self._bind_property("scrollable", props.scrollable)
+        self._bind_property("smooth_scroll", props.smooth_scroll)
         self._bind_property("on_change", props.on_change)
+        self._bind_property("change_throttle", props.change_throttle)
 
         self.__on_change = props.on_change
 
         self.get_adjustment().connect("notify::value", self.__handle_on_change)
+        self.connect("destroy", self.__stop_change_throttle)
 
     def __handle_on_change(self, *_):
+        if not self.__on_change:
+            return
+
+        if self.__change_throttle <= 0:
+            self.__on_change(self.value)
+            return
+
+        # Call right away when idle, otherwise once more at the end of the throttle period.
+        if self.__change_source is not None:
+            self.__change_pending = True
+            return
+
+        self.__on_change(self.value)
+        self.__change_source = GLib.timeout_add(
+            self.__change_throttle, self.__on_change_throttle_end
+        )
+
+    def __on_change_throttle_end(self):
+        """
+        Called at the end of a throttle period. Commits the latest value if it has changed since the last call.
+        """
+
+        if not self.__change_pending:
+            self.__change_source = None
+            return GLib.SOURCE_REMOVE
+
+        self.__change_pending = False
         if self.__on_change:
             self.__on_change(self.value)
 
+        return GLib.SOURCE_CONTINUE
+
+    def __stop_change_throttle(self, *_):
+        """
+        Stops the running throttle period.
+        """
+
+        if self.__change_source is not None:
+            GLib.source_remove(self.__change_source)
+            self.__change_source = None
+
     @GObject.Property(type=GObject.TYPE_FLOAT)
     def value(self) -> float:
         """
@@ -204,7 +256,48 @@ class Slider(BaseWidget(Gtk.Scale), Gtk.Scale):
 
         self.__scrollable = scrollable
 
+    @GObject.Property(type=GObject.TYPE_BOOLEAN, default=False)
+    def smooth_scroll(self) -> bool:
+        """
+        Whether smooth scroll deltas are summed into whole steps.
+        """
+
+        return self.__smooth_scroll
+
+    @smooth_scroll.setter
+    def smooth_scroll(self, smooth_scroll: bool):
+        """
+        Sets whether smooth scroll deltas are summed into whole steps.
+
+        :param smooth_scroll: Whether smooth scroll deltas are summed into whole steps.
+        """
+
+        self.__smooth_scroll = smooth_scroll
+        self.__scroll_accumulator.reset()
+
+    @GObject.Property(type=GObject.TYPE_INT, default=0)
+    def change_throttle(self) -> int:
+        """
+        The minimum time in milliseconds between two calls of on_change.
+        """
+
+        return self.__change_throttle
+
+    @change_throttle.setter
+    def change_throttle(self, change_throttle: int):
+        """
+        Sets the minimum time in milliseconds between two calls of on_change.
+
+        :param change_throttle: The minimum time in milliseconds.
+        """
+
+        self.__change_throttle = change_throttle
+
     def do_scroll_event(self, event: Gdk.EventScroll):
+        if self.__scrollable and self.__smooth_scroll:
+            self.__smooth_scroll_event(event)
+            return True
+
         if self.__scrollable:
             (_, x, y) = event.get_scroll_deltas()
             if y < 0 or x > 0:
@@ -213,3 +306,28 @@ class Slider(BaseWidget(Gtk.Scale), Gtk.Scale):
                 self.value -= self.step
 
         return Gtk.Scale.do_scroll_event(self, event)
+
+    def __smooth_scroll_event(self, event: Gdk.EventScroll):
+        """
+        Sums the deltas of a scroll event and moves the slider by the whole steps.
+        Scrolling up or right increases the value.
+
+        :param event: The event.
+        """
+
+        (smooth, x, y) = event.get_scroll_deltas()
+        if smooth:
+            delta = x - y
+        else:
+            match event.direction:
+                case Gdk.ScrollDirection.UP | Gdk.ScrollDirection.RIGHT:
+                    delta = 1
+                case Gdk.ScrollDirection.DOWN | Gdk.ScrollDirection.LEFT:
+                    delta = -1
+                case _:
+                    delta = 0
+
+        self.__scroll_accumulator.add(0, delta)
+        (_, steps) = self.__scroll_accumulator.take()
+        if steps:
+            self.value += steps * self.step
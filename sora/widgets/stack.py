@@ -1,11 +1,18 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 import logging
+from typing import Callable
 from sora.widgets.base import BaseWidget, BaseWidgetProps
 
 from gi.repository import Gtk, GObject
 
 from sora.widgets.bind import Bindable
 
+StackItem = Gtk.Widget | Callable[[], Gtk.Widget]
+"""
+A page of a stack: either a widget or a function that builds the widget.
+"""
+
 
 @dataclass(kw_only=True)
 class StackProps(BaseWidgetProps):
@@ -13,27 +20,28 @@ class StackProps(BaseWidgetProps):
     Properties for the Stack widget.
 
     :param transition_type: The type of transition to use when changing the visible child of the stack.
-    :param items: A dictionary of child widgets to add to the stack.
+    :param items: A dictionary of child widgets or functions that build the child widgets to add to the stack.
     :param visible_child_name: The name of the visible child of the stack.
     :param vhomogeneous: Whether the stack should distribute the available space evenly among its children.
     :param hhomogeneous: Whether the stack should distribute the available space evenly among its children.
+    :param max_built_pages: The maximum number of built pages from functions. The least recently shown pages are destroyed first.
     """
 
     transition_type: Bindable[Gtk.StackTransitionType] = Gtk.StackTransitionType.NONE
     transition_duration: Bindable[int] = 200
-    items: Bindable[dict[Gtk.Widget]] | None = None
+    items: Bindable[dict[str, StackItem]] | None = None
     visible_child_name: Bindable[str] | None = None
     vhomogeneous: Bindable[bool] = True
     hhomogeneous: Bindable[bool] = True
+    max_built_pages: int | None = None
 
 
 class Stack(BaseWidget(Gtk.Stack), Gtk.Stack):
     """
     A widget that shows a single child at a time.
+    Pages given as functions are built when they are shown for the first time.
     """
 
-    __items: dict[str, Gtk.Widget] = {}
-
     def __init__(self, props: StackProps):
         """
         Create a new Stack widget.
@@ -42,6 +50,13 @@ class Stack(BaseWidget(Gtk.Stack), Gtk.Stack):
         """
 
         super().__init__(props)
+        self.__items: dict[str, StackItem] = {}
+        self.__builders: dict[str, Callable[[], Gtk.Widget]] = {}
+        self.__built: OrderedDict[str, None] = OrderedDict()
+        self.__max_built_pages = props.max_built_pages
+
+        self.connect("notify::visible-child-name", self.__on_visible_child_changed)
+
         self._bind_property("transition_type", props.transition_type)
         self._bind_property("transition_duration", props.transition_duration)
         self._bind_property("items", props.items)
@@ -58,7 +73,7 @@ class Stack(BaseWidget(Gtk.Stack), Gtk.Stack):
         return self.__items
 
     @items.setter
-    def items(self, items: dict[str, Gtk.Widget]):
+    def items(self, items: dict[str, StackItem]):
         """
         Set the items in the stack.
 
@@ -68,16 +83,19 @@ class Stack(BaseWidget(Gtk.Stack), Gtk.Stack):
         for current in self.get_children():
             current.destroy()
 
+        self.__items = {}
+        self.__builders.clear()
+        self.__built.clear()
+
         for name, widget in items.items():
             self.add_named(widget, name)
 
-        self.__items = items
-
-    def add_named(self, child: Gtk.Widget, name: str):
+    def add_named(self, child: StackItem, name: str):
         """
         Add a child to the stack.
+        When the child is a function, it is called to build the page when the page is shown for the first time.
 
-        :param child: The child to add.
+        :param child: The child or the function that builds the child.
         :param name: The name of the child.
         """
 
@@ -86,4 +104,47 @@ class Stack(BaseWidget(Gtk.Stack), Gtk.Stack):
             return
 
         self.__items[name] = child
-        super().add_named(child, name)
+
+        if isinstance(child, Gtk.Widget):
+            super().add_named(child, name)
+            return
+
+        self.__builders[name] = child
+
+        page = Gtk.Box()
+        page.show()
+        super().add_named(page, name)
+
+        if self.get_visible_child_name() == name:
+            self.__build_page(name)
+
+    def __on_visible_child_changed(self, *_):
+        """
+        Builds the visible page if it was not built yet.
+        """
+
+        name = self.get_visible_child_name()
+        if name in self.__builders:
+            self.__build_page(name)
+
+    def __build_page(self, name: str):
+        """
+        Builds the page with the given name and destroys the least recently shown pages over the limit.
+
+        :param name: The name of the page.
+        """
+
+        page = self.get_child_by_name(name)
+        if not page.get_children():
+            page.pack_start(self.__builders[name](), True, True, 0)
+
+        self.__built[name] = None
+        self.__built.move_to_end(name)
+
+        if self.__max_built_pages is None:
+            return
+
+        while len(self.__built) > self.__max_built_pages:
+            (oldest, _) = self.__built.popitem(last=False)
+            for child in self.get_child_by_name(oldest).get_children():
+                child.destroy()
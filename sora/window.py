@@ -1,7 +1,8 @@
 from enum import Enum
 from gi.repository import Gtk, Gdk
 from sora.geometry import Geometry
-from sora.monitor import get_monitor, get_primary_monitor
+from sora.monitor import Monitor, get_monitor, get_primary_monitor, get_registry
+from sora.utils.definition import definition
 
 
 class WindowType(Enum):
@@ -52,6 +53,7 @@ class Window(Gtk.Window):
         wm_ignore: bool = False,
         window_type: WindowType = WindowType.DOCK,
         geometry: Geometry = Geometry(),
+        monitor_fallback: bool = False,
     ):
         """
         Creates a new Window.
@@ -62,6 +64,7 @@ class Window(Gtk.Window):
         :param wm_ignore: Whether the window manager should ignore (reserve space for) the window.
         :param window_type: The type of the window.
         :param geometry: The geometry of the window.
+        :param monitor_fallback: Whether to move the window to the primary monitor instead of hiding it when its monitor is disconnected.
         """
 
         super().__init__(
@@ -77,21 +80,106 @@ class Window(Gtk.Window):
             gravity=Gdk.Gravity.CENTER,
         )
 
+        self.__definition = (
+            name,
+            widget,
+            monitor,
+            wm_ignore,
+            window_type,
+            geometry,
+            monitor_fallback,
+        )
+
+        self.__monitor = monitor
+        self.__geometry = geometry
+        self.__monitor_fallback = monitor_fallback
+        self.__placed_on: Monitor | None = None
+        self.__hidden_by_monitor = False
+
         self.stick()
         self.set_keep_above(True)
 
-        monitor_obj = get_monitor(monitor) if monitor else get_primary_monitor()
+        monitor_obj = self.__find_monitor()
         if not monitor_obj:
             raise LookupError("could not get monitor")
 
-        self.set_default_size(
-            geometry.size.x.to_pixel_relative(monitor_obj.width),
-            geometry.size.y.to_pixel_relative(monitor_obj.height),
-        )
+        self.__place(monitor_obj)
+        self.add(widget)
+
+        # Re-place the window when the monitors change.
+        if registry := get_registry():
+            changed = registry.changed
+            handler_id = changed.connect(
+                "notify::value", lambda *_: self.__on_monitors_changed()
+            )
+            self.connect("destroy", lambda *_: changed.disconnect(handler_id))
+
+    def __find_monitor(self):
+        """
+        Gets the monitor the window should be displayed on.
+        A window without a monitor follows the primary monitor.
 
+        :return: The monitor or None.
+        """
+
+        if not self.__monitor:
+            return get_primary_monitor()
+
+        if monitor := get_monitor(self.__monitor):
+            return monitor
+
+        if self.__monitor_fallback:
+            return get_primary_monitor()
+
+    def __place(self, monitor: Monitor):
+        """
+        Sizes and moves the window relative to the given monitor.
+
+        :param monitor: The monitor to place the window on.
+        """
+
+        if monitor == self.__placed_on:
+            return
+
+        self.__placed_on = monitor
+        geometry = self.__geometry
+        width = geometry.size.x.to_pixel_relative(monitor.width)
+        height = geometry.size.y.to_pixel_relative(monitor.height)
+
+        self.set_default_size(width, height)
+        self.resize(width, height)
         self.move(
-            monitor_obj.x + geometry.offset.x.to_pixel_relative(monitor_obj.width),
-            monitor_obj.y + geometry.offset.y.to_pixel_relative(monitor_obj.height),
+            monitor.x + geometry.offset.x.to_pixel_relative(monitor.width),
+            monitor.y + geometry.offset.y.to_pixel_relative(monitor.height),
         )
 
-        self.add(widget)
+    def __on_monitors_changed(self):
+        """
+        Called when the monitors have changed.
+        Places the window on its monitor again, or hides it when the monitor is gone.
+        """
+
+        monitor = self.__find_monitor()
+
+        if not monitor:
+            if self.get_visible():
+                self.__hidden_by_monitor = True
+                self.hide()
+            self.__placed_on = None
+            return
+
+        self.__place(monitor)
+
+        if self.__hidden_by_monitor:
+            self.__hidden_by_monitor = False
+            self.show()
+
+    def definition(self):
+        """
+        Gets a comparable definition of the window and its widget tree.
+        Two windows that were created with equal arguments have equal definitions.
+
+        :return: The definition.
+        """
+
+        return definition(self.__definition)
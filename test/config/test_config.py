@@ -0,0 +1,61 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from sora.config.config import Config
+
+
+class TestConfigReload(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        self.addCleanup(self.directory.cleanup)
+
+        modules = set(sys.modules)
+        self.addCleanup(
+            lambda: [sys.modules.pop(name) for name in set(sys.modules) - modules]
+        )
+        self.addCleanup(lambda: sys.path.remove(self.path.as_posix()))
+
+    def write(self, name: str, content: str):
+        self.path.joinpath(name).write_text(content)
+        # Make sure the changed source is not mistaken for the cached bytecode.
+        for file in self.path.glob("__pycache__/*.pyc"):
+            file.unlink()
+
+    def test_reloads_helpers_imported_by_name(self):
+        self.write("config_helper_a.py", "def f():\n    return 'old'\n")
+        self.write("config_helper_b.py", "")
+        self.write(
+            "config.py",
+            "import config_helper_b\nimport config_helper_a\nwindows = []\n",
+        )
+        config = Config(self.path)
+
+        # The helper B was loaded before A, but now imports from A.
+        self.write("config_helper_a.py", "def f():\n    return 'new'\n")
+        self.write("config_helper_b.py", "from config_helper_a import f\n")
+        self.write("config.py", "from config_helper_b import f\nwindows = [f()]\n")
+        config.reload()
+
+        self.assertEqual(config.windows, ["new"])
+
+    def test_keeps_modules_when_reload_fails(self):
+        self.write("config_helper_c.py", "value = 'old'\n")
+        self.write(
+            "config.py", "from config_helper_c import value\nwindows = [value]\n"
+        )
+        config = Config(self.path)
+        helper = sys.modules["config_helper_c"]
+
+        self.write("config.py", "raise ValueError('broken')\n")
+        with self.assertRaises(ValueError):
+            config.reload()
+
+        self.assertEqual(config.windows, ["old"])
+        self.assertIs(sys.modules["config_helper_c"], helper)
+
+
+if __name__ == "__main__":
+    unittest.main()
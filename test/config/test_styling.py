@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from sora.config import styling
+from sora.config.styling import parse_style_sheet
+
+
+class TestStyleCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name).joinpath("config")
+        self.path.mkdir()
+        self.path.joinpath("style.scss").write_text(
+            '@import "colors"; label { color: $color; }'
+        )
+        self.path.joinpath("_colors.scss").write_text("$color: red;")
+
+        self.cache_home = Path(self.directory.name).joinpath("cache")
+        environ = patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.cache_home)})
+        environ.start()
+        self.addCleanup(environ.stop)
+
+        compile = patch.object(styling, "parse_scss", wraps=styling.parse_scss)
+        self.compile = compile.start()
+        self.addCleanup(compile.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def cached_files(self) -> list[Path]:
+        return list(self.cache_home.joinpath("sora").glob("*.css"))
+
+    def test_uses_cached_style_sheet(self):
+        css = parse_style_sheet(self.path)
+
+        self.assertEqual(parse_style_sheet(self.path), css)
+        self.assertEqual(self.compile.call_count, 1)
+        self.assertEqual(len(self.cached_files()), 1)
+
+    def test_recompiles_when_partial_changes(self):
+        parse_style_sheet(self.path)
+        self.path.joinpath("_colors.scss").write_text("$color: blue;")
+
+        css = parse_style_sheet(self.path)
+
+        self.assertIn("blue", css)
+        self.assertEqual(self.compile.call_count, 2)
+
+    def test_recompiles_corrupted_cache_file(self):
+        css = parse_style_sheet(self.path)
+        self.cached_files()[0].write_bytes(b"\xff\xfe\xfa")
+
+        self.assertEqual(parse_style_sheet(self.path), css)
+        self.assertEqual(self.compile.call_count, 2)
+
+    def test_compiles_without_writable_cache(self):
+        # A file in place of the cache directory makes writing the cache fail.
+        self.cache_home.write_text("")
+
+        css = parse_style_sheet(self.path)
+
+        self.assertIn("red", css)
+        self.assertEqual(list(Path(self.directory.name).glob("**/*.tmp")), [])
+
+    def test_evicts_least_recently_used(self):
+        with patch.object(styling, "MAX_CACHED_STYLE_SHEETS", 2):
+            for i, color in enumerate(["red", "green", "blue"]):
+                previous = set(self.cached_files())
+                self.path.joinpath("_colors.scss").write_text(f"$color: {color};")
+                parse_style_sheet(self.path)
+
+                # Spread the mtimes, so that the order does not depend on the clock resolution.
+                for file in set(self.cached_files()) - previous:
+                    os.utime(file, (i, i))
+
+        contents = "".join(file.read_text() for file in self.cached_files())
+
+        self.assertEqual(len(self.cached_files()), 2)
+        self.assertNotIn("red", contents)
+        self.assertIn("green", contents)
+
+
+if __name__ == "__main__":
+    unittest.main()
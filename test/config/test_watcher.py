@@ -0,0 +1,49 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from gi.repository import GLib
+
+from sora.config.watcher import StyleWatcher
+from test.helpers import run_loop
+
+
+class TestStyleWatcher(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        self.path.joinpath("style.scss").write_text('@import "colors";')
+        self.path.joinpath("_colors.scss").write_text("$color: red;")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_debounces_changes_of_partials(self):
+        calls = []
+        watcher = StyleWatcher(self.path, lambda: calls.append(1))
+
+        def write():
+            for color in ["blue", "green", "black"]:
+                self.path.joinpath("_colors.scss").write_text(f"$color: {color};")
+
+        GLib.timeout_add(50, write)
+        run_loop(800)
+        watcher.stop()
+
+        self.assertEqual(calls, [1])
+
+    def test_ignores_unrelated_files(self):
+        calls = []
+        watcher = StyleWatcher(self.path, lambda: calls.append(1))
+
+        GLib.timeout_add(
+            50, lambda: self.path.joinpath("notes.txt").write_text("x") and False
+        )
+        run_loop(500)
+        watcher.stop()
+
+        self.assertFalse(calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+from gi.repository import GLib, GObject
+
+
+def run_loop(ms: int):
+    """
+    Runs the GLib main loop for the given time.
+
+    :param ms: The time in milliseconds.
+    """
+
+    loop = GLib.MainLoop()
+    GLib.timeout_add(ms, loop.quit)
+    loop.run()
+
+
+def run_until_notify(variable: GObject.Object, timeout: int = 5):
+    """
+    Runs the GLib main loop until the value of a variable has changed or the timeout has passed.
+
+    :param variable: The variable.
+    :param timeout: The timeout in seconds.
+    """
+
+    loop = GLib.MainLoop()
+    variable.connect("notify::value", lambda *_: loop.quit())
+    GLib.timeout_add_seconds(timeout, loop.quit)
+    loop.run()
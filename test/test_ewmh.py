@@ -0,0 +1,63 @@
+import os
+import struct
+import unittest
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+
+from gi.repository import Gdk, Gtk
+
+from sora.ewmh import EWMH, parse_cardinals, parse_strings
+from test.helpers import run_until_notify
+
+
+class TestParsers(unittest.TestCase):
+    def test_parse_cardinals(self):
+        data = struct.pack("2l", 3, 4)
+        self.assertEqual(parse_cardinals(data, 32), [3, 4])
+
+    def test_parse_cardinals_ignores_other_formats(self):
+        self.assertEqual(parse_cardinals(b"\x01", 8), [])
+
+    def test_parse_strings(self):
+        self.assertEqual(parse_strings(b"web\0code\0"), ["web", "code"])
+        self.assertEqual(parse_strings(b""), [])
+
+
+@unittest.skipUnless(os.environ.get("DISPLAY"), "requires an X server (e.g. Xvfb)")
+class TestEWMH(unittest.TestCase):
+    def setUp(self):
+        Gtk.init_check()
+        self.root = Gdk.get_default_root_window()
+        self.ewmh = EWMH()
+        self.addCleanup(self.ewmh.close)
+
+    def change_property(self, name: str, type: str, format: int, data: bytes):
+        Gdk.property_change(
+            self.root,
+            Gdk.atom_intern(name, False),
+            Gdk.atom_intern(type, False),
+            format,
+            Gdk.PropMode.REPLACE,
+            data,
+            len(data) // (struct.calcsize("l") if format == 32 else 1),
+        )
+
+    def test_updates_current_desktop(self):
+        self.change_property(
+            "_NET_CURRENT_DESKTOP", "CARDINAL", 32, struct.pack("l", 2)
+        )
+        run_until_notify(self.ewmh.current_desktop)
+
+        self.assertEqual(self.ewmh.current_desktop.value, 2)
+
+    def test_updates_desktop_names(self):
+        self.change_property("_NET_DESKTOP_NAMES", "UTF8_STRING", 8, b"web\0code\0")
+        run_until_notify(self.ewmh.desktop_names)
+
+        self.assertEqual(self.ewmh.desktop_names.value, ["web", "code"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+
+from gi.repository import GLib
+
+from sora.i3 import (
+    EVENT_BIT,
+    HEADER,
+    EventType,
+    I3,
+    MessageType,
+    Workspace,
+    pack,
+    unpack,
+)
+from test.helpers import run_loop
+
+WORKSPACES = [
+    {
+        "id": 1,
+        "num": 1,
+        "name": "1",
+        "focused": True,
+        "visible": True,
+        "urgent": False,
+        "output": "DP-1",
+    },
+    {
+        "id": 2,
+        "num": 2,
+        "name": "2",
+        "focused": False,
+        "visible": False,
+        "urgent": False,
+        "output": "DP-1",
+    },
+]
+
+TREE = {
+    "type": "root",
+    "nodes": [
+        {
+            "type": "workspace",
+            "nodes": [
+                {"type": "con", "name": "Terminal", "focused": True, "nodes": []}
+            ],
+        }
+    ],
+}
+
+
+class StandInServer:
+    """
+    A stand-in for the IPC socket of i3 that answers requests and sends events.
+    """
+
+    def __init__(self, path: str):
+        self.received: list[tuple[int, str]] = []
+        self.__server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__server.bind(path)
+        self.__server.listen(1)
+        self.__connection: socket.socket | None = None
+        self.__connected = threading.Event()
+        threading.Thread(target=self.__serve, daemon=True).start()
+
+    def send_event(self, type: EventType, payload: dict):
+        self.__connected.wait(5)
+        self.__connection.sendall(pack(type | EVENT_BIT, json.dumps(payload)))
+
+    def close(self):
+        if self.__connection:
+            self.__connection.close()
+        self.__server.close()
+
+    def __serve(self):
+        self.__connection, _ = self.__server.accept()
+        self.__connected.set()
+        buffer = bytearray()
+
+        while data := self.__connection.recv(4096):
+            buffer += data
+            for type, payload in unpack(buffer):
+                self.received.append((type, payload.decode()))
+                self.__connection.sendall(pack(type, json.dumps(self.__reply(type))))
+
+    def __reply(self, type: int):
+        match type:
+            case MessageType.GET_WORKSPACES:
+                return WORKSPACES
+            case MessageType.GET_TREE:
+                return TREE
+            case MessageType.RUN_COMMAND:
+                return [{"success": True}]
+            case _:
+                return {"success": True}
+
+
+class TestProtocol(unittest.TestCase):
+    def test_pack_unpack(self):
+        buffer = bytearray(
+            pack(MessageType.GET_TREE) + pack(MessageType.RUN_COMMAND, "nop")
+        )
+        buffer += pack(MessageType.SUBSCRIBE, "[]")[: HEADER.size + 1]
+
+        self.assertEqual(
+            unpack(buffer),
+            [(MessageType.GET_TREE, b""), (MessageType.RUN_COMMAND, b"nop")],
+        )
+        self.assertEqual(len(buffer), HEADER.size + 1)
+
+    def test_unpack_rejects_invalid_magic(self):
+        with self.assertRaises(ValueError):
+            unpack(bytearray(b"x" * HEADER.size))
+
+
+class TestI3(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "ipc.sock")
+
+        self.server = StandInServer(path)
+        self.addCleanup(self.server.close)
+
+        self.i3 = I3(path)
+        self.addCleanup(self.i3.close)
+        run_loop(200)
+
+    def test_subscribes_and_loads_state(self):
+        self.assertEqual(self.server.received[0][0], MessageType.SUBSCRIBE)
+        self.assertIn("workspace", json.loads(self.server.received[0][1]))
+
+        self.assertEqual([w.name for w in self.i3.workspaces.value], ["1", "2"])
+        self.assertEqual(self.i3.focused_workspace.value.name, "1")
+        self.assertEqual(self.i3.window_title.value, "Terminal")
+
+    def test_applies_workspace_focus_event(self):
+        self.server.send_event(
+            EventType.WORKSPACE,
+            {"change": "focus", "current": WORKSPACES[1], "old": WORKSPACES[0]},
+        )
+        run_loop(200)
+
+        self.assertEqual(self.i3.focused_workspace.value.name, "2")
+        self.assertFalse(self.i3.workspaces.value[0].visible)
+
+    def test_applies_workspace_init_and_empty_events(self):
+        workspace = {"id": 3, "num": 3, "name": "3", "output": "DP-1"}
+
+        self.server.send_event(
+            EventType.WORKSPACE, {"change": "init", "current": workspace}
+        )
+        run_loop(200)
+        self.assertEqual([w.name for w in self.i3.workspaces.value], ["1", "2", "3"])
+
+        self.server.send_event(
+            EventType.WORKSPACE, {"change": "empty", "current": workspace}
+        )
+        run_loop(200)
+        self.assertEqual([w.name for w in self.i3.workspaces.value], ["1", "2"])
+
+    def test_does_not_notify_unchanged_workspaces(self):
+        notified = []
+        self.i3.workspaces.connect("notify::value", lambda *_: notified.append(True))
+
+        self.server.send_event(
+            EventType.WORKSPACE, {"change": "urgent", "current": WORKSPACES[1]}
+        )
+        run_loop(200)
+
+        self.assertFalse(notified)
+
+    def test_updates_window_title_and_mode(self):
+        self.server.send_event(
+            EventType.WINDOW,
+            {"change": "title", "container": {"name": "Editor", "focused": True}},
+        )
+        self.server.send_event(EventType.MODE, {"change": "resize"})
+        run_loop(200)
+
+        self.assertEqual(self.i3.window_title.value, "Editor")
+        self.assertEqual(self.i3.mode.value, "resize")
+
+    def test_command(self):
+        results = []
+        self.i3.command("workspace 2", results.append)
+        run_loop(200)
+
+        self.assertEqual(results, [[{"success": True}]])
+        self.assertEqual(
+            self.server.received[-1], (MessageType.RUN_COMMAND, "workspace 2")
+        )
+
+    def test_writes_do_not_block_when_i3_stops_reading(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "hung.sock")
+
+        # Accepts connections, but never reads from them.
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(1)
+        self.addCleanup(server.close)
+
+        i3 = I3(path)
+        self.addCleanup(i3.close)
+        run_loop(100)
+
+        ticks = []
+        GLib.timeout_add(10, lambda: ticks.append(True) or len(ticks) < 5)
+        for _ in range(4):
+            i3.command("nop " + "x" * 1024 * 1024)
+        run_loop(200)
+
+        self.assertEqual(len(ticks), 5)
+
+    def test_workspace_from_json(self):
+        self.assertEqual(
+            Workspace.from_json({"id": 4, "name": "mail"}),
+            Workspace(4, -1, "mail", False, False, False, ""),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+
+from sora.metrics import (
+    CpuUsage,
+    MemoryUsage,
+    Rate,
+    Sampler,
+    get_sampler,
+    cpu_usage,
+    memory_usage,
+    parse_diskstats,
+    parse_meminfo,
+    parse_net_dev,
+    parse_stat,
+    rates,
+)
+
+STAT = """cpu  100 0 100 700 100 0 0 0 0 0
+cpu0 50 0 50 350 50 0 0 0 0 0
+cpu1 50 0 50 350 50 0 0 0 0 0
+intr 118668 0 0
+ctxt 2133
+"""
+
+STAT_LATER = """cpu  200 0 100 800 100 0 0 0 0 0
+cpu0 150 0 50 350 50 0 0 0 0 0
+cpu1 50 0 50 450 50 0 0 0 0 0
+intr 118700 0 0
+ctxt 2200
+"""
+
+MEMINFO = """MemTotal:       16000000 kB
+MemFree:         2000000 kB
+MemAvailable:    4000000 kB
+HugePages_Total:       0
+"""
+
+NET_DEV = """Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo:    1000      10    0    0    0     0          0         0     1000      10    0    0    0     0       0          0
+  eth0:    5000      50    0    0    0     0          0         0     2000      20    0    0    0     0       0          0
+"""
+
+DISKSTATS = """   7       0 loop0 10 0 80 0 0 0 0 0 0 0 0 0 0 0 0 0 0
+ 259       0 nvme0n1 100 0 200 50 10 0 40 20 0 70 70 0 0 0 0 0 0
+"""
+
+
+class TestParsers(unittest.TestCase):
+    def test_parse_stat(self):
+        self.assertEqual(
+            parse_stat(STAT),
+            {"cpu": (800, 1000), "cpu0": (400, 500), "cpu1": (400, 500)},
+        )
+
+    def test_parse_meminfo(self):
+        meminfo = parse_meminfo(MEMINFO)
+
+        self.assertEqual(meminfo["MemTotal"], 16000000 * 1024)
+        self.assertEqual(meminfo["HugePages_Total"], 0)
+
+    def test_parse_net_dev(self):
+        self.assertEqual(
+            parse_net_dev(NET_DEV), {"lo": (1000, 1000), "eth0": (5000, 2000)}
+        )
+
+    def test_parse_diskstats_ignores_loop_devices(self):
+        self.assertEqual(parse_diskstats(DISKSTATS), {"nvme0n1": (200 * 512, 40 * 512)})
+
+
+class TestUsage(unittest.TestCase):
+    def test_cpu_usage(self):
+        usage = cpu_usage(parse_stat(STAT), parse_stat(STAT_LATER))
+        self.assertEqual(usage, CpuUsage(50.0, [100.0, 0.0]))
+
+    def test_cpu_usage_without_previous_sample(self):
+        self.assertEqual(cpu_usage({}, parse_stat(STAT)), CpuUsage(0.0, [0.0, 0.0]))
+
+    def test_memory_usage(self):
+        usage = memory_usage(parse_meminfo(MEMINFO))
+        self.assertEqual(
+            usage,
+            MemoryUsage(16000000 * 1024, 4000000 * 1024, 12000000 * 1024, 75.0),
+        )
+
+    def test_rates(self):
+        self.assertEqual(
+            rates({"eth0": (1000, 500)}, {"eth0": (3000, 1500), "wlan0": (10, 10)}, 2),
+            {"eth0": Rate(1000.0, 500.0), "wlan0": Rate(0.0, 0.0)},
+        )
+
+
+class TestSampler(unittest.TestCase):
+    def test_samples_proc(self):
+        sampler = Sampler(60)
+        self.addCleanup(sampler.stop)
+
+        sampler.sample()
+
+        self.assertIsInstance(sampler.cpu.value, CpuUsage)
+        self.assertIsInstance(sampler.memory.value, MemoryUsage)
+        self.assertGreater(sampler.memory.value.total, 0)
+        self.assertIn("lo", sampler.network.value)
+
+    def test_get_sampler_replaces_stopped_sampler(self):
+        sampler = get_sampler(60)
+        self.assertIs(get_sampler(60), sampler)
+
+        sampler.stop()
+        self.assertTrue(sampler.stopped)
+
+        replacement = get_sampler(60)
+        self.addCleanup(replacement.stop)
+
+        self.assertIsNot(replacement, sampler)
+        self.assertFalse(replacement.stopped)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,13 @@ from unittest.mock import MagicMock
 
 from gi.repository import Gdk
 
-from sora.monitor import Monitor, get_monitor, get_primary_monitor, list_monitors
+from sora.monitor import (
+    Monitor,
+    MonitorRegistry,
+    get_monitor,
+    get_primary_monitor,
+    list_monitors,
+)
 
 NUMERIC_MONITOR_IDENTIFIER = 1
 MONITOR_NAME = "TestMonitor"
@@ -17,7 +23,7 @@ WIDTH = 1920
 HEIGHT = 1080
 
 
-def mock_gdk_monitor(model, x, y, height, width):
+def mock_gdk_monitor(model, x, y, height, width, connector=None):
     geometry = Gdk.Rectangle()
     geometry.x = x
     geometry.y = y
@@ -27,6 +33,7 @@ def mock_gdk_monitor(model, x, y, height, width):
     monitor = MagicMock()
     monitor.get_model = MagicMock(return_value=model)
     monitor.get_geometry = MagicMock(return_value=geometry)
+    monitor.get_connector = MagicMock(return_value=connector)
 
     return monitor
 
@@ -135,5 +142,74 @@ class TestGetPrimaryMonitor(unittest.TestCase):
         display_mock.get_primary_monitor.assert_called_once()
 
 
+class TestMonitorRegistry(unittest.TestCase):
+    def setUp(self):
+        self.monitors = [
+            mock_gdk_monitor("First", 0, 0, HEIGHT, WIDTH, "DP-1"),
+            mock_gdk_monitor("Second", WIDTH, 0, HEIGHT, WIDTH, "HDMI-1"),
+        ]
+        self.display = MagicMock()
+        self.display.get_n_monitors = MagicMock(side_effect=lambda: len(self.monitors))
+        self.display.get_monitor = MagicMock(side_effect=lambda i: self.monitors[i])
+        self.registry = MonitorRegistry(self.display)
+
+    def emit(self, signal):
+        for call in self.display.connect.call_args_list:
+            if call.args[0] == signal:
+                call.args[1](self.display)
+
+    def test_for_display_returns_same_registry(self):
+        display = MagicMock()
+        self.assertIs(
+            MonitorRegistry.for_display(display), MonitorRegistry.for_display(display)
+        )
+
+    def test_caches_name_lookup(self):
+        self.assertEqual(self.registry.get("Second").x, WIDTH)
+        self.assertEqual(self.registry.get("First").x, 0)
+
+        self.display.get_n_monitors.assert_called_once()
+        self.assertEqual(self.display.get_monitor.call_count, 2)
+
+    def test_gets_monitor_by_connector(self):
+        self.assertEqual(self.registry.get("HDMI-1").name, "Second")
+
+    def test_caches_index_lookup(self):
+        self.registry.get(1)
+        self.registry.get(1)
+
+        self.display.get_monitor.assert_called_once_with(1)
+
+    def test_invalidates_on_monitor_removed(self):
+        self.registry.get("Second")
+        self.monitors.pop()
+        self.emit("monitor-removed")
+
+        self.assertIsNone(self.registry.get("Second"))
+        self.assertEqual(len(self.registry.list()), 1)
+
+    def test_updates_changed_variable(self):
+        changed = self.registry.changed
+        calls = []
+        changed.connect("notify::value", lambda *_: calls.append(changed.value))
+
+        self.monitors.append(mock_gdk_monitor("Third", 0, HEIGHT, HEIGHT, WIDTH))
+        self.emit("monitor-added")
+        self.emit("monitor-added")
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([m.name for m in changed.value], ["First", "Second", "Third"])
+
+    def test_monitor_equality(self):
+        self.assertEqual(
+            Monitor("A", 0, 0, 1, 1, "DP-1"), Monitor("A", 0, 0, 1, 1, "DP-1")
+        )
+        self.assertNotEqual(Monitor("A", 0, 0, 1, 1), Monitor("A", 0, 0, 2, 1))
+
+    def test_monitor_hash(self):
+        monitors = {Monitor("A", 0, 0, 1, 1, "DP-1"): "left"}
+        self.assertEqual(monitors[Monitor("A", 0, 0, 1, 1, "DP-1")], "left")
+
+
 if __name__ == "__main__":
     unittest.main()
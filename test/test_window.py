@@ -0,0 +1,101 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+
+from gi.repository import Gtk
+
+from sora.geometry import Geometry
+from sora.monitor import Monitor
+from sora.widgets.bind import Variable
+from sora.window import Window
+
+PRIMARY = Monitor("primary", 0, 0, 1920, 1080, "DP-1")
+SECONDARY = Monitor("secondary", 1920, 0, 2560, 1440, "HDMI-1")
+GEOMETRY = Geometry(width="100%", height="30px")
+
+
+@unittest.skipUnless(os.environ.get("DISPLAY"), "requires an X server (e.g. Xvfb)")
+class TestWindowMonitorChanges(unittest.TestCase):
+    def setUp(self):
+        Gtk.init_check()
+
+        self.monitors = {"HDMI-1": SECONDARY}
+        self.primary = PRIMARY
+        self.registry = MagicMock()
+        self.registry.changed = Variable([PRIMARY, SECONDARY])
+
+        for name, value in [
+            ("get_registry", lambda: self.registry),
+            ("get_monitor", lambda identifier: self.monitors.get(identifier)),
+            ("get_primary_monitor", lambda: self.primary),
+        ]:
+            patcher = patch(f"sora.window.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        move = patch.object(Window, "move")
+        self.move = move.start()
+        self.addCleanup(move.stop)
+
+    def create_window(self, **kwargs) -> Window:
+        window = Window("bar", Gtk.Label(), geometry=GEOMETRY, **kwargs)
+        self.addCleanup(window.destroy)
+        window.show()
+        return window
+
+    def change_monitors(self, monitors: dict[str, Monitor], primary: Monitor):
+        self.monitors = monitors
+        self.primary = primary
+        self.registry.changed.value = [primary, *monitors.values()]
+
+    def test_replaces_window_when_monitor_moves(self):
+        self.create_window(monitor="HDMI-1")
+        self.move.assert_called_with(1920, 0)
+
+        moved = Monitor("secondary", 0, 1080, 2560, 1440, "HDMI-1")
+        self.change_monitors({"HDMI-1": moved}, PRIMARY)
+
+        self.move.assert_called_with(0, 1080)
+
+    def test_follows_primary_monitor(self):
+        self.create_window()
+        self.move.assert_called_with(0, 0)
+
+        self.change_monitors({"HDMI-1": SECONDARY}, SECONDARY)
+
+        self.move.assert_called_with(1920, 0)
+
+    def test_hides_window_when_monitor_is_gone(self):
+        window = self.create_window(monitor="HDMI-1")
+
+        self.change_monitors({}, PRIMARY)
+        self.assertFalse(window.get_visible())
+
+        self.change_monitors({"HDMI-1": SECONDARY}, PRIMARY)
+        self.assertTrue(window.get_visible())
+        self.move.assert_called_with(1920, 0)
+
+    def test_falls_back_to_primary_monitor(self):
+        window = self.create_window(monitor="HDMI-1", monitor_fallback=True)
+
+        self.change_monitors({}, PRIMARY)
+
+        self.assertTrue(window.get_visible())
+        self.move.assert_called_with(0, 0)
+
+    def test_stops_following_changes_when_destroyed(self):
+        window = self.create_window(monitor="HDMI-1")
+        window.destroy()
+        self.move.reset_mock()
+
+        self.change_monitors({"HDMI-1": PRIMARY}, PRIMARY)
+
+        self.move.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from gi.repository import GLib, GObject
+
+from sora.utils.batch import PropertyBatch
+
+
+class Target(GObject.GObject):
+    writes: list
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    @GObject.Property(type=GObject.TYPE_PYOBJECT)
+    def text(self):
+        return self.writes[-1] if self.writes else None
+
+    @text.setter
+    def text(self, text):
+        self.writes.append(text)
+
+
+class TestPropertyBatch(unittest.TestCase):
+    def test_applies_latest_value_once(self):
+        batch = PropertyBatch()
+        target = Target()
+
+        for i in range(50):
+            batch.queue(target, "text", i)
+
+        self.assertFalse(target.writes)
+
+        loop = GLib.MainLoop()
+        GLib.idle_add(loop.quit, priority=GLib.PRIORITY_LOW)
+        loop.run()
+
+        self.assertEqual(target.writes, [49])
+        self.assertEqual(batch.coalesced, 49)
+
+    def test_flush_applies_all_objects(self):
+        batch = PropertyBatch()
+        a = Target()
+        b = Target()
+
+        batch.queue(a, "text", "a")
+        batch.queue(b, "text", "b")
+        batch.flush()
+
+        self.assertEqual(a.writes, ["a"])
+        self.assertEqual(b.writes, ["b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from dataclasses import dataclass
+
+from sora.utils.definition import definition, function_key
+from sora.widgets.bind import Variable
+
+
+@dataclass
+class Props:
+    label: object = None
+    on_click: object = None
+
+
+def make_lambda(value):
+    return lambda: value
+
+
+class TestFunctionKey(unittest.TestCase):
+    def test_equal_for_same_code(self):
+        a = lambda: print("a")
+        b = lambda: print("a")
+
+        self.assertEqual(function_key(a), function_key(b))
+
+    def test_differs_for_different_code(self):
+        a = lambda: print("a")
+        b = lambda: print("b")
+
+        self.assertNotEqual(function_key(a), function_key(b))
+
+    def test_compares_captured_values(self):
+        self.assertEqual(function_key(make_lambda(1)), function_key(make_lambda(1)))
+        self.assertNotEqual(function_key(make_lambda(1)), function_key(make_lambda(2)))
+
+    def test_handles_recursive_functions(self):
+        def outer():
+            def inner(n):
+                return inner(n - 1) if n else 0
+
+            return inner
+
+        self.assertEqual(function_key(outer()), function_key(outer()))
+
+
+class TestDefinition(unittest.TestCase):
+    def test_equal_for_equal_props(self):
+        a = Props(label="a", on_click=lambda: None)
+        b = Props(label="a", on_click=lambda: None)
+
+        self.assertEqual(definition(a), definition(b))
+
+    def test_compares_variables_by_identity(self):
+        variable = Variable("a")
+
+        self.assertEqual(definition(Props(variable)), definition(Props(variable)))
+        self.assertNotEqual(
+            definition(Props(variable)), definition(Props(Variable("a")))
+        )
+
+    def test_compares_computed_variables_by_dependencies(self):
+        source = Variable(1)
+        a = Variable.computed(lambda v: v + 1, source)
+        b = Variable.computed(lambda v: v + 1, source)
+
+        self.assertEqual(definition(a), definition(b))
+
+    def test_compares_transforms(self):
+        variable = Variable(1)
+        before = definition(variable.transform(lambda v: v + 1))
+        after = definition(variable.transform(lambda v: v + 2))
+
+        self.assertNotEqual(before, after)
+
+
+class TestVariableReload(unittest.TestCase):
+    def test_reuses_running_variables(self):
+        variable = Variable.interval(60, lambda: "a")
+
+        Variable.begin_reload()
+        reused = Variable.interval(60, lambda: "a")
+        Variable.end_reload()
+
+        self.assertIs(reused, variable)
+        reused.stop_interval()
+
+    def test_stops_unused_variables(self):
+        variable = Variable.interval(60, lambda: "a")
+
+        Variable.begin_reload()
+        other = Variable.interval(60, lambda: "b")
+        Variable.end_reload()
+
+        self.assertIsNot(other, variable)
+        other.stop_interval()
+
+        with self.assertLogs(level="WARNING"):
+            variable.stop_interval()
+
+
+if __name__ == "__main__":
+    unittest.main()
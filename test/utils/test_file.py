@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from sora.utils.file import FileWatcher, is_pseudo_file
+from test.helpers import run_loop
+
+
+class TestFileWatcher(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "state"
+        self.path.write_text("1\n")
+
+    def test_reads_initial_content(self):
+        received = []
+        watcher = FileWatcher(self.path, received.append)
+        self.addCleanup(watcher.stop)
+
+        self.assertEqual(received, ["1\n"])
+        self.assertEqual(watcher.reads, 1)
+
+    def test_reads_only_after_change(self):
+        received = []
+        watcher = FileWatcher(self.path, received.append)
+        self.addCleanup(watcher.stop)
+
+        run_loop(300)
+        self.assertEqual(watcher.reads, 1)
+
+        self.path.write_text("2\n")
+        run_loop(300)
+
+        self.assertEqual(received[-1], "2\n")
+
+    def test_reopens_replaced_file(self):
+        received = []
+        watcher = FileWatcher(self.path, received.append)
+        self.addCleanup(watcher.stop)
+
+        replacement = self.path.with_name("state.new")
+        replacement.write_text("3\n")
+        os.replace(replacement, self.path)
+        run_loop(300)
+
+        self.assertEqual(received[-1], "3\n")
+
+    def test_polls(self):
+        received = []
+        watcher = FileWatcher(self.path, received.append, poll_interval=0.1, poll=True)
+        self.addCleanup(watcher.stop)
+
+        self.path.write_text("4\n")
+        run_loop(250)
+
+        self.assertEqual(received[-1], "4\n")
+        self.assertGreater(watcher.reads, 1)
+
+    def test_stop(self):
+        received = []
+        watcher = FileWatcher(self.path, received.append)
+        watcher.stop()
+
+        self.path.write_text("5\n")
+        run_loop(300)
+
+        self.assertEqual(received, ["1\n"])
+
+    def test_is_pseudo_file(self):
+        self.assertTrue(is_pseudo_file(Path("/proc/stat")))
+        self.assertTrue(is_pseudo_file(Path("/sys/class/power_supply")))
+        self.assertFalse(is_pseudo_file(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from sora.utils.scroll import ScrollAccumulator
+
+
+class TestScrollAccumulator(unittest.TestCase):
+    def test_sums_fractional_deltas_into_steps(self):
+        accumulator = ScrollAccumulator()
+        for _ in range(10):
+            accumulator.add(0, 0.1)
+
+        self.assertEqual(accumulator.take(), (0, 1))
+        self.assertFalse(accumulator.pending)
+
+    def test_carries_remainder(self):
+        accumulator = ScrollAccumulator()
+        accumulator.add(0.5, -1.5)
+
+        self.assertEqual(accumulator.take(), (0, -1))
+        self.assertTrue(accumulator.pending)
+
+        accumulator.add(0.5, -0.5)
+        self.assertEqual(accumulator.take(), (1, -1))
+
+    def test_leading_takes_at_least_one_step(self):
+        accumulator = ScrollAccumulator()
+        accumulator.add(0, -0.25)
+
+        self.assertEqual(accumulator.take(leading=True), (0, -1))
+
+        # The step taken ahead is paid back by the following deltas.
+        accumulator.add(0, -0.75)
+        self.assertEqual(accumulator.take(), (0, 0))
+        self.assertFalse(accumulator.pending)
+
+    def test_leading_keeps_direction_of_slow_scrolling(self):
+        accumulator = ScrollAccumulator()
+        steps = []
+
+        for _ in range(20):
+            accumulator.add(0, 0.1)
+            steps.append(accumulator.take(leading=True)[1])
+
+        self.assertTrue(all(step >= 0 for step in steps))
+        self.assertEqual(sum(steps), 2)
+
+    def test_reversing_drops_leading_debt(self):
+        accumulator = ScrollAccumulator()
+        accumulator.add(0, 0.25)
+        self.assertEqual(accumulator.take(leading=True), (0, 1))
+
+        accumulator.add(0, -0.5)
+        self.assertEqual(accumulator.take(), (0, 0))
+
+        accumulator.add(0, -0.5)
+        self.assertEqual(accumulator.take(), (0, -1))
+
+    def test_reset(self):
+        accumulator = ScrollAccumulator()
+        accumulator.add(0.5, 0.5)
+        accumulator.reset()
+
+        self.assertFalse(accumulator.pending)
+        self.assertEqual(accumulator.take(), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+import unittest
+
+from gi.repository import GLib
+
+from sora.utils import spawn
+from sora.utils.spawn import (
+    CommandResult,
+    LineBuffer,
+    ReadMode,
+    get_listener,
+    listen,
+    queued_commands,
+    run,
+    running_commands,
+    subprocess,
+    unlisten,
+)
+from test.helpers import run_loop
+
+
+def run_process(cmd: list[str], mode: ReadMode) -> list:
+    received = []
+    loop = GLib.MainLoop()
+
+    process = subprocess(cmd, received.append, mode)
+    process.wait_async(None, lambda *_: GLib.timeout_add(100, loop.quit))
+    GLib.timeout_add_seconds(5, loop.quit)
+    loop.run()
+
+    return received
+
+
+class TestLineBuffer(unittest.TestCase):
+    def test_returns_complete_lines(self):
+        buffer = LineBuffer()
+
+        self.assertEqual(buffer.feed(b"a\nb\nc"), ["a", "b"])
+        self.assertEqual(buffer.feed(b"d\n"), ["cd"])
+        self.assertEqual(buffer.feed(b"e"), [])
+
+    def test_keeps_empty_lines(self):
+        buffer = LineBuffer()
+        self.assertEqual(buffer.feed(b"a\n\nb\n"), ["a", "", "b"])
+
+    def test_decodes_split_utf8(self):
+        buffer = LineBuffer()
+        data = "ä\n".encode()
+
+        self.assertEqual(buffer.feed(data[:1]), [])
+        self.assertEqual(buffer.feed(data[1:]), ["ä"])
+
+    def test_flush(self):
+        buffer = LineBuffer()
+        buffer.feed(b"a\nb")
+
+        self.assertEqual(buffer.flush(), ["b"])
+        self.assertEqual(buffer.flush(), [])
+
+
+class TestSubprocess(unittest.TestCase):
+    CMD = ["sh", "-c", "printf 'a\\nb\\nc'"]
+
+    def test_each(self):
+        self.assertEqual(run_process(self.CMD, ReadMode.EACH), ["a", "b", "c"])
+
+    def test_latest(self):
+        self.assertEqual(run_process(self.CMD, ReadMode.LATEST), ["b", "c"])
+
+    def test_batch(self):
+        self.assertEqual(run_process(self.CMD, ReadMode.BATCH), [["a", "b"], ["c"]])
+
+
+class TestListen(unittest.TestCase):
+    CMD = ["sh", "-c", "echo a; echo b; sleep 5"]
+
+    def test_shares_process(self):
+        first, second = [], []
+        a = listen(self.CMD, first.append)
+        b = listen(self.CMD, second.append)
+
+        listener = get_listener(self.CMD)
+        self.assertEqual(listener.subscriber_count, 2)
+
+        run_loop(300)
+
+        self.assertEqual(first, ["a", "b"])
+        self.assertEqual(second, ["a", "b"])
+
+        unlisten(a)
+        unlisten(b)
+
+    def test_replays_last_line_to_late_subscriber(self):
+        a = listen(self.CMD, lambda _: None)
+        run_loop(300)
+
+        late = []
+        b = listen(self.CMD, late.append, ReadMode.BATCH)
+        self.assertEqual(late, [["b"]])
+
+        unlisten(a)
+        unlisten(b)
+
+    def test_stops_process_after_last_unsubscribe(self):
+        a = listen(self.CMD, lambda _: None)
+        b = listen(self.CMD, lambda _: None)
+        listener = get_listener(self.CMD)
+
+        self.assertTrue(unlisten(a))
+        self.assertIs(get_listener(self.CMD), listener)
+
+        self.assertTrue(unlisten(b))
+        self.assertIsNone(get_listener(self.CMD))
+        self.assertFalse(unlisten(b))
+
+        run_loop(100)
+        self.assertFalse(listener.process.get_if_exited())
+        self.assertTrue(listener.process.get_if_signaled())
+
+    def test_stale_subscription_keeps_new_listener(self):
+        cmd = ["sh", "-c", "echo a"]
+        stale = listen(cmd, lambda _: None)
+        run_loop(300)
+
+        # The process has exited, so the next subscriber starts a new one.
+        self.assertIsNone(get_listener(cmd))
+        current = listen(cmd, lambda _: None)
+        listener = get_listener(cmd)
+
+        self.assertTrue(unlisten(stale))
+        self.assertIs(get_listener(cmd), listener)
+
+        unlisten(current)
+
+
+def run_commands(commands: list[tuple[list[str], float | None]]) -> list[CommandResult]:
+    results = []
+    loop = GLib.MainLoop()
+
+    def on_result(result: CommandResult):
+        results.append(result)
+        if len(results) == len(commands):
+            loop.quit()
+
+    for cmd, timeout in commands:
+        run(cmd, on_result, timeout)
+
+    GLib.timeout_add_seconds(5, loop.quit)
+    loop.run()
+
+    return results
+
+
+class TestRun(unittest.TestCase):
+    def test_returns_output_and_exit_status(self):
+        [result] = run_commands(
+            [(["sh", "-c", "echo out; echo err >&2; exit 3"], None)]
+        )
+
+        self.assertEqual(result.stdout, "out\n")
+        self.assertEqual(result.stderr, "err\n")
+        self.assertEqual(result.exit_status, 3)
+        self.assertFalse(result.ok)
+        self.assertFalse(result.timed_out)
+
+    def test_stops_command_after_timeout(self):
+        [result] = run_commands([(["sleep", "5"], 0.1)])
+
+        self.assertTrue(result.timed_out)
+        self.assertIsNone(result.exit_status)
+
+    def test_reports_command_that_cannot_be_started(self):
+        [result] = run_commands([(["sora-command-that-does-not-exist"], None)])
+
+        self.assertIsNone(result.exit_status)
+        self.assertTrue(result.stderr)
+
+    def test_queues_commands_over_limit(self):
+        limit = spawn.MAX_RUNNING_COMMANDS
+        spawn.MAX_RUNNING_COMMANDS = 2
+        self.addCleanup(setattr, spawn, "MAX_RUNNING_COMMANDS", limit)
+
+        results = []
+        loop = GLib.MainLoop()
+
+        def on_result(result: CommandResult):
+            results.append(result)
+            if len(results) == 3:
+                loop.quit()
+
+        for i in range(3):
+            run(["echo", str(i)], on_result)
+
+        self.assertEqual(running_commands(), 2)
+        self.assertEqual(queued_commands(), 1)
+
+        GLib.timeout_add_seconds(5, loop.quit)
+        loop.run()
+
+        self.assertEqual(sorted(r.stdout for r in results), ["0\n", "1\n", "2\n"])
+        self.assertEqual(running_commands(), 0)
+        self.assertEqual(queued_commands(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from sora.utils.timer import STAGGER_SLOTS, TimerWheel
+from test.helpers import run_loop
+
+
+class TestTimerWheel(unittest.TestCase):
+    def test_groups_timers_with_same_period(self):
+        wheel = TimerWheel()
+        a = wheel.add(1, lambda: None)
+        b = wheel.add(1, lambda: None)
+        c = wheel.add(2, lambda: None)
+
+        self.assertEqual(wheel.sources, 2)
+
+        wheel.remove(a)
+        wheel.remove(b)
+        wheel.remove(c)
+
+        self.assertEqual(wheel.sources, 0)
+
+    def test_runs_sub_second_timers(self):
+        wheel = TimerWheel()
+        calls = []
+        handle = wheel.add(0.05, lambda: calls.append(1))
+
+        run_loop(280)
+        wheel.remove(handle)
+
+        self.assertGreaterEqual(len(calls), 4)
+
+    def test_remove_stops_timer(self):
+        wheel = TimerWheel()
+        calls = []
+        handle = wheel.add(0.05, lambda: calls.append(1))
+
+        self.assertTrue(wheel.remove(handle))
+        self.assertFalse(wheel.remove(handle))
+
+        run_loop(150)
+        self.assertFalse(calls)
+
+    def test_staggers_timers_across_period(self):
+        wheel = TimerWheel()
+        handles = [
+            wheel.add(1, lambda: None, stagger=True) for _ in range(STAGGER_SLOTS)
+        ]
+
+        self.assertEqual(wheel.sources, STAGGER_SLOTS)
+
+        for handle in handles:
+            wheel.remove(handle)
+
+    def test_keeps_running_when_callback_fails(self):
+        wheel = TimerWheel()
+        calls = []
+
+        def fail():
+            raise Exception("failed")
+
+        a = wheel.add(0.05, fail)
+        b = wheel.add(0.05, lambda: calls.append(1))
+
+        run_loop(130)
+        wheel.remove(a)
+        wheel.remove(b)
+
+        self.assertGreaterEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import gi
 
 gi.require_version("Gtk", "3.0")
 
-from gi.repository import Gtk
+from gi.repository import Gtk, GObject
 
 from sora.widgets.bind import Variable
 from sora.widgets.base import BaseWidget, BaseWidgetProps
@@ -128,6 +128,33 @@ class TestBaseWidget(unittest.TestCase):
         self.assertEqual(widget.classnames, NEW_CLASSNAMES)
         self.assertEqual(widget.cursor, NEW_CURSOR)
 
+    def test_classnames_updates_changed_classes(self):
+        widget = BaseWidget(Gtk.Label)(BaseWidgetProps(classnames=CLASSNAMES))
+        style_context = widget.get_style_context()
+
+        widget.classnames = "class-b class-c"
+
+        self.assertFalse(style_context.has_class("class-a"))
+        self.assertTrue(style_context.has_class("class-b"))
+        self.assertTrue(style_context.has_class("class-c"))
+        self.assertEqual(sorted(widget.classnames), ["class-b", "class-c"])
+
+    def test_connects_hover_handlers_only_for_custom_cursor(self):
+        signal_id = GObject.signal_lookup("enter-notify-event", Gtk.Widget)
+        widget = BaseWidget(Gtk.Label)(BaseWidgetProps())
+
+        self.assertFalse(
+            GObject.signal_has_handler_pending(widget, signal_id, 0, False)
+        )
+
+        widget.cursor = Cursor.POINTER
+        self.assertTrue(GObject.signal_has_handler_pending(widget, signal_id, 0, False))
+
+        widget.cursor = Cursor.DEFAULT
+        self.assertFalse(
+            GObject.signal_has_handler_pending(widget, signal_id, 0, False)
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
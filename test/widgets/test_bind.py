@@ -0,0 +1,344 @@
+import gc
+import tempfile
+import threading
+import unittest
+import weakref
+from pathlib import Path
+
+from sora.utils.spawn import get_listener
+from sora.widgets.bind import MAX_TIMED_OUT_RUNS, Variable
+from test.helpers import run_loop, run_until_notify
+
+
+class TestVariableChangeDetection(unittest.TestCase):
+    def test_notifies_on_change(self):
+        variable = Variable("a")
+        notified = []
+        variable.connect("notify::value", lambda *_: notified.append(variable.value))
+
+        variable.value = "b"
+
+        self.assertEqual(notified, ["b"])
+        self.assertEqual(variable.suppressed_updates, 0)
+
+    def test_suppresses_equal_value(self):
+        variable = Variable("a")
+        notified = []
+        variable.connect("notify::value", lambda *_: notified.append(variable.value))
+
+        variable.value = "a"
+        variable.value = "a"
+
+        self.assertFalse(notified)
+        self.assertEqual(variable.suppressed_updates, 2)
+
+    def test_uses_key(self):
+        variable = Variable(1.2).distinct(key=round)
+        notified = []
+        variable.connect("notify::value", lambda *_: notified.append(variable.value))
+
+        variable.value = 1.4
+        variable.value = 2.1
+
+        self.assertEqual(notified, [2.1])
+        self.assertEqual(variable.suppressed_updates, 1)
+
+    def test_uses_compare(self):
+        variable = Variable(10, compare=lambda a, b: abs(a - b) < 5)
+        notified = []
+        variable.connect("notify::value", lambda *_: notified.append(variable.value))
+
+        variable.value = 12
+        variable.value = 20
+
+        self.assertEqual(notified, [20])
+
+
+class TestVariableTransform(unittest.TestCase):
+    def test_caches_transformed_value(self):
+        calls = []
+        variable = Variable(1).transform(lambda v: calls.append(v) or v * 2)
+
+        self.assertEqual(variable.value, 2)
+        self.assertEqual(variable.value, 2)
+        self.assertEqual(calls, [1])
+        self.assertEqual(variable.transform_cache_hits, 1)
+
+    def test_invalidates_on_value_change(self):
+        variable = Variable(1).transform(lambda v: v * 2)
+        self.assertEqual(variable.value, 2)
+
+        variable.value = 2
+        self.assertEqual(variable.value, 4)
+
+    def test_invalidates_on_transform_change(self):
+        variable = Variable(1).transform(lambda v: v * 2)
+        self.assertEqual(variable.value, 2)
+
+        variable.transform(lambda v: v * 3)
+        self.assertEqual(variable.value, 3)
+
+
+class TestVariableComputed(unittest.TestCase):
+    def test_computes_from_dependencies(self):
+        a = Variable(1)
+        b = Variable(2)
+        total = Variable.computed(lambda x, y: x + y, a, b)
+
+        self.assertEqual(total.value, 3)
+
+        a.value = 5
+        self.assertEqual(total.value, 7)
+
+    def test_is_lazy_when_not_observed(self):
+        calls = []
+        a = Variable(1)
+        double = Variable.computed(lambda x: calls.append(x) or x * 2, a)
+
+        a.value = 2
+        a.value = 3
+        self.assertFalse(calls)
+
+        self.assertEqual(double.value, 6)
+        self.assertEqual(calls, [3])
+
+    def test_recomputes_observed_on_change(self):
+        a = Variable(1)
+        double = Variable.computed(lambda x: x * 2, a)
+        notified = []
+        double.connect("notify::value", lambda *_: notified.append(double.value))
+
+        a.value = 2
+
+        self.assertEqual(notified, [4])
+
+    def test_updates_diamond_once(self):
+        calls = []
+        a = Variable(1)
+        b = Variable.computed(lambda x: x + 1, a)
+        c = Variable.computed(lambda x: x * 2, a)
+        d = Variable.computed(lambda x, y: calls.append((x, y)) or x + y, b, c)
+        d.connect("notify::value", lambda *_: None)
+
+        self.assertEqual(d.value, 4)
+        calls.clear()
+
+        a.value = 2
+
+        self.assertEqual(calls, [(3, 4)])
+        self.assertEqual(d.value, 7)
+
+    def test_skips_recompute_when_dependency_unchanged(self):
+        calls = []
+        a = Variable(1)
+        parity = Variable.computed(lambda x: x % 2, a)
+        label = Variable.computed(lambda p: calls.append(p) or str(p), parity)
+
+        self.assertEqual(label.value, "1")
+        calls.clear()
+
+        a.value = 3
+
+        self.assertEqual(label.value, "1")
+        self.assertFalse(calls)
+
+    def test_unused_computed_is_freed(self):
+        a = Variable(1)
+        double = Variable.computed(lambda x: x * 2, a)
+        ref = weakref.ref(double)
+
+        del double
+        gc.collect()
+
+        self.assertIsNone(ref())
+        a.value = 2
+
+    def test_ignores_set_value(self):
+        computed = Variable.computed(lambda: 1)
+        computed.value = 2
+
+        self.assertEqual(computed.value, 1)
+
+
+class TestVariableInterval(unittest.TestCase):
+    def test_threaded_runs_func_off_main_thread(self):
+        main_thread = threading.current_thread()
+        variable = Variable.interval(
+            1, lambda: threading.current_thread() is main_thread, threaded=True
+        )
+
+        self.assertIsNone(variable.value)
+
+        run_until_notify(variable)
+        variable.stop_interval()
+
+        self.assertFalse(variable.value)
+
+    def test_threaded_uses_initial_value(self):
+        variable = Variable.interval(1, lambda: "value", threaded=True, initial="")
+        self.assertEqual(variable.value, "")
+
+        run_until_notify(variable)
+        variable.stop_interval()
+
+        self.assertEqual(variable.value, "value")
+
+    def test_threaded_drops_timed_out_result(self):
+        event = threading.Event()
+        variable = Variable.interval(
+            1, lambda: event.wait(1) or "late", threaded=True, timeout=0.1
+        )
+
+        run_loop(1500)
+        variable.stop_interval()
+
+        self.assertIsNone(variable.value)
+
+    def test_threaded_resumes_after_timeout_and_caps_stuck_runs(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+        calls = []
+
+        def never_returns():
+            calls.append(None)
+            event.wait()
+
+        variable = Variable.interval(0.2, never_returns, threaded=True, timeout=0.05)
+
+        run_loop(1500)
+        variable.stop_interval()
+
+        self.assertEqual(len(calls), MAX_TIMED_OUT_RUNS)
+
+
+class TestVariableCommand(unittest.TestCase):
+    def test_sets_result(self):
+        variable = Variable.command(["echo", "hello"])
+        self.assertIsNone(variable.value)
+
+        run_until_notify(variable)
+
+        self.assertEqual(variable.value.stdout, "hello\n")
+        self.assertTrue(variable.value.ok)
+
+
+class TestVariableListen(unittest.TestCase):
+    CMD = ["sh", "-c", "echo a; sleep 5"]
+
+    def test_shares_process(self):
+        first = Variable.listen(self.CMD)
+        second = Variable.listen(self.CMD)
+
+        run_until_notify(second)
+
+        self.assertEqual(first.value, "a")
+        self.assertEqual(second.value, "a")
+        self.assertEqual(get_listener(self.CMD).subscriber_count, 2)
+
+        first.stop_listener()
+        self.assertEqual(get_listener(self.CMD).subscriber_count, 1)
+
+        second.stop_listener()
+        self.assertIsNone(get_listener(self.CMD))
+
+    def test_notifies_equal_lines(self):
+        variable = Variable.listen(["sh", "-c", "echo a; sleep 0.2; echo a; sleep 5"])
+        self.addCleanup(variable.stop_listener)
+        notified = []
+        variable.connect("notify::value", lambda *_: notified.append(variable.value))
+
+        run_loop(800)
+
+        self.assertEqual(notified, ["a", "a"])
+
+    def test_distinct_suppresses_equal_lines(self):
+        variable = Variable.listen(
+            ["sh", "-c", "echo b; sleep 0.2; echo b; sleep 5"]
+        ).distinct()
+        self.addCleanup(variable.stop_listener)
+        notified = []
+        variable.connect("notify::value", lambda *_: notified.append(variable.value))
+
+        run_loop(800)
+
+        self.assertEqual(notified, ["b"])
+
+
+class TestVariableFile(unittest.TestCase):
+    def test_parses_content_on_change(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "capacity"
+            path.write_text("42\n")
+
+            variable = Variable.file(str(path), parse=lambda c: int(c))
+            self.assertEqual(variable.value, 42)
+
+            path.write_text("43\n")
+            run_until_notify(variable)
+            self.assertGreaterEqual(variable.file_reads, 2)
+            variable.stop_watcher()
+
+        self.assertEqual(variable.value, 43)
+
+
+class TestVariableReload(unittest.TestCase):
+    def test_interval_with_unhashable_closure(self):
+        allowed = {"a", "b"}
+        variable = Variable.interval(5, lambda: len(allowed))
+        self.addCleanup(variable.stop_interval)
+
+        self.assertEqual(variable.value, 2)
+
+    def test_reuses_variable_with_same_arguments(self):
+        def create():
+            return Variable.interval(5, lambda: "value")
+
+        old = create()
+        Variable.begin_reload()
+        new = create()
+        Variable.end_reload()
+        self.addCleanup(new.stop_interval)
+
+        self.assertIs(new, old)
+
+    def test_stops_unhashable_variable_on_reload(self):
+        def create():
+            allowed = {"a", "b"}
+            return Variable.interval(5, lambda: len(allowed))
+
+        old = create()
+        Variable.begin_reload()
+        new = create()
+        Variable.end_reload()
+        self.addCleanup(new.stop_interval)
+
+        self.assertIsNot(new, old)
+        with self.assertLogs(level="WARNING"):
+            old.stop_interval()
+
+
+class TestVariableCollectSources(unittest.TestCase):
+    def test_collects_created_sources(self):
+        def build():
+            Variable(0)
+            return Variable.interval(5, lambda: "value")
+
+        variable, sources = Variable.collect_sources(build)
+        self.addCleanup(variable.stop)
+
+        self.assertEqual(sources, [variable])
+
+    def test_stop_stops_collected_sources(self):
+        _, sources = Variable.collect_sources(
+            lambda: Variable.interval(5, lambda: "value")
+        )
+
+        for variable in sources:
+            variable.stop()
+
+        with self.assertLogs(level="WARNING"):
+            sources[0].stop_interval()
+
+
+if __name__ == "__main__":
+    unittest.main()
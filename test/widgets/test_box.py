@@ -0,0 +1,59 @@
+import unittest
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+
+from gi.repository import Gtk
+
+from sora.widgets.box import Box, BoxProps
+from sora.widgets.label import Label, LabelProps
+
+
+def label(text: str) -> Label:
+    return Label(LabelProps(label=text))
+
+
+def labels(box: Box) -> list[str]:
+    return [child.get_label() for child in box.get_children()]
+
+
+class TestBox(unittest.TestCase):
+    def test_init(self):
+        box = Box(BoxProps(children=[label("a"), label("b")]))
+        self.assertEqual(labels(box), ["a", "b"])
+
+    def test_keeps_existing_children(self):
+        a = label("a")
+        b = label("b")
+        box = Box(BoxProps(children=[a, b]))
+
+        c = label("c")
+        box.children = [b, c, a]
+
+        self.assertEqual(box.get_children(), [b, c, a])
+
+    def test_removes_missing_children(self):
+        a = label("a")
+        b = label("b")
+        box = Box(BoxProps(children=[a, b]))
+
+        box.children = [b]
+
+        self.assertEqual(box.get_children(), [b])
+        self.assertIsNone(a.get_parent())
+
+    def test_matches_children_by_key(self):
+        a = label("a")
+        b = label("b")
+        box = Box(BoxProps(children=[a, b], child_key=Gtk.Label.get_label))
+
+        box.children = [label("c"), label("b"), label("a")]
+
+        self.assertEqual(labels(box), ["c", "b", "a"])
+        self.assertIs(box.get_children()[1], b)
+        self.assertIs(box.get_children()[2], a)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import gi
+
+gi.require_version("Gdk", "3.0")
+
+from gi.repository import Gdk
+
+from sora.widgets.cursor import Cursor
+
+
+class TestCursor(unittest.TestCase):
+    def test_creates_cursor_once_per_display(self):
+        display = MagicMock()
+
+        with patch.object(Gdk.Cursor, "new_from_name") as new_from_name:
+            first = Cursor.POINTER.to_gdk_cursor(display)
+            second = Cursor.POINTER.to_gdk_cursor(display)
+
+        self.assertIs(first, second)
+        new_from_name.assert_called_once_with(display, "pointer")
+
+    def test_creates_cursor_per_display(self):
+        with patch.object(Gdk.Cursor, "new_from_name") as new_from_name:
+            Cursor.TEXT.to_gdk_cursor(MagicMock())
+            Cursor.TEXT.to_gdk_cursor(MagicMock())
+
+        self.assertEqual(new_from_name.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+
+from gi.repository import Gtk
+
+from sora.widgets.bind import Variable
+from sora.widgets.label import Label, LabelProps
+from sora.widgets.revealer import Revealer, RevealerProps
+from test.helpers import run_loop
+
+
+class TestRevealer(unittest.TestCase):
+    def setUp(self):
+        self.variables: list[Variable] = []
+        self.calls = 0
+
+    def factory(self) -> Gtk.Widget:
+        self.calls += 1
+        variable = Variable.interval(5, lambda: "value")
+        self.variables.append(variable)
+        return Label(LabelProps(label=variable))
+
+    def test_builds_child_lazily(self):
+        revealer = Revealer(RevealerProps(child_factory=self.factory))
+        self.assertIsNone(revealer.get_child())
+        self.assertEqual(self.calls, 0)
+
+        revealer.set_reveal_child(True)
+
+        self.assertIsNotNone(revealer.get_child())
+        self.assertEqual(self.calls, 1)
+
+        revealer.destroy()
+
+    def test_keep_alive_destroys_child_and_stops_variables(self):
+        revealer = Revealer(
+            RevealerProps(
+                reveal_child=True, child_factory=self.factory, keep_alive=0.05
+            )
+        )
+        self.assertIsNotNone(revealer.get_child())
+
+        revealer.set_reveal_child(False)
+        run_loop(200)
+
+        self.assertIsNone(revealer.get_child())
+        with self.assertLogs(level="WARNING"):
+            self.variables[0].stop_interval()
+
+        revealer.destroy()
+
+    def test_rebuilds_child_on_reveal(self):
+        revealer = Revealer(
+            RevealerProps(
+                reveal_child=True, child_factory=self.factory, keep_alive=0.05
+            )
+        )
+        revealer.set_reveal_child(False)
+        run_loop(200)
+
+        revealer.set_reveal_child(True)
+
+        self.assertIsNotNone(revealer.get_child())
+        self.assertEqual(self.calls, 2)
+
+        revealer.destroy()
+        with self.assertLogs(level="WARNING"):
+            self.variables[1].stop_interval()
+
+    def test_reveal_within_keep_alive_keeps_child(self):
+        revealer = Revealer(
+            RevealerProps(reveal_child=True, child_factory=self.factory, keep_alive=1)
+        )
+        child = revealer.get_child()
+
+        revealer.set_reveal_child(False)
+        revealer.set_reveal_child(True)
+        run_loop(50)
+
+        self.assertIs(revealer.get_child(), child)
+        self.assertEqual(self.calls, 1)
+
+        revealer.destroy()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+
+from gi.repository import Gdk
+
+from sora.widgets.slider import Slider, SliderProps
+from test.helpers import run_loop
+
+
+def smooth_scroll_event(dx: float, dy: float) -> Gdk.Event:
+    event = Gdk.Event.new(Gdk.EventType.SCROLL)
+    event.direction = Gdk.ScrollDirection.SMOOTH
+    event.delta_x = dx
+    event.delta_y = dy
+    return event
+
+
+class TestSliderChangeThrottle(unittest.TestCase):
+    def test_calls_on_change_without_throttle(self):
+        calls = []
+        slider = Slider(SliderProps(on_change=calls.append))
+
+        slider.value = 1
+        slider.value = 2
+
+        self.assertEqual(calls, [1, 2])
+
+    def test_delivers_last_value_at_end_of_period(self):
+        calls = []
+        slider = Slider(SliderProps(on_change=calls.append, change_throttle=50))
+        self.addCleanup(slider.destroy)
+
+        slider.value = 1
+        slider.value = 2
+        slider.value = 3
+        self.assertEqual(calls, [1])
+
+        run_loop(200)
+
+        self.assertEqual(calls, [1, 3])
+
+    def test_calls_right_away_after_idle_period(self):
+        calls = []
+        slider = Slider(SliderProps(on_change=calls.append, change_throttle=50))
+        self.addCleanup(slider.destroy)
+
+        slider.value = 1
+        run_loop(200)
+        slider.value = 2
+
+        self.assertEqual(calls, [1, 2])
+
+
+class TestSliderSmoothScroll(unittest.TestCase):
+    def test_accumulates_deltas_across_events(self):
+        slider = Slider(SliderProps(smooth_scroll=True))
+
+        slider.do_scroll_event(smooth_scroll_event(0, -0.4))
+        slider.do_scroll_event(smooth_scroll_event(0, -0.4))
+        self.assertEqual(slider.value, 0)
+
+        slider.do_scroll_event(smooth_scroll_event(0, -0.4))
+        self.assertEqual(slider.value, 1)
+
+    def test_scrolling_down_decreases_value(self):
+        slider = Slider(SliderProps(smooth_scroll=True, value=50))
+
+        for _ in range(4):
+            slider.do_scroll_event(smooth_scroll_event(0, 0.5))
+
+        self.assertEqual(slider.value, 48)
+
+    def test_disabling_drops_pending_deltas(self):
+        slider = Slider(SliderProps(smooth_scroll=True))
+        slider.do_scroll_event(smooth_scroll_event(0, -0.8))
+
+        slider.smooth_scroll = False
+        slider.smooth_scroll = True
+        slider.do_scroll_event(smooth_scroll_event(0, -0.4))
+
+        self.assertEqual(slider.value, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+
+from sora.widgets.label import Label, LabelProps
+from sora.widgets.stack import Stack, StackProps
+
+
+class TestStack(unittest.TestCase):
+    def test_instances_do_not_share_items(self):
+        a = Stack(StackProps(items={"a": Label(LabelProps(label="a"))}))
+        b = Stack(StackProps(items={"b": Label(LabelProps(label="b"))}))
+
+        self.assertEqual(list(a.items.keys()), ["a"])
+        self.assertEqual(list(b.items.keys()), ["b"])
+
+    def test_builds_page_when_shown(self):
+        built = []
+
+        def build():
+            built.append(1)
+            return Label(LabelProps(label="lazy"))
+
+        stack = Stack(
+            StackProps(
+                items={"first": Label(LabelProps(label="first")), "lazy": build},
+                visible_child_name="first",
+            )
+        )
+
+        self.assertFalse(built)
+
+        stack.set_visible_child_name("lazy")
+        stack.set_visible_child_name("first")
+        stack.set_visible_child_name("lazy")
+
+        self.assertEqual(built, [1])
+
+    def test_destroys_least_recently_shown_page(self):
+        stack = Stack(
+            StackProps(
+                items={
+                    "a": lambda: Label(LabelProps(label="a")),
+                    "b": lambda: Label(LabelProps(label="b")),
+                },
+                max_built_pages=1,
+            )
+        )
+
+        stack.set_visible_child_name("a")
+        stack.set_visible_child_name("b")
+
+        self.assertFalse(stack.get_child_by_name("a").get_children())
+        self.assertTrue(stack.get_child_by_name("b").get_children())
+
+
+if __name__ == "__main__":
+    unittest.main()